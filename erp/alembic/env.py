@@ -22,9 +22,17 @@ from src.database.supabase_client import Base
 # ✅ 여기에 모델 import 추가
 from src.database import models  # <-- 이 줄이 반드시 필요
 
+from src.database.partitions import is_partition_table_name
+
 # target_metadata 지정
 target_metadata = Base.metadata
 
+def include_object(object, name, type_, reflected, compare_to):
+    """autogenerate 비교 대상 필터 (파티션 자식 테이블은 모델에 없으므로 제외)"""
+    if type_ == "table" and reflected and is_partition_table_name(name):
+        return False
+    return True
+
 def run_migrations_offline() -> None:
     url = config.get_main_option("sqlalchemy.url")
     context.configure(
@@ -32,6 +40,7 @@ def run_migrations_offline() -> None:
         target_metadata=target_metadata,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
+        include_object=include_object,
     )
     with context.begin_transaction():
         context.run_migrations()
@@ -45,7 +54,8 @@ def run_migrations_online() -> None:
     with connectable.connect() as connection:
         context.configure(
             connection=connection,
-            target_metadata=target_metadata
+            target_metadata=target_metadata,
+            include_object=include_object
         )
         with context.begin_transaction():
             context.run_migrations()
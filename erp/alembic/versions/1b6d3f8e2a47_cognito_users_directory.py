@@ -0,0 +1,54 @@
+"""cognito_users directory table
+
+Cognito 사용자 풀을 주기적으로 동기화한 로컬 사용자 목록 테이블과 검색 인덱스를 추가합니다.
+(src/auth/user_directory.py 의 UserDirectory가 갱신)
+create_all로 이미 테이블을 만든 환경에서도 적용되도록 존재하면 건너뜁니다.
+
+Revision ID: 1b6d3f8e2a47
+Revises: a3d8e6f1c592
+Create Date: 2026-10-19 20:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '1b6d3f8e2a47'
+down_revision = 'a3d8e6f1c592'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'cognito_users',
+        sa.Column('username', sa.String(255), primary_key=True),
+        sa.Column('user_id', sa.String(255)),
+        sa.Column('email', sa.String(255)),
+        sa.Column('given_name', sa.String(255)),
+        sa.Column('family_name', sa.String(255)),
+        sa.Column('phone_number', sa.String(50)),
+        sa.Column('user_status', sa.String(50)),
+        sa.Column('enabled', sa.Boolean()),
+        sa.Column('attributes', sa.JSON()),
+        sa.Column('user_created_at', sa.DateTime(timezone=True)),
+        sa.Column('user_modified_at', sa.DateTime(timezone=True)),
+        sa.Column('synced_at', sa.DateTime(timezone=True), server_default=sa.func.now()),
+        if_not_exists=True,
+    )
+    op.create_index('ix_cognito_users_user_id', 'cognito_users', ['user_id'], if_not_exists=True)
+    op.create_index('ix_cognito_users_status', 'cognito_users', ['user_status', 'enabled'], if_not_exists=True)
+
+    # 대소문자 무시 접두어 검색(LIKE 'abc%')용 인덱스
+    op.execute(
+        'CREATE INDEX IF NOT EXISTS ix_cognito_users_username_lower '
+        'ON cognito_users (lower(username) text_pattern_ops)'
+    )
+    op.execute(
+        'CREATE INDEX IF NOT EXISTS ix_cognito_users_email_lower '
+        'ON cognito_users (lower(email) text_pattern_ops)'
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('cognito_users')
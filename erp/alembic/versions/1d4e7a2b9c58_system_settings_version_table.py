@@ -0,0 +1,43 @@
+"""system_settings version table
+
+설정 버전 카운터를 시퀀스에서 한 행짜리 테이블로 바꿉니다.
+시퀀스 증가는 커밋 전에 다른 세션에 보이므로 폴링 중인 SettingsCache가 새 버전과
+커밋 전의 이전 설정을 함께 읽고 이후 변경을 놓칠 수 있었습니다.
+테이블 갱신은 설정 변경과 같은 트랜잭션으로 커밋될 때에만 보입니다.
+
+Revision ID: 1d4e7a2b9c58
+Revises: 1b6d3f8e2a47
+Create Date: 2026-10-20 10:00:00.000000
+
+"""
+from alembic import op
+
+from src.database.models import SYSTEM_SETTINGS_NOTIFY_DDL, SYSTEM_SETTINGS_VERSION_TABLE
+
+# revision identifiers, used by Alembic.
+revision = '1d4e7a2b9c58'
+down_revision = '1b6d3f8e2a47'
+branch_labels = None
+depends_on = None
+
+SYSTEM_SETTINGS_VERSION_SEQ = "system_settings_version_seq"
+
+
+def upgrade() -> None:
+    for statement in SYSTEM_SETTINGS_NOTIFY_DDL:
+        op.execute(statement)
+    op.execute(f"DROP SEQUENCE IF EXISTS {SYSTEM_SETTINGS_VERSION_SEQ}")
+
+
+def downgrade() -> None:
+    op.execute(f"CREATE SEQUENCE IF NOT EXISTS {SYSTEM_SETTINGS_VERSION_SEQ}")
+    op.execute("""
+    CREATE OR REPLACE FUNCTION notify_system_settings_change() RETURNS trigger AS $$
+    BEGIN
+        PERFORM nextval('system_settings_version_seq');
+        PERFORM pg_notify('system_settings_changed', COALESCE(NEW.setting_key, OLD.setting_key));
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql
+    """)
+    op.execute(f"DROP TABLE IF EXISTS {SYSTEM_SETTINGS_VERSION_TABLE}")
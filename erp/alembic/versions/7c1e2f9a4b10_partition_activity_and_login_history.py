@@ -0,0 +1,79 @@
+"""partition user_activities and login_history by month
+
+user_activities(timestamp), login_history(login_time) 를 월별 RANGE 파티션 테이블로 전환합니다.
+기존 행은 가장 오래된 월부터 파티션을 만든 뒤 그대로 옮기며,
+이후 파티션 생성/만료는 src/scripts/maintain_partitions.py 가 담당합니다.
+init_db(create_all)로 이미 파티션 테이블을 만든 DB에서는 변환 없이 파티션만 확인합니다.
+
+Revision ID: 7c1e2f9a4b10
+Revises:
+Create Date: 2026-10-19 10:00:00.000000
+
+"""
+from alembic import op
+from sqlalchemy import text
+
+from src.database.partitions import PARTITIONED_TABLES, current_month, ensure_partitions
+
+# revision identifiers, used by Alembic.
+revision = '7c1e2f9a4b10'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def _is_partitioned(bind, table: str) -> bool:
+    return bind.execute(text("""
+        SELECT 1 FROM pg_partitioned_table
+        JOIN pg_class ON pg_class.oid = pg_partitioned_table.partrelid
+        WHERE pg_class.relname = :table
+    """), {'table': table}).first() is not None
+
+
+def _to_partitioned(table: str, column: str):
+    legacy = f"{table}_legacy"
+    bind = op.get_bind()
+
+    if _is_partitioned(bind, table):
+        ensure_partitions(bind, table)
+        return
+
+    op.execute(f'ALTER TABLE "{table}" RENAME TO "{legacy}"')
+    op.execute(f'ALTER TABLE "{legacy}" RENAME CONSTRAINT "{table}_pkey" TO "{legacy}_pkey"')
+    op.execute(f'UPDATE "{legacy}" SET "{column}" = now() WHERE "{column}" IS NULL')
+
+    # 파티션 키는 기본키에 포함되어야 하므로 (id, 파티션 키) 복합 기본키 사용
+    op.execute(f'CREATE TABLE "{table}" (LIKE "{legacy}" INCLUDING DEFAULTS) PARTITION BY RANGE ("{column}")')
+    op.execute(f'ALTER TABLE "{table}" ALTER COLUMN "{column}" SET NOT NULL')
+    op.execute(f'ALTER TABLE "{table}" ADD CONSTRAINT "{table}_pkey" PRIMARY KEY (id, "{column}")')
+
+    oldest = bind.execute(text(f'SELECT min("{column}") FROM "{legacy}"')).scalar()
+    ensure_partitions(bind, table, start_month=current_month(oldest) if oldest else None)
+
+    op.execute(f'INSERT INTO "{table}" SELECT * FROM "{legacy}"')
+    op.execute(f'DROP TABLE "{legacy}"')
+
+
+def _to_heap(table: str, column: str):
+    partitioned = f"{table}_partitioned"
+
+    op.execute(f'ALTER TABLE "{table}" RENAME TO "{partitioned}"')
+    op.execute(f'ALTER TABLE "{partitioned}" RENAME CONSTRAINT "{table}_pkey" TO "{partitioned}_pkey"')
+
+    op.execute(f'CREATE TABLE "{table}" (LIKE "{partitioned}" INCLUDING DEFAULTS)')
+    op.execute(f'ALTER TABLE "{table}" ALTER COLUMN "{column}" DROP NOT NULL')
+    op.execute(f'ALTER TABLE "{table}" ADD CONSTRAINT "{table}_pkey" PRIMARY KEY (id)')
+
+    op.execute(f'INSERT INTO "{table}" SELECT * FROM "{partitioned}"')
+    # 부모 테이블을 삭제하면 연결된 월/기본 파티션도 함께 삭제됨
+    op.execute(f'DROP TABLE "{partitioned}"')
+
+
+def upgrade() -> None:
+    for table, (column, _) in PARTITIONED_TABLES.items():
+        _to_partitioned(table, column)
+
+
+def downgrade() -> None:
+    for table, (column, _) in PARTITIONED_TABLES.items():
+        _to_heap(table, column)
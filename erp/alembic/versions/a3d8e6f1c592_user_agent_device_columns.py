@@ -0,0 +1,60 @@
+"""browser / os / device_type columns for sessions, login history and activities
+
+user_agent를 기록 시점에 분류한 값을 저장하고 기기 / OS / 브라우저별 집계 인덱스를 추가합니다.
+기존 행은 src/scripts/backfill_user_agents.py로 채웁니다.
+
+Revision ID: a3d8e6f1c592
+Revises: f7a2c6d3e815
+Create Date: 2026-10-19 18:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from src.database.partitions import create_partitioned_index
+
+# revision identifiers, used by Alembic.
+revision = 'a3d8e6f1c592'
+down_revision = 'f7a2c6d3e815'
+branch_labels = None
+depends_on = None
+
+TABLES = ['user_sessions', 'login_history', 'user_activities']
+
+# 파티션 테이블 인덱스 (테이블, 인덱스 이름)
+PARTITIONED_INDEXES = [
+    ('login_history', 'ix_login_history_device'),
+    ('user_activities', 'ix_user_activities_device'),
+]
+
+
+def upgrade() -> None:
+    # NULL 허용 컬럼 추가는 테이블 재작성 없이 카탈로그만 변경 (init_db로 이미 만든 컬럼은 건너뜀)
+    for table in TABLES:
+        op.add_column(table, sa.Column('browser', sa.String(length=50), nullable=True), if_not_exists=True)
+        op.add_column(table, sa.Column('os', sa.String(length=50), nullable=True), if_not_exists=True)
+        op.add_column(table, sa.Column('device_type', sa.String(length=20), nullable=True), if_not_exists=True)
+
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_user_sessions_device',
+            'user_sessions',
+            ['device_type', 'os', 'browser'],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        bind = op.get_bind()
+        for table, index_name in PARTITIONED_INDEXES:
+            create_partitioned_index(bind, table, index_name, 'device_type, os, browser')
+
+
+def downgrade() -> None:
+    op.drop_index('ix_user_sessions_device', table_name='user_sessions', if_exists=True)
+    # 부모 인덱스를 삭제하면 연결된 파티션 인덱스도 함께 삭제됨
+    for _, index_name in PARTITIONED_INDEXES:
+        op.execute(f'DROP INDEX IF EXISTS "{index_name}"')
+
+    for table in TABLES:
+        op.drop_column(table, 'device_type')
+        op.drop_column(table, 'os')
+        op.drop_column(table, 'browser')
@@ -0,0 +1,49 @@
+"""add user_sessions lookup and sweeper indexes
+
+사용자별 활성 세션 조회용 부분 커버링 인덱스와
+만료 세션 정리(SessionSweeper)용 부분 인덱스를 추가합니다.
+운영 중 테이블 잠금을 피하기 위해 CONCURRENTLY로 생성합니다.
+
+Revision ID: b4f2d81c6e35
+Revises: 7c1e2f9a4b10
+Create Date: 2026-10-19 11:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'b4f2d81c6e35'
+down_revision = '7c1e2f9a4b10'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY는 트랜잭션 블록 안에서 실행할 수 없음
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_user_sessions_user_active',
+            'user_sessions',
+            ['user_id', 'expires_at'],
+            postgresql_where=sa.text('is_active IS true'),
+            postgresql_include=['session_id'],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            'ix_user_sessions_active_expires',
+            'user_sessions',
+            ['expires_at'],
+            postgresql_where=sa.text('is_active IS true'),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_user_sessions_active_expires', table_name='user_sessions',
+                      postgresql_concurrently=True, if_exists=True)
+        op.drop_index('ix_user_sessions_user_active', table_name='user_sessions',
+                      postgresql_concurrently=True, if_exists=True)
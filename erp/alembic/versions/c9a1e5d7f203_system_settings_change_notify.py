@@ -0,0 +1,51 @@
+"""system_settings change notification trigger
+
+system_settings 변경 시 버전 시퀀스를 증가시키고 pg_notify로 변경된 키를 알리는
+트리거를 추가합니다. (SettingsCache 무효화용)
+
+Revision ID: c9a1e5d7f203
+Revises: b4f2d81c6e35
+Create Date: 2026-10-19 12:00:00.000000
+
+"""
+from alembic import op
+
+# 이 리비전 시점의 DDL (이후 버전 카운터는 1d4e7a2b9c58에서 테이블로 바뀜)
+SYSTEM_SETTINGS_CHANNEL = "system_settings_changed"
+SYSTEM_SETTINGS_VERSION_SEQ = "system_settings_version_seq"
+
+SYSTEM_SETTINGS_NOTIFY_DDL = [
+    f"CREATE SEQUENCE IF NOT EXISTS {SYSTEM_SETTINGS_VERSION_SEQ}",
+    f"""
+    CREATE OR REPLACE FUNCTION notify_system_settings_change() RETURNS trigger AS $$
+    BEGIN
+        PERFORM nextval('{SYSTEM_SETTINGS_VERSION_SEQ}');
+        PERFORM pg_notify('{SYSTEM_SETTINGS_CHANNEL}', COALESCE(NEW.setting_key, OLD.setting_key));
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql
+    """,
+    "DROP TRIGGER IF EXISTS system_settings_notify ON system_settings",
+    """
+    CREATE TRIGGER system_settings_notify
+    AFTER INSERT OR UPDATE OR DELETE ON system_settings
+    FOR EACH ROW EXECUTE FUNCTION notify_system_settings_change()
+    """,
+]
+
+# revision identifiers, used by Alembic.
+revision = 'c9a1e5d7f203'
+down_revision = 'b4f2d81c6e35'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    for statement in SYSTEM_SETTINGS_NOTIFY_DDL:
+        op.execute(statement)
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS system_settings_notify ON system_settings")
+    op.execute("DROP FUNCTION IF EXISTS notify_system_settings_change()")
+    op.execute(f"DROP SEQUENCE IF EXISTS {SYSTEM_SETTINGS_VERSION_SEQ}")
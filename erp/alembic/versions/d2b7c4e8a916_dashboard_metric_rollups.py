@@ -0,0 +1,69 @@
+"""dashboard metric rollup tables
+
+대시보드 지표용 시간/일 롤업, 일별 방문자 집합, 롤업 워터마크 테이블을 추가합니다.
+(src/database/rollups.py 의 RollupJob이 증분 갱신)
+
+Revision ID: d2b7c4e8a916
+Revises: c9a1e5d7f203
+Create Date: 2026-10-19 13:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'd2b7c4e8a916'
+down_revision = 'c9a1e5d7f203'
+branch_labels = None
+depends_on = None
+
+
+def _counter_columns():
+    return [
+        sa.Column('logins', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('login_failures', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('page_views', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('activities', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('response_ms_sum', sa.Float(), nullable=False, server_default='0'),
+        sa.Column('response_count', sa.Integer(), nullable=False, server_default='0'),
+    ]
+
+
+def upgrade() -> None:
+    op.create_table(
+        'metrics_hourly',
+        sa.Column('bucket_start', sa.DateTime(timezone=True), primary_key=True),
+        *_counter_columns(),
+        sa.Column('active_sessions', sa.Integer()),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.func.now()),
+        if_not_exists=True,
+    )
+    op.create_table(
+        'metrics_daily',
+        sa.Column('day', sa.Date(), primary_key=True),
+        *_counter_columns(),
+        sa.Column('unique_visitors', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('total_users', sa.Integer()),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.func.now()),
+        if_not_exists=True,
+    )
+    op.create_table(
+        'metrics_daily_visitors',
+        sa.Column('day', sa.Date(), primary_key=True),
+        sa.Column('user_id', sa.String(255), primary_key=True),
+        if_not_exists=True,
+    )
+    op.create_table(
+        'rollup_watermarks',
+        sa.Column('name', sa.String(100), primary_key=True),
+        sa.Column('watermark', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.func.now()),
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('rollup_watermarks')
+    op.drop_table('metrics_daily_visitors')
+    op.drop_table('metrics_daily')
+    op.drop_table('metrics_hourly')
@@ -0,0 +1,42 @@
+"""keyset pagination indexes for login_history and user_activities
+
+이력 조회 화면의 (시간, id) keyset 페이지네이션용 복합 인덱스를 추가합니다.
+파티션 테이블이므로 부모에는 ON ONLY로 만들고 파티션별로 CONCURRENTLY 생성 후 연결합니다.
+
+Revision ID: e5f3a9c1b724
+Revises: d2b7c4e8a916
+Create Date: 2026-10-19 14:00:00.000000
+
+"""
+from alembic import op
+
+from src.database.partitions import create_partitioned_index
+
+# revision identifiers, used by Alembic.
+revision = 'e5f3a9c1b724'
+down_revision = 'd2b7c4e8a916'
+branch_labels = None
+depends_on = None
+
+# (테이블, 인덱스 이름, 컬럼, 부분 인덱스 조건)
+INDEXES = [
+    ('login_history', 'ix_login_history_time_id', 'login_time, id', None),
+    ('login_history', 'ix_login_history_user_time_id', 'user_id, login_time, id', None),
+    ('login_history', 'ix_login_history_failed_time_id', 'login_time, id', 'NOT success'),
+    ('user_activities', 'ix_user_activities_time_id', '"timestamp", id', None),
+    ('user_activities', 'ix_user_activities_user_time_id', 'user_id, "timestamp", id', None),
+    ('user_activities', 'ix_user_activities_type_time_id', 'activity_type, "timestamp", id', None),
+]
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        bind = op.get_bind()
+        for table, index_name, columns, where in INDEXES:
+            create_partitioned_index(bind, table, index_name, columns, where)
+
+
+def downgrade() -> None:
+    # 부모 인덱스를 삭제하면 연결된 파티션 인덱스도 함께 삭제됨
+    for _, index_name, _, _ in INDEXES:
+        op.execute(f'DROP INDEX IF EXISTS "{index_name}"')
@@ -0,0 +1,53 @@
+"""convert JSON columns to JSONB with GIN indexes
+
+user_activities.activity_detail, user_sessions.user_attributes, system_settings.setting_value 를
+JSONB로 바꾸고 @> 포함 검색용 GIN(jsonb_path_ops) 인덱스를 추가합니다.
+(컬럼 타입 변경은 테이블을 다시 쓰므로 사용량이 적은 시간에 실행)
+
+Revision ID: f7a2c6d3e815
+Revises: e5f3a9c1b724
+Create Date: 2026-10-19 15:00:00.000000
+
+"""
+from alembic import op
+
+from src.database.partitions import create_partitioned_index
+
+# revision identifiers, used by Alembic.
+revision = 'f7a2c6d3e815'
+down_revision = 'e5f3a9c1b724'
+branch_labels = None
+depends_on = None
+
+# (테이블, 컬럼, GIN 인덱스 이름)
+JSON_COLUMNS = [
+    ('user_activities', 'activity_detail', 'ix_user_activities_detail_gin'),
+    ('user_sessions', 'user_attributes', 'ix_user_sessions_attributes_gin'),
+    ('system_settings', 'setting_value', 'ix_system_settings_value_gin'),
+]
+
+
+def upgrade() -> None:
+    for table, column, _ in JSON_COLUMNS:
+        op.execute(f'ALTER TABLE "{table}" ALTER COLUMN "{column}" TYPE jsonb USING "{column}"::jsonb')
+
+    with op.get_context().autocommit_block():
+        bind = op.get_bind()
+        for table, column, index_name in JSON_COLUMNS:
+            if table == 'user_activities':
+                # 파티션 테이블: 파티션별 CONCURRENTLY 생성 후 부모 인덱스에 연결
+                create_partitioned_index(bind, table, index_name, f'"{column}" jsonb_path_ops', using='gin')
+            else:
+                op.create_index(
+                    index_name, table, [column],
+                    postgresql_using='gin',
+                    postgresql_ops={column: 'jsonb_path_ops'},
+                    postgresql_concurrently=True,
+                    if_not_exists=True,
+                )
+
+
+def downgrade() -> None:
+    for table, column, index_name in JSON_COLUMNS:
+        op.execute(f'DROP INDEX IF EXISTS "{index_name}"')
+        op.execute(f'ALTER TABLE "{table}" ALTER COLUMN "{column}" TYPE json USING "{column}"::json')
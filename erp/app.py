@@ -1,8 +1,14 @@
 import streamlit as st
+from datetime import datetime
+from streamlit.runtime.scriptrunner import get_script_run_ctx
 from src.utils.config import load_app_config
 from src.utils.session import SessionManager
 from src.auth.cognito_auth import CognitoAuth
-from src.pages import login, dashboard
+from src.utils.metrics_registry import get_registry
+from src.utils.profiling import TIMING_PREFIX, begin_rerun, get_rerun_timings, timed
+from src.utils.tracing import get_tracer
+from src.utils.warmup import start_warm_up
+from src.pages import login
 
 # 페이지 설정
 st.set_page_config(
@@ -37,8 +43,114 @@ def show_session_restoration_info():
     </div>
     """, unsafe_allow_html=True)
 
+def show_pool_metrics():
+    """DB 커넥션 풀 메트릭 표시 (디버그 사이드바)"""
+    from src.database.supabase_client import engine
+    
+    if engine is None:
+        return
+    
+    registry = get_registry()
+    snapshot = registry.snapshot('db.pool.sync.')
+    
+    st.sidebar.markdown("### 🗄️ DB 커넥션 풀")
+    
+    col1, col2 = st.sidebar.columns(2)
+    with col1:
+        st.metric(
+            "사용 중 / 풀 크기",
+            f"{snapshot['db.pool.sync.checked_out']['value']} / {snapshot['db.pool.sync.size']['value']}"
+        )
+        st.metric(
+            "overflow (최대)",
+            f"{int(snapshot['db.pool.sync.overflow']['value'])} ({int(snapshot['db.pool.sync.overflow']['max'])})"
+        )
+    with col2:
+        wait = snapshot['db.pool.sync.checkout_wait_ms']
+        st.metric("대기 p95", f"{wait.get('p95', 0):.1f}ms")
+        st.metric("pre-ping 실패", snapshot['db.pool.sync.pre_ping_failures']['value'])
+    
+    with st.sidebar.expander("📋 전체 풀 메트릭", expanded=False):
+        st.json(registry.snapshot('db.pool.'))
+    
+    st.sidebar.download_button(
+        "📥 메트릭 내보내기 (JSON)",
+        registry.export_json(),
+        file_name=f"metrics_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
+        mime="application/json"
+    )
+
+def show_render_timings():
+    """구간별 렌더링 시간 표시 (디버그 사이드바)"""
+    registry = get_registry()
+    timings = get_rerun_timings()
+    snapshot = registry.snapshot(TIMING_PREFIX)
+    
+    st.sidebar.markdown("### ⏱️ 렌더링 시간")
+    
+    if not timings:
+        st.sidebar.caption("이번 실행에서 측정된 구간이 없습니다.")
+        return
+    
+    rows = []
+    for section, elapsed_ms in sorted(timings.items(), key=lambda item: item[1], reverse=True):
+        stats = snapshot.get(f'{TIMING_PREFIX}{section}', {})
+        rows.append({
+            "구간": section,
+            "이번(ms)": round(elapsed_ms, 1),
+            "p50(ms)": stats.get('p50'),
+            "p95(ms)": stats.get('p95'),
+            "횟수": stats.get('count'),
+        })
+    st.sidebar.dataframe(rows, hide_index=True, width='stretch')
+    
+    st.sidebar.download_button(
+        "📥 렌더링 시간 내보내기 (JSON)",
+        registry.export_json(TIMING_PREFIX),
+        file_name=f"render_timings_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
+        mime="application/json"
+    )
+
+def show_recent_traces():
+    """최근 내보낸 rerun trace 요약 (디버그 사이드바)"""
+    exporter = get_tracer().exporter
+    traces = exporter.traces()
+    
+    st.sidebar.markdown("### 🧵 최근 trace")
+    st.sidebar.caption(f"보관 중 {len(traces)}건 (샘플링 또는 느린 rerun만 기록)")
+    
+    if not traces:
+        return
+    
+    rows = []
+    for spans in reversed(traces[-10:]):
+        root = next((span for span in spans if span['parent_id'] is None), spans[-1])
+        slowest = max((span for span in spans if span is not root), key=lambda span: span['duration_ms'], default=None)
+        rows.append({
+            "시각": datetime.fromtimestamp(root['start_time']).strftime('%H:%M:%S'),
+            "전체(ms)": round(root['duration_ms'], 1),
+            "구간 수": len(spans),
+            "가장 느린 구간": f"{slowest['name']} ({slowest['duration_ms']:.1f}ms)" if slowest else "-",
+        })
+    st.sidebar.dataframe(rows, hide_index=True, width='stretch')
+    
+    st.sidebar.download_button(
+        "📥 trace 내보내기 (JSONL)",
+        exporter.export_jsonl(),
+        file_name=f"traces_{datetime.now().strftime('%Y%m%d_%H%M%S')}.jsonl",
+        mime="application/x-ndjson"
+    )
+
 def main():
-    """메인 애플리케이션 함수"""
+    """메인 애플리케이션 함수 (rerun 한 번을 하나의 trace로 기록)"""
+    # 페이지는 하위 구간 이름(page.<이름>)으로 구분되므로 루트에는 세션만 기록
+    ctx = get_script_run_ctx()
+    with get_tracer().trace('rerun', session_id=ctx.session_id if ctx else None):
+        run_app()
+
+def run_app():
+    """화면 렌더링 (인증 확인 / 라우팅)"""
+    begin_rerun()
     
     # 세션 복원 정보 표시 (개발/테스트용)
     if st.sidebar.checkbox("🔧 개발자 정보 표시", value=False):
@@ -53,7 +165,8 @@ def main():
         session_status = auth.get_session_status()
         
         # 디버그 정보 (사이드바)
-        if st.sidebar.checkbox("🐛 디버그 정보", value=False):
+        show_debug = st.sidebar.checkbox("🐛 디버그 정보", value=False)
+        if show_debug:
             st.sidebar.markdown("### 🔍 세션 디버그 정보")
             st.sidebar.json(session_status)
             
@@ -77,14 +190,28 @@ def main():
                 auth.session_mgr.clear_auth_data()
                 st.sidebar.success("✅ 세션 클리어됨")
                 st.rerun()
+            
+            # DB 커넥션 풀 상태
+            show_pool_metrics()
         
         # 라우팅
         if session_status['is_authenticated'] and session_status['session_valid']:
             # 세션 자동 연장 체크
             auth.extend_session_if_needed()
             
-            # 대시보드 표시
-            dashboard.show_page(auth)
+            # 선택된 기능 페이지 또는 대시보드 표시
+            # (페이지 모듈은 해당 경로에서만 import하여 로그인 화면이 차트 / pandas 로딩을 기다리지 않음)
+            current_page = st.session_state.get('current_page', 'dashboard')
+            with timed(f'page.{current_page}'):
+                if current_page == 'user_directory':
+                    from src.pages import user_directory
+                    user_directory.show_page(auth)
+                elif current_page == 'history_browser':
+                    from src.pages import history_browser
+                    history_browser.show_page(auth)
+                else:
+                    from src.pages import dashboard
+                    dashboard.show_page(auth)
         else:
             # 만료된 세션이 있으면 클리어
             if session_status['is_authenticated'] and not session_status['session_valid']:
@@ -93,7 +220,11 @@ def main():
                 st.rerun()
             
             # 로그인 페이지 표시
-            login.show_page(auth)
+            with timed('page.login'):
+                login.show_page(auth)
+        
+        # 무거운 싱글턴 / 백그라운드 작업 / 로그인 이후 모듈을 백그라운드에서 준비 (프로세스당 한 번, 화면 렌더링 후)
+        start_warm_up(config['aws']['region'])
         
         # 하단에 버전 정보
         st.markdown("---")
@@ -106,6 +237,11 @@ def main():
                 ⚡ Streamlit {streamlit_version}
             </div>
             """.format(streamlit_version=st.__version__), unsafe_allow_html=True)
+        
+        # 구간별 렌더링 시간 (페이지 렌더링이 끝난 뒤 표시해야 이번 실행 값이 모두 포함됨)
+        if show_debug:
+            show_render_timings()
+            show_recent_traces()
     
     except Exception as e:
         st.error("애플리케이션 초기화 중 오류가 발생했습니다.")
@@ -126,93 +262,5 @@ def main():
                     del st.session_state[key]
                 st.success("세션이 초기화되었습니다. 페이지를 새로고침하세요.")
 
-def add_session_restore_script():
-    """세션 복원 스크립트 추가"""
-    script = """
-    <script>
-    console.log('🔄 Streamlit 세션 복원 스크립트 로드됨');
-    
-    // 세션 데이터 복원 함수
-    function restoreSessionData() {
-        try {
-            const sessionData = sessionStorage.getItem('streamlit_auth_session');
-            if (sessionData) {
-                const data = JSON.parse(sessionData);
-                const now = new Date().getTime();
-                
-                if (data.expires_at && now < data.expires_at) {
-                    console.log('✅ 유효한 세션 데이터 발견, 복원 중...');
-                    
-                    // Streamlit에 메시지 전송
-                    window.parent.postMessage({
-                        type: 'streamlit_session_restore',
-                        data: data
-                    }, '*');
-                    
-                    return true;
-                } else {
-                    console.log('⏰ 만료된 세션 데이터 삭제');
-                    sessionStorage.removeItem('streamlit_auth_session');
-                }
-            }
-        } catch (error) {
-            console.error('❌ 세션 복원 중 오류:', error);
-            sessionStorage.removeItem('streamlit_auth_session');
-        }
-        return false;
-    }
-    
-    // 페이지 로드 시 세션 복원 시도
-    document.addEventListener('DOMContentLoaded', function() {
-        setTimeout(restoreSessionData, 100);
-    });
-    
-    // 이미 로드된 경우 즉시 실행
-    if (document.readyState === 'complete') {
-        setTimeout(restoreSessionData, 100);
-    }
-    
-    // 세션 저장/삭제 메시지 리스너
-    window.addEventListener('message', function(event) {
-        if (event.data.type === 'save_session') {
-            try {
-                sessionStorage.setItem('streamlit_auth_session', JSON.stringify(event.data.data));
-                console.log('💾 세션 데이터 저장됨');
-            } catch (error) {
-                console.error('❌ 세션 저장 실패:', error);
-            }
-        } else if (event.data.type === 'clear_session') {
-            try {
-                sessionStorage.removeItem('streamlit_auth_session');
-                console.log('🗑️ 세션 데이터 삭제됨');
-            } catch (error) {
-                console.error('❌ 세션 삭제 실패:', error);
-            }
-        }
-    });
-    
-    // 주기적 세션 체크 (5분마다)
-    setInterval(function() {
-        const sessionData = sessionStorage.getItem('streamlit_auth_session');
-        if (sessionData) {
-            try {
-                const data = JSON.parse(sessionData);
-                const now = new Date().getTime();
-                
-                if (data.expires_at && now >= data.expires_at) {
-                    console.log('⏰ 세션 만료로 인한 자동 삭제');
-                    sessionStorage.removeItem('streamlit_auth_session');
-                }
-            } catch (error) {
-                console.error('❌ 세션 체크 오류:', error);
-            }
-        }
-    }, 5 * 60 * 1000); // 5분
-    
-    </script>
-    """
-    
-    st.components.v1.html(script, height=0)
-
 if __name__ == "__main__":
     main()
\ No newline at end of file
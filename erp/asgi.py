@@ -0,0 +1,51 @@
+"""여러 인스턴스 배포용 ASGI 진입점
+
+Streamlit 앱에 로드 밸런서용 상태 확인 경로를 추가합니다.
+    - /healthz: 프로세스 생존 여부 (liveness)
+    - /readyz: DB / Redis 연결까지 확인한 준비 여부 (readiness, 실패 시 503)
+
+서버 시작 시 무거운 싱글턴과 로그인 이후 모듈을 백그라운드에서 미리 준비하므로
+첫 세션도 준비 작업을 기다리지 않습니다.
+
+실행 예시 (erp 디렉터리에서):
+    uvicorn asgi:app --host 0.0.0.0 --port 8501
+"""
+import os
+from contextlib import asynccontextmanager
+
+import streamlit as st
+from dotenv import load_dotenv
+from starlette.concurrency import run_in_threadpool
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+
+from src.utils.health import liveness, readiness
+from src.utils.warmup import start_warm_up
+
+
+@asynccontextmanager
+async def lifespan(app):
+    load_dotenv()
+    start_warm_up(os.getenv("AWS_REGION", "ap-northeast-2"))
+    yield
+
+
+async def healthz(request: Request) -> JSONResponse:
+    return JSONResponse(liveness())
+
+
+async def readyz(request: Request) -> JSONResponse:
+    # DB / Redis 확인은 블로킹 호출이므로 이벤트 루프 밖에서 실행
+    result = await run_in_threadpool(readiness)
+    return JSONResponse(result, status_code=200 if result['status'] == 'ok' else 503)
+
+
+app = st.App(
+    "app.py",
+    lifespan=lifespan,
+    routes=[
+        Route("/healthz", healthz, methods=["GET"]),
+        Route("/readyz", readyz, methods=["GET"]),
+    ],
+)
@@ -0,0 +1,209 @@
+"""로그인 → 대시보드 지연 시간 벤치마크
+
+Cognito를 로컬 대역(CognitoStub)으로 바꾸고 Streamlit AppTest로 app.py를 구동하여
+세션 수(기본 1, 10, 100)별로 다음을 측정합니다.
+
+- 첫 화면(로그인 폼) 렌더링 시간
+- 로그인 제출 → 대시보드 렌더링 시간
+- 대시보드 재실행(rerun) 지연 시간과 rerun당 Cognito 호출 수
+- 세션당 메모리 사용량 (tracemalloc 기준)
+
+AppTest는 스레드 안전하지 않으므로 세션들은 라운드 로빈으로 번갈아 실행됩니다.
+(동시에 살아 있는 N개 세션의 상태/캐시/메모리를 재현하며, CPU 병렬성은 재현하지 않음)
+
+실행 예시 (erp 디렉터리에서):
+    python -m benchmarks.bench_login_dashboard --sessions 1 10 100 --output bench.json
+    python -m benchmarks.bench_login_dashboard --baseline bench.json --max-regression 0.2
+"""
+import argparse
+import gc
+import json
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+from typing import Any, Dict, List
+from unittest import mock
+
+from benchmarks.cognito_stub import CognitoStub
+
+APP_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app.py")
+
+
+def _percentiles(values: List[float]) -> Dict[str, float]:
+    if not values:
+        return {'p50': 0.0, 'p95': 0.0, 'max': 0.0, 'mean': 0.0}
+
+    ordered = sorted(values)
+    return {
+        'p50': round(statistics.median(ordered), 2),
+        'p95': round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))], 2),
+        'max': round(ordered[-1], 2),
+        'mean': round(statistics.fmean(ordered), 2),
+    }
+
+
+def _timed_run(app, stub: CognitoStub, action=None):
+    """AppTest 한 번 실행 → (경과 ms, Cognito 호출 수)"""
+    calls_before = stub.total_calls()
+    started = time.perf_counter()
+
+    if action is None:
+        app.run()
+    else:
+        action(app).run()
+
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    if app.exception:
+        raise RuntimeError(f"앱 실행 중 예외 발생: {app.exception[0].message}")
+
+    return elapsed_ms, stub.total_calls() - calls_before
+
+
+def _submit_login(username: str, password: str):
+    def action(app):
+        next(w for w in app.text_input if w.label == "사용자명").input(username)
+        next(w for w in app.text_input if w.label == "비밀번호").input(password)
+        return next(b for b in app.button if b.label == "🚀 로그인").click()
+    return action
+
+
+def run_scenario(session_count: int, reruns: int, stub: CognitoStub) -> Dict[str, Any]:
+    """세션 N개로 로그인 후 대시보드 재실행 측정"""
+    from streamlit.testing.v1 import AppTest
+
+    gc.collect()
+    memory_before, _ = tracemalloc.get_traced_memory()
+
+    apps = [AppTest.from_file(APP_PATH, default_timeout=60) for _ in range(session_count)]
+
+    first_render, login_latency, login_calls = [], [], []
+    for app in apps:
+        elapsed_ms, _ = _timed_run(app, stub)
+        first_render.append(elapsed_ms)
+
+    for index, app in enumerate(apps):
+        elapsed_ms, calls = _timed_run(app, stub, _submit_login(f"bench_user_{index}", stub.password))
+        if not app.session_state['authenticated']:
+            raise RuntimeError("로그인에 실패했습니다. 대시보드가 렌더링되지 않았습니다.")
+        login_latency.append(elapsed_ms)
+        login_calls.append(calls)
+
+    rerun_latency, rerun_calls = [], []
+    for _ in range(reruns):
+        for app in apps:
+            elapsed_ms, calls = _timed_run(app, stub)
+            rerun_latency.append(elapsed_ms)
+            rerun_calls.append(calls)
+
+    gc.collect()
+    memory_after, _ = tracemalloc.get_traced_memory()
+    memory_per_session_kb = (memory_after - memory_before) / 1024 / session_count
+
+    # 다음 시나리오 측정에 영향을 주지 않도록 세션 해제
+    del apps
+    gc.collect()
+
+    return {
+        'sessions': session_count,
+        'first_render_ms': _percentiles(first_render),
+        'login_to_dashboard_ms': _percentiles(login_latency),
+        'dashboard_rerun_ms': _percentiles(rerun_latency),
+        'cognito_calls_per_login': round(statistics.fmean(login_calls), 2),
+        'cognito_calls_per_rerun': round(statistics.fmean(rerun_calls), 2) if rerun_calls else 0.0,
+        'memory_per_session_kb': round(memory_per_session_kb, 1),
+    }
+
+
+def compare_with_baseline(results: List[Dict[str, Any]], baseline_path: str, max_regression: float) -> List[str]:
+    """기준 결과 대비 회귀 항목 목록 반환"""
+    with open(baseline_path, 'r', encoding='utf-8') as f:
+        baseline = {item['sessions']: item for item in json.load(f)['results']}
+
+    regressions = []
+    for result in results:
+        base = baseline.get(result['sessions'])
+        if not base:
+            continue
+
+        for metric in ('login_to_dashboard_ms', 'dashboard_rerun_ms'):
+            before, after = base[metric]['p95'], result[metric]['p95']
+            if before and after > before * (1 + max_regression):
+                regressions.append(f"[{result['sessions']} 세션] {metric} p95 {before:.1f} → {after:.1f} ms")
+
+        for metric in ('cognito_calls_per_rerun', 'memory_per_session_kb'):
+            before, after = base[metric], result[metric]
+            if before and after > before * (1 + max_regression):
+                regressions.append(f"[{result['sessions']} 세션] {metric} {before} → {after}")
+
+    return regressions
+
+
+def _print_table(results: List[Dict[str, Any]]):
+    header = f"{'세션':>6} | {'첫 화면 p50':>11} | {'로그인 p50/p95':>16} | {'rerun p50/p95':>16} | {'Cognito/rerun':>13} | {'KB/세션':>9}"
+    print(header)
+    print('-' * len(header))
+    for r in results:
+        print(
+            f"{r['sessions']:>6} | {r['first_render_ms']['p50']:>11.1f} | "
+            f"{r['login_to_dashboard_ms']['p50']:>7.1f}/{r['login_to_dashboard_ms']['p95']:>8.1f} | "
+            f"{r['dashboard_rerun_ms']['p50']:>7.1f}/{r['dashboard_rerun_ms']['p95']:>8.1f} | "
+            f"{r['cognito_calls_per_rerun']:>13.2f} | {r['memory_per_session_kb']:>9.1f}"
+        )
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="로그인 → 대시보드 지연 시간 벤치마크")
+    parser.add_argument('--sessions', type=int, nargs='+', default=[1, 10, 100], help="동시 세션 수 목록")
+    parser.add_argument('--reruns', type=int, default=5, help="세션별 대시보드 재실행 횟수")
+    parser.add_argument('--latency-ms', type=float, default=30.0, help="Cognito 대역의 호출당 지연(ms)")
+    parser.add_argument('--output', help="결과 JSON 저장 경로")
+    parser.add_argument('--baseline', help="비교할 기준 결과 JSON 경로")
+    parser.add_argument('--max-regression', type=float, default=0.2, help="허용 회귀 비율 (0.2 = 20%%)")
+    args = parser.parse_args(argv)
+
+    # 앱 설정에 필요한 환경변수 (실제 AWS/DB에는 접속하지 않음)
+    os.environ.setdefault('AWS_COGNITO_CLIENT_ID', 'bench-client-id')
+    os.environ.setdefault('AWS_COGNITO_USER_POOL_ID', 'ap-northeast-2_bench')
+    os.environ['DATABASE_URL'] = ''
+
+    # 경고 로그가 결과 출력을 가리지 않도록 함
+    from streamlit.logger import set_log_level
+    set_log_level('error')
+
+    stub = CognitoStub(latency_ms=args.latency_ms)
+    tracemalloc.start()
+
+    results = []
+    with mock.patch('boto3.client', return_value=stub):
+        # 모듈 import 및 캐시 초기화 비용이 첫 시나리오에 섞이지 않도록 예열
+        run_scenario(1, 1, stub)
+        stub.calls.clear()
+
+        for session_count in args.sessions:
+            results.append(run_scenario(session_count, args.reruns, stub))
+
+    tracemalloc.stop()
+
+    _print_table(results)
+    print(f"\nCognito 호출 합계: {dict(stub.calls)}")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump({'results': results, 'latency_ms': args.latency_ms}, f, ensure_ascii=False, indent=2)
+
+    if args.baseline:
+        regressions = compare_with_baseline(results, args.baseline, args.max_regression)
+        if regressions:
+            print("\n⚠️ 성능 회귀 감지:")
+            for line in regressions:
+                print(f"  - {line}")
+            return 1
+        print("\n✅ 기준 대비 회귀 없음")
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,211 @@
+"""인스턴스 수별 처리량 부하 테스트
+
+asgi.py를 인스턴스 수(기본 1, 2, 4)만큼 로컬 포트에 띄우고, 동시 세션들이 Streamlit 웹소켓으로
+rerun을 반복 요청하여 초당 완료된 rerun 수와 지연 시간을 측정합니다.
+세션은 연결 단위로 인스턴스에 라운드 로빈 분배됩니다 (리버스 프록시의 연결 분배와 동일).
+
+처리량이 인스턴스 수에 비례해 늘어나는지(효율 = 증가 배수 / 인스턴스 수)를 확인하며,
+인스턴스 수가 CPU 코어 수보다 많으면 코어가 병목이 되므로 선형 증가를 기대할 수 없습니다.
+
+실행 예시 (erp 디렉터리에서):
+    python -m benchmarks.bench_replicas --replicas 1 2 4 --sessions 32 --duration 20
+    python -m benchmarks.bench_replicas --target http://localhost:8080 --sessions 32   # 프록시 경유 (deploy/)
+"""
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from typing import Any, Dict, List, Optional
+
+import httpx
+
+ERP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _percentiles(values: List[float]) -> Dict[str, float]:
+    if not values:
+        return {'p50': 0.0, 'p95': 0.0, 'max': 0.0}
+
+    ordered = sorted(values)
+    return {
+        'p50': round(statistics.median(ordered), 2),
+        'p95': round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))], 2),
+        'max': round(ordered[-1], 2),
+    }
+
+
+def start_replicas(count: int, base_port: int) -> List[subprocess.Popen]:
+    """asgi 앱 인스턴스 count개를 base_port부터 순서대로 실행"""
+    processes = []
+    for index in range(count):
+        env = dict(os.environ, REPLICA_ID=f"bench-{index}")
+        processes.append(subprocess.Popen(
+            [sys.executable, '-m', 'uvicorn', 'asgi:app', '--port', str(base_port + index), '--log-level', 'warning'],
+            cwd=ERP_DIR,
+            env=env,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        ))
+    return processes
+
+
+def stop_replicas(processes: List[subprocess.Popen]):
+    for process in processes:
+        process.terminate()
+    for process in processes:
+        try:
+            process.wait(10)
+        except subprocess.TimeoutExpired:
+            process.kill()
+
+
+def wait_until_ready(urls: List[str], timeout: float = 60.0):
+    """모든 인스턴스의 /readyz가 200을 반환할 때까지 대기"""
+    deadline = time.monotonic() + timeout
+    pending = list(urls)
+    while pending:
+        if time.monotonic() > deadline:
+            raise RuntimeError(f"인스턴스가 준비되지 않았습니다: {pending}")
+        try:
+            if httpx.get(f"{pending[0]}/readyz", timeout=2).status_code == 200:
+                pending.pop(0)
+                continue
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.5)
+
+
+async def _session_loop(url: str, deadline: float, latencies: List[float], errors: List[str]):
+    """웹소켓 세션 하나로 deadline까지 rerun 반복 요청"""
+    from streamlit.proto.BackMsg_pb2 import BackMsg
+    from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+    from websockets.asyncio.client import connect
+
+    stream_url = url.replace('http', 'ws', 1) + '/_stcore/stream'
+    try:
+        async with connect(stream_url, subprotocols=['streamlit'], max_size=None) as websocket:
+            while time.monotonic() < deadline:
+                message = BackMsg()
+                message.rerun_script.query_string = ''
+                message.rerun_script.page_script_hash = ''
+
+                started = time.perf_counter()
+                await websocket.send(message.SerializeToString())
+
+                while True:
+                    forward = ForwardMsg()
+                    forward.ParseFromString(await websocket.recv())
+                    if forward.WhichOneof('type') == 'script_finished':
+                        break
+
+                latencies.append((time.perf_counter() - started) * 1000)
+    except Exception as e:
+        errors.append(f"{type(e).__name__}: {e}")
+
+
+async def _run_load(urls: List[str], sessions: int, duration: float) -> Dict[str, Any]:
+    latencies: List[float] = []
+    errors: List[str] = []
+    deadline = time.monotonic() + duration
+
+    started = time.perf_counter()
+    await asyncio.gather(*(
+        _session_loop(urls[index % len(urls)], deadline, latencies, errors) for index in range(sessions)
+    ))
+    elapsed = time.perf_counter() - started
+
+    return {
+        'reruns': len(latencies),
+        'reruns_per_second': round(len(latencies) / elapsed, 2),
+        'rerun_ms': _percentiles(latencies),
+        'errors': len(errors),
+        'error_samples': errors[:3],
+    }
+
+
+def run_scenario(urls: List[str], sessions: int, duration: float, warmup: float) -> Dict[str, Any]:
+    """예열 후 부하 측정"""
+    if warmup > 0:
+        asyncio.run(_run_load(urls, min(sessions, len(urls)), warmup))
+    return asyncio.run(_run_load(urls, sessions, duration))
+
+
+def _print_table(results: List[Dict[str, Any]]):
+    header = f"{'인스턴스':>8} | {'rerun/s':>9} | {'p50/p95(ms)':>16} | {'증가 배수':>9} | {'효율':>6} | {'오류':>4}"
+    print(header)
+    print('-' * len(header))
+    for r in results:
+        print(
+            f"{r['replicas']:>8} | {r['reruns_per_second']:>9.1f} | "
+            f"{r['rerun_ms']['p50']:>7.1f}/{r['rerun_ms']['p95']:>8.1f} | "
+            f"{r['speedup']:>9.2f} | {r['efficiency']:>6.2f} | {r['errors']:>4}"
+        )
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="인스턴스 수별 처리량 부하 테스트")
+    parser.add_argument('--replicas', type=int, nargs='+', default=[1, 2, 4], help="측정할 인스턴스 수 목록")
+    parser.add_argument('--target', help="이미 실행 중인 주소 (리버스 프록시 등, 지정 시 인스턴스를 띄우지 않음)")
+    parser.add_argument('--sessions', type=int, default=32, help="동시 웹소켓 세션 수")
+    parser.add_argument('--duration', type=float, default=20.0, help="측정 시간(초)")
+    parser.add_argument('--warmup', type=float, default=3.0, help="예열 시간(초)")
+    parser.add_argument('--base-port', type=int, default=8701, help="로컬 인스턴스 시작 포트")
+    parser.add_argument('--min-efficiency', type=float, help="최소 확장 효율 (미달 시 종료 코드 1)")
+    parser.add_argument('--output', help="결과 JSON 저장 경로")
+    args = parser.parse_args(argv)
+
+    # 앱 설정에 필요한 환경변수 (로그인 화면 rerun만 측정하므로 실제 AWS에는 접속하지 않음)
+    os.environ.setdefault('AWS_COGNITO_CLIENT_ID', 'bench-client-id')
+    os.environ.setdefault('AWS_COGNITO_USER_POOL_ID', 'ap-northeast-2_bench')
+
+    results = []
+    if args.target:
+        url = args.target.rstrip('/')
+        wait_until_ready([url])
+        result = run_scenario([url], args.sessions, args.duration, args.warmup)
+        results.append({'replicas': None, 'target': url, **result, 'speedup': 1.0, 'efficiency': 1.0})
+    else:
+        for count in args.replicas:
+            urls = [f"http://127.0.0.1:{args.base_port + index}" for index in range(count)]
+            processes = start_replicas(count, args.base_port)
+            try:
+                wait_until_ready(urls)
+                result = run_scenario(urls, args.sessions, args.duration, args.warmup)
+            finally:
+                stop_replicas(processes)
+
+            base: Optional[Dict[str, Any]] = results[0] if results else None
+            speedup = result['reruns_per_second'] / base['reruns_per_second'] * base['replicas'] if base else float(count)
+            results.append({
+                'replicas': count,
+                **result,
+                'speedup': round(speedup, 2),
+                'efficiency': round(speedup / count, 2),
+            })
+
+    _print_table(results)
+
+    cpu_count = os.cpu_count() or 1
+    if any(r['replicas'] and r['replicas'] > cpu_count for r in results):
+        print(f"\n⚠️ CPU 코어 {cpu_count}개보다 많은 인스턴스는 코어가 병목이 되어 선형 증가를 기대할 수 없습니다.")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump({'results': results, 'sessions': args.sessions, 'cpu_count': cpu_count},
+                      f, ensure_ascii=False, indent=2)
+
+    if args.min_efficiency is not None:
+        below = [r for r in results if r['replicas'] and r['efficiency'] < args.min_efficiency]
+        if below:
+            print(f"\n⚠️ 확장 효율 미달: {[(r['replicas'], r['efficiency']) for r in below]}")
+            return 1
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,168 @@
+"""로그인 화면 표시까지의 시작 시간 / import 시간 리포트
+
+매번 새 파이썬 프로세스에서 Streamlit을 먼저 import한 뒤(서버가 이미 떠 있는 상태),
+AppTest로 app.py 첫 실행(로그인 화면)을 렌더링하여 다음을 측정합니다.
+
+- 로그인 화면까지 걸린 시간 (프로세스의 첫 세션 기준)
+- 그 사이 새로 import된 모듈의 누적 import 시간 상위 목록 (-X importtime)
+- 로그인 화면에 필요 없는 무거운 패키지(pandas, numpy, sqlalchemy, boto3)가 import되었는지 여부
+
+실행 예시 (erp 디렉터리에서):
+    python -m benchmarks.bench_startup --runs 5 --output startup.json
+    python -m benchmarks.bench_startup --baseline startup.json --max-regression 0.2
+"""
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+from typing import Any, Dict, List
+
+ERP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 로그인 화면 렌더링에는 필요 없어야 하는 패키지
+HEAVY_PACKAGES = ('pandas', 'numpy', 'sqlalchemy', 'boto3')
+
+_MARKER = '--- login form run ---'
+
+# 새 프로세스에서 실행할 코드 (importtime 출력은 stderr, 결과는 stdout JSON)
+_CHILD_CODE = f"""
+import json, sys, time
+import src.utils.warmup as warmup
+warmup._started = True  # 백그라운드 준비 작업은 측정에서 제외
+from streamlit.testing.v1 import AppTest
+
+before = set(sys.modules)
+print({_MARKER!r}, file=sys.stderr, flush=True)
+started = time.perf_counter()
+app = AppTest.from_file({os.path.join(ERP_DIR, 'app.py')!r}, default_timeout=60)
+app.run()
+elapsed_ms = (time.perf_counter() - started) * 1000
+loaded = {{name.split('.')[0] for name in set(sys.modules) - before}}
+print(json.dumps({{
+    'elapsed_ms': elapsed_ms,
+    'login_form': any(button.label == '🚀 로그인' for button in app.button),
+    'exceptions': [e.message for e in app.exception],
+    'heavy_packages': sorted(name for name in {HEAVY_PACKAGES!r} if name in loaded),
+}}))
+"""
+
+_IMPORTTIME_LINE = re.compile(r'import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)')
+
+
+def _parse_importtime(stderr: str) -> List[Dict[str, Any]]:
+    """마커 이후 importtime 출력 중 최상위 import만 (누적 ms) 목록으로 반환"""
+    _, _, after = stderr.partition(_MARKER)
+    modules = []
+    for line in after.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if match and len(match.group(3)) <= 1:
+            modules.append({'module': match.group(4), 'cumulative_ms': int(match.group(2)) / 1000})
+    return modules
+
+
+def run_once() -> Dict[str, Any]:
+    """새 프로세스에서 로그인 화면까지 한 번 측정"""
+    env = dict(os.environ)
+    env.setdefault('AWS_COGNITO_CLIENT_ID', 'bench-client-id')
+    env.setdefault('AWS_COGNITO_USER_POOL_ID', 'ap-northeast-2_bench')
+    env['PYTHONPATH'] = ERP_DIR
+
+    process = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', _CHILD_CODE],
+        cwd=ERP_DIR, env=env, capture_output=True, text=True, timeout=300,
+    )
+    if process.returncode != 0:
+        raise RuntimeError(f"측정 프로세스 실패:\n{process.stderr[-2000:]}")
+
+    result = json.loads(process.stdout.strip().splitlines()[-1])
+    if result['exceptions'] or not result['login_form']:
+        raise RuntimeError(f"로그인 화면이 렌더링되지 않았습니다: {result['exceptions']}")
+
+    result['imports'] = _parse_importtime(process.stderr)
+    return result
+
+
+def summarize(runs: List[Dict[str, Any]], top: int) -> Dict[str, Any]:
+    elapsed = sorted(run['elapsed_ms'] for run in runs)
+
+    # 모듈별 누적 import 시간 (실행 간 중앙값)
+    per_module: Dict[str, List[float]] = {}
+    for run in runs:
+        for item in run['imports']:
+            per_module.setdefault(item['module'], []).append(item['cumulative_ms'])
+    imports = sorted(
+        ({'module': name, 'cumulative_ms': round(statistics.median(values), 1)} for name, values in per_module.items()),
+        key=lambda item: item['cumulative_ms'], reverse=True,
+    )
+
+    return {
+        'runs': len(runs),
+        'time_to_login_form_ms': {
+            'p50': round(statistics.median(elapsed), 1),
+            'min': round(elapsed[0], 1),
+            'max': round(elapsed[-1], 1),
+        },
+        'import_ms_total': round(sum(item['cumulative_ms'] for item in imports), 1),
+        'heavy_packages': sorted({name for run in runs for name in run['heavy_packages']}),
+        'top_imports': imports[:top],
+    }
+
+
+def _print_report(summary: Dict[str, Any]):
+    timing = summary['time_to_login_form_ms']
+    print(f"로그인 화면까지: p50 {timing['p50']:.1f}ms (최소 {timing['min']:.1f} / 최대 {timing['max']:.1f}, {summary['runs']}회)")
+    print(f"그 사이 import 시간 합계: {summary['import_ms_total']:.1f}ms")
+    print(f"무거운 패키지 import: {', '.join(summary['heavy_packages']) or '없음'}")
+    print()
+    print(f"{'누적(ms)':>10} | 모듈")
+    print('-' * 40)
+    for item in summary['top_imports']:
+        print(f"{item['cumulative_ms']:>10.1f} | {item['module']}")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="로그인 화면까지 시작 시간 / import 시간 리포트")
+    parser.add_argument('--runs', type=int, default=5, help="새 프로세스 측정 횟수")
+    parser.add_argument('--top', type=int, default=15, help="표시할 import 상위 모듈 수")
+    parser.add_argument('--output', help="결과 JSON 저장 경로")
+    parser.add_argument('--baseline', help="비교할 기준 결과 JSON 경로")
+    parser.add_argument('--max-regression', type=float, default=0.2, help="허용 회귀 비율 (0.2 = 20%%)")
+    args = parser.parse_args(argv)
+
+    summary = summarize([run_once() for _ in range(args.runs)], args.top)
+    _print_report(summary)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(summary, f, ensure_ascii=False, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+
+        before = baseline['time_to_login_form_ms']['p50']
+        after = summary['time_to_login_form_ms']['p50']
+        print(f"\n기준 대비: {before:.1f} → {after:.1f}ms ({before / after:.2f}배)")
+
+        regressions = []
+        if after > before * (1 + args.max_regression):
+            regressions.append(f"로그인 화면까지 p50 {before:.1f} → {after:.1f}ms")
+        new_heavy = set(summary['heavy_packages']) - set(baseline['heavy_packages'])
+        if new_heavy:
+            regressions.append(f"새로 import된 무거운 패키지: {', '.join(sorted(new_heavy))}")
+
+        if regressions:
+            print("\n⚠️ 성능 회귀 감지:")
+            for line in regressions:
+                print(f"  - {line}")
+            return 1
+        print("\n✅ 기준 대비 회귀 없음")
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,95 @@
+import threading
+import time
+import uuid
+from collections import Counter
+from typing import Any, Dict, List, Optional
+
+from botocore.exceptions import ClientError
+
+
+class CognitoStub:
+    """벤치마크용 로컬 Cognito 대역 (boto3 cognito-idp 클라이언트 흉내)
+
+    API별 호출 수를 집계하고, 선택적으로 네트워크 지연을 흉내냅니다.
+    """
+
+    def __init__(self, latency_ms: float = 0.0, password: str = "password123", groups: Optional[Dict[str, List[str]]] = None):
+        self.latency = latency_ms / 1000
+        self.password = password
+        self.groups = groups or {}
+        self._tokens: Dict[str, str] = {}
+        self._lock = threading.Lock()
+        self.calls: Counter = Counter()
+
+    # ---------------------------
+    # 호출 집계
+    # ---------------------------
+    def _record(self, operation: str):
+        with self._lock:
+            self.calls[operation] += 1
+
+        if self.latency:
+            time.sleep(self.latency)
+
+    def total_calls(self) -> int:
+        with self._lock:
+            return sum(self.calls.values())
+
+    # ---------------------------
+    # cognito-idp API
+    # ---------------------------
+    def initiate_auth(self, **params) -> Dict[str, Any]:
+        self._record('initiate_auth')
+        auth_params = params.get('AuthParameters', {})
+
+        if params.get('AuthFlow') == 'USER_PASSWORD_AUTH' and auth_params.get('PASSWORD') != self.password:
+            raise _client_error('NotAuthorizedException', 'Incorrect username or password.', 'InitiateAuth')
+
+        username = auth_params.get('USERNAME', 'refresh')
+        access_token = uuid.uuid4().hex
+        with self._lock:
+            self._tokens[access_token] = username
+
+        return {
+            'AuthenticationResult': {
+                'AccessToken': access_token,
+                'RefreshToken': uuid.uuid4().hex,
+                'ExpiresIn': 3600,
+            }
+        }
+
+    def get_user(self, AccessToken: str) -> Dict[str, Any]:
+        self._record('get_user')
+        with self._lock:
+            username = self._tokens.get(AccessToken)
+
+        if username is None:
+            raise _client_error('NotAuthorizedException', 'Invalid Access Token', 'GetUser')
+
+        return {
+            'Username': username,
+            'UserAttributes': [
+                {'Name': 'sub', 'Value': str(uuid.uuid5(uuid.NAMESPACE_DNS, username))},
+                {'Name': 'email', 'Value': f'{username}@example.com'},
+                {'Name': 'email_verified', 'Value': 'true'},
+            ],
+            'MFAOptions': [],
+        }
+
+    def global_sign_out(self, AccessToken: str) -> Dict[str, Any]:
+        self._record('global_sign_out')
+        with self._lock:
+            self._tokens.pop(AccessToken, None)
+        return {}
+
+    def admin_list_groups_for_user(self, **params) -> Dict[str, Any]:
+        self._record('admin_list_groups_for_user')
+        return {'Groups': [{'GroupName': name} for name in self.groups.get(params['Username'], [])]}
+
+    def list_users(self, **params) -> Dict[str, Any]:
+        self._record('list_users')
+        return {'Users': []}
+
+
+def _client_error(code: str, message: str, operation: str) -> ClientError:
+    return ClientError({'Error': {'Code': code, 'Message': message}}, operation)
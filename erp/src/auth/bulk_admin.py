@@ -0,0 +1,160 @@
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List, Optional
+
+from botocore.exceptions import ClientError
+
+from src.auth.rate_limiter import BucketPolicy, TokenBucket
+
+# 일괄 작업 종류: (Cognito API 이름, 표시 이름)
+BULK_ACTIONS = {
+    'disable': ('admin_disable_user', '계정 비활성화'),
+    'enable': ('admin_enable_user', '계정 활성화'),
+    'reset_password': ('admin_reset_user_password', '비밀번호 재설정'),
+    'add_to_group': ('admin_add_user_to_group', '그룹에 추가'),
+    'global_sign_out': ('admin_user_global_sign_out', '전체 기기 로그아웃'),
+}
+
+# 스로틀링으로 간주하는 오류 코드
+THROTTLING_ERROR_CODES = {'TooManyRequestsException', 'LimitExceededException', 'ThrottlingException'}
+
+ERROR_MESSAGES = {
+    'UserNotFoundException': '존재하지 않는 사용자입니다.',
+    'ResourceNotFoundException': '그룹 또는 사용자 풀을 찾을 수 없습니다.',
+    'NotAuthorizedException': '이 작업을 수행할 권한이 없습니다.',
+    'InvalidParameterException': '요청 파라미터가 올바르지 않습니다.',
+    'TooManyRequestsException': '요청 한도를 초과했습니다.',
+    'LimitExceededException': '요청 한도를 초과했습니다.',
+}
+
+
+@dataclass
+class BulkOperationResult:
+    """사용자 한 명에 대한 작업 결과"""
+    username: str
+    success: bool
+    message: str
+    attempts: int
+    elapsed_ms: float
+
+
+class AdaptiveRateLimiter:
+    """API별 적응형 속도 제한 (스로틀링 시 속도 절반, 성공 시 서서히 증가)"""
+
+    def __init__(self, initial_rate: float = 20.0, min_rate: float = 1.0, max_rate: float = 25.0, increase_step: float = 0.5):
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.increase_step = increase_step
+        self.rate = initial_rate
+        self._bucket = TokenBucket(BucketPolicy(capacity=1.0, refill_rate=initial_rate))
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """다음 호출 슬롯까지 대기"""
+        while True:
+            with self._lock:
+                allowed, retry_after = self._bucket.consume()
+            if allowed:
+                return
+            time.sleep(retry_after)
+
+    def on_success(self):
+        with self._lock:
+            self._set_rate(self.rate + self.increase_step)
+
+    def on_throttle(self):
+        with self._lock:
+            self._set_rate(self.rate / 2)
+
+    def _set_rate(self, rate: float):
+        self.rate = min(self.max_rate, max(self.min_rate, rate))
+        self._bucket.policy = BucketPolicy(capacity=1.0, refill_rate=self.rate)
+
+
+# Cognito 요청 한도(기본 UserUpdate 범주 25 RPS)는 계정 단위이므로 API별 제한기를 프로세스 전체에서 공유
+_api_limiters: Dict[str, AdaptiveRateLimiter] = {}
+_api_limiters_lock = threading.Lock()
+
+
+def get_api_limiter(api_name: str) -> AdaptiveRateLimiter:
+    """API별 공유 속도 제한기 반환"""
+    with _api_limiters_lock:
+        if api_name not in _api_limiters:
+            _api_limiters[api_name] = AdaptiveRateLimiter()
+        return _api_limiters[api_name]
+
+
+class BulkUserOperator:
+    """여러 사용자에 대한 Cognito 관리자 작업을 제한된 워커 풀로 병렬 실행"""
+
+    def __init__(self, auth, max_workers: int = 8, max_retries: int = 5, base_backoff: float = 0.5):
+        # 화면에서 숨기는 것과 별개로 실행 시점에도 관리자 그룹인지 확인
+        identity = auth.get_identity()
+        if identity is None or auth.admin_group not in identity['groups']:
+            raise PermissionError("관리자 그룹 사용자만 일괄 작업을 실행할 수 있습니다.")
+
+        self.operator_username = identity['username']
+        self.client = auth.client
+        self.user_pool_id = auth.user_pool_id
+        self.max_workers = max_workers
+        self.max_retries = max_retries
+        self.base_backoff = base_backoff
+
+    def run(self, action: str, usernames: List[str], group_name: Optional[str] = None) -> Iterator[BulkOperationResult]:
+        """작업 실행 후 완료되는 순서대로 사용자별 결과 반환"""
+        if action not in BULK_ACTIONS:
+            raise ValueError(f"지원하지 않는 작업입니다: {action}")
+        if action == 'add_to_group' and not group_name:
+            raise ValueError("그룹에 추가하려면 그룹 이름이 필요합니다.")
+
+        api_name, _ = BULK_ACTIONS[action]
+        limiter = get_api_limiter(api_name)
+
+        targets = list(dict.fromkeys(usernames))
+        if self.operator_username in targets:
+            # 작업자 본인 계정 (비활성화 / 로그아웃 시 스스로를 잠글 수 있음)
+            targets.remove(self.operator_username)
+            yield BulkOperationResult(self.operator_username, False, '본인 계정에는 일괄 작업을 실행할 수 없습니다.', 0, 0.0)
+
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="cognito-bulk") as executor:
+            futures = [
+                executor.submit(self._execute, api_name, limiter, username, group_name)
+                for username in targets
+            ]
+            for future in as_completed(futures):
+                yield future.result()
+
+    def _execute(self, api_name: str, limiter: AdaptiveRateLimiter, username: str, group_name: Optional[str]) -> BulkOperationResult:
+        """단일 사용자 작업 (스로틀링 시 지수 백오프 + 지터로 재시도)"""
+        params: Dict[str, Any] = {'UserPoolId': self.user_pool_id, 'Username': username}
+        if group_name:
+            params['GroupName'] = group_name
+
+        started = time.perf_counter()
+        for attempt in range(1, self.max_retries + 1):
+            limiter.acquire()
+            try:
+                getattr(self.client, api_name)(**params)
+                limiter.on_success()
+                return BulkOperationResult(username, True, '완료', attempt, _elapsed_ms(started))
+            except ClientError as e:
+                error_code = e.response['Error']['Code']
+
+                if error_code in THROTTLING_ERROR_CODES and attempt < self.max_retries:
+                    limiter.on_throttle()
+                    time.sleep(random.uniform(0, self.base_backoff * (2 ** attempt)))
+                    continue
+
+                message = ERROR_MESSAGES.get(error_code, e.response['Error'].get('Message', error_code))
+                return BulkOperationResult(username, False, message, attempt, _elapsed_ms(started))
+            except Exception as e:
+                return BulkOperationResult(username, False, f'예상치 못한 오류: {str(e)}', attempt, _elapsed_ms(started))
+
+        return BulkOperationResult(username, False, '재시도 횟수를 초과했습니다.', self.max_retries, _elapsed_ms(started))
+
+
+def _elapsed_ms(started: float) -> float:
+    return round((time.perf_counter() - started) * 1000, 1)
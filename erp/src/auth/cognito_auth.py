@@ -1,23 +1,37 @@
-import boto3
+import logging
 import streamlit as st
 from botocore.exceptions import ClientError
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional
+from src.auth.cognito_client import get_cognito_client
+from src.auth.rate_limiter import get_login_rate_limiter, format_retry_after
 from src.utils.session import SessionManager
+from src.utils.profiling import timed
+
+logger = logging.getLogger(__name__)
+
+# 검증된 사용자명 / 그룹을 토큰 단위로 보관하는 session_state 키
+_IDENTITY_KEY = '_auth_identity'
 
 class CognitoAuth:
     """AWS Cognito 인증 관리 클래스"""
     
     def __init__(self, config: Dict[str, Any]):
         self.config = config
-        self.client = boto3.client('cognito-idp', region_name=config['aws']['region'])
         self.session_mgr = SessionManager()
+        self.rate_limiter = get_login_rate_limiter(config)
         
         self.client_id = config['aws']['cognito_client_id']
         self.user_pool_id = config['aws']['cognito_user_pool_id']
+        self.admin_group = config['aws'].get('admin_group', 'admin')
    
         # 초기화 시 세션 확인
         self._check_existing_session()
     
+    @property
+    def client(self):
+        """Cognito 클라이언트 (로그인 화면 렌더링에는 필요 없으므로 처음 호출 시 생성)"""
+        return get_cognito_client(self.config['aws']['region'])
+    
     def _check_existing_session(self):
         """기존 세션 확인 및 검증"""
         if self.session_mgr.is_authenticated():
@@ -25,13 +39,28 @@ class CognitoAuth:
             access_token = self.session_mgr.get_access_token()
             if access_token:
                 user_info_result = self.get_user_info(access_token)
-                if not user_info_result['success']:
+                if user_info_result['success']:
+                    # 복원된 세션의 사용자 정보는 신뢰하지 않고 토큰 소유자의 정보로 교체
+                    self.session_mgr.set_user_info(user_info_result['user_attributes'])
+                else:
                     # 토큰이 유효하지 않으면 세션 클리어
                     self.session_mgr.clear_auth_data()
                     st.warning("세션이 만료되어 다시 로그인이 필요합니다.")
     
-    def sign_in(self, username: str, password: str) -> Dict[str, Any]:
+    @timed('auth.sign_in')
+    def sign_in(self, username: str, password: str, ip_address: Optional[str] = None) -> Dict[str, Any]:
         """로그인"""
+        # Cognito 호출 전에 로컬에서 초과 시도 차단
+        limit_result = self.rate_limiter.check(username, ip_address)
+        if not limit_result.allowed:
+            retry_after = format_retry_after(limit_result.retry_after)
+            return {
+                'success': False,
+                'message': f'로그인 시도가 너무 많습니다. {retry_after}초 후 다시 시도해주세요.',
+                'error_code': 'RateLimitExceeded',
+                'retry_after': retry_after
+            }
+        
         try:
             params = {
                 'ClientId': self.client_id,
@@ -77,6 +106,7 @@ class CognitoAuth:
         except Exception as e:
             return {'success': False, 'message': f'예상치 못한 오류가 발생했습니다: {str(e)}'}
     
+    @timed('auth.get_user_info')
     def get_user_info(self, access_token: str) -> Dict[str, Any]:
         """사용자 정보 조회"""
         try:
@@ -114,6 +144,7 @@ class CognitoAuth:
         except Exception as e:
             return {'success': False, 'message': f'예상치 못한 오류가 발생했습니다: {str(e)}'}
     
+    @timed('auth.refresh_token')
     def refresh_token(self, refresh_token: str) -> Dict[str, Any]:
         """토큰 갱신"""
         try:
@@ -151,6 +182,7 @@ class CognitoAuth:
         except Exception as e:
             return {'success': False, 'message': f'토큰 갱신 중 오류 발생: {str(e)}'}
     
+    @timed('auth.validate_session')
     def validate_session(self) -> bool:
         """현재 세션 유효성 검증"""
         if not self.session_mgr.is_authenticated():
@@ -164,6 +196,7 @@ class CognitoAuth:
         user_info_result = self.get_user_info(access_token)
         return user_info_result['success']    
     
+    @timed('auth.logout')
     def logout(self):
         """로그아웃"""
         try:
@@ -177,6 +210,10 @@ class CognitoAuth:
                     # 토큰이 이미 만료된 경우 등 무시
                     pass
             
+            # 로그아웃 이력 기록
+            self.session_mgr.log_activity('logout')
+            self.session_mgr.record_logout()
+            
             # 로컬 세션 클리어
             self.session_mgr.clear_auth_data()
             
@@ -190,6 +227,46 @@ class CognitoAuth:
         finally:
             st.rerun()
     
+    @timed('auth.get_identity')
+    def get_identity(self) -> Optional[Dict[str, Any]]:
+        """현재 토큰 소유자의 Cognito 사용자명과 그룹 목록 (토큰 단위로 캐시, 확인 실패 시 None)"""
+        access_token = self.session_mgr.get_access_token()
+        if not self.session_mgr.is_authenticated() or not access_token:
+            return None
+        
+        cached = st.session_state.get(_IDENTITY_KEY)
+        if cached and cached['access_token'] == access_token:
+            return cached
+        
+        # 사용자명은 브라우저에서 복원된 값이 아니라 토큰으로 Cognito에서 직접 조회
+        user_info_result = self.get_user_info(access_token)
+        if not user_info_result['success']:
+            return None
+        username = user_info_result['user_info']['username']
+        
+        try:
+            groups: List[str] = []
+            params = {'UserPoolId': self.user_pool_id, 'Username': username, 'Limit': 60}
+            while True:
+                response = self.client.admin_list_groups_for_user(**params)
+                groups.extend(group['GroupName'] for group in response.get('Groups', []))
+                if not response.get('NextToken'):
+                    break
+                params['NextToken'] = response['NextToken']
+        except ClientError as e:
+            # 조회 실패는 캐시하지 않고 권한 없음으로 처리
+            logger.warning("사용자 그룹 조회 실패 (%s): %s", username, e)
+            return None
+        
+        identity = {'access_token': access_token, 'username': username, 'groups': groups}
+        st.session_state[_IDENTITY_KEY] = identity
+        return identity
+    
+    def is_admin(self) -> bool:
+        """현재 사용자가 관리자 그룹에 속하는지 확인"""
+        identity = self.get_identity()
+        return identity is not None and self.admin_group in identity['groups']
+    
     def get_session_status(self) -> Dict[str, Any]:
         """세션 상태 정보 반환"""
         session_info = self.session_mgr.get_session_info()
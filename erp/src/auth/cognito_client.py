@@ -0,0 +1,22 @@
+import threading
+from typing import Any, Dict
+
+_clients: Dict[str, Any] = {}
+_clients_lock = threading.Lock()
+
+
+def get_cognito_client(region: str):
+    """리전별 Cognito 클라이언트 반환 (프로세스당 한 번 생성)
+
+    boto3 클라이언트 생성은 서비스 모델 로딩 때문에 수~수백 ms가 걸리므로
+    rerun / 세션마다 만들지 않고 공유합니다 (boto3 클라이언트는 스레드 간 공유 가능).
+    """
+    with _clients_lock:
+        client = _clients.get(region)
+        if client is None:
+            # 로그인 화면에는 필요 없으므로 처음 사용할 때 import
+            import boto3
+
+            client = boto3.client('cognito-idp', region_name=region)
+            _clients[region] = client
+        return client
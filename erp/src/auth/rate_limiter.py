@@ -0,0 +1,236 @@
+import logging
+import math
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class RateLimitResult:
+    """속도 제한 검사 결과"""
+    allowed: bool
+    retry_after: float = 0.0
+    scope: Optional[str] = None
+
+
+@dataclass
+class BucketPolicy:
+    """토큰 버킷 정책 (capacity개까지 누적, 초당 refill_rate개 충전)"""
+    capacity: float
+    refill_rate: float
+
+
+class TokenBucket:
+    """단일 토큰 버킷"""
+
+    def __init__(self, policy: BucketPolicy, now: Optional[float] = None):
+        self.policy = policy
+        self.tokens = policy.capacity
+        self.updated_at = time.monotonic() if now is None else now
+
+    def refill(self, now: Optional[float] = None) -> float:
+        """경과 시간만큼 토큰 충전 후 현재 토큰 수 반환"""
+        now = time.monotonic() if now is None else now
+        elapsed = max(0.0, now - self.updated_at)
+        self.tokens = min(self.policy.capacity, self.tokens + elapsed * self.policy.refill_rate)
+        self.updated_at = now
+        return self.tokens
+
+    def retry_after(self, amount: float = 1.0) -> float:
+        """충전된 현재 상태에서 amount개를 쓸 수 있을 때까지 남은 초"""
+        return max(0.0, amount - self.tokens) / self.policy.refill_rate
+
+    def consume(self, amount: float = 1.0, now: Optional[float] = None) -> Tuple[bool, float]:
+        """토큰 소비 시도 → (허용 여부, 재시도까지 남은 초)"""
+        if self.refill(now) >= amount:
+            self.tokens -= amount
+            return True, 0.0
+
+        return False, self.retry_after(amount)
+
+
+class InMemoryRateLimitBackend:
+    """프로세스 메모리 기반 토큰 버킷 저장소"""
+
+    def __init__(self, max_keys: int = 100000):
+        self.max_keys = max_keys
+        self._buckets: "OrderedDict[str, TokenBucket]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def consume(self, key: str, policy: BucketPolicy, amount: float = 1.0) -> Tuple[bool, float]:
+        allowed, retry_after, _ = self.consume_all([(key, policy)], amount)
+        return allowed, retry_after
+
+    def consume_all(self, items: List[Tuple[str, BucketPolicy]], amount: float = 1.0) -> Tuple[bool, float, Optional[int]]:
+        """모든 버킷에 토큰이 있을 때만 전부 소비 → (허용 여부, 재시도까지 남은 초, 차단한 항목 위치)"""
+        with self._lock:
+            now = time.monotonic()
+            buckets = [self._bucket(key, policy) for key, policy in items]
+
+            for index, bucket in enumerate(buckets):
+                if bucket.refill(now) < amount:
+                    return False, bucket.retry_after(amount), index
+
+            for bucket in buckets:
+                bucket.tokens -= amount
+            return True, 0.0, None
+
+    def _bucket(self, key: str, policy: BucketPolicy) -> TokenBucket:
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = TokenBucket(policy)
+            self._buckets[key] = bucket
+            # 메모리 상한 초과 시 가장 오래 사용되지 않은 버킷 제거
+            if len(self._buckets) > self.max_keys:
+                self._buckets.popitem(last=False)
+        else:
+            self._buckets.move_to_end(key)
+        return bucket
+
+
+# 여러 버킷을 원자적으로 검사 / 소비하는 Lua 스크립트 (Redis 서버 시간 기준)
+# 모든 버킷에 토큰이 있을 때만 전부 소비하며, 하나라도 부족하면 아무것도 소비하지 않음
+# ARGV: requested, 이후 버킷마다 capacity, rate
+_REDIS_TOKEN_BUCKET_SCRIPT = """
+local requested = tonumber(ARGV[1])
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+
+local levels = {}
+for i, key in ipairs(KEYS) do
+    local capacity = tonumber(ARGV[i * 2])
+    local rate = tonumber(ARGV[i * 2 + 1])
+    local data = redis.call('HMGET', key, 'tokens', 'ts')
+    local tokens = tonumber(data[1]) or capacity
+    local ts = tonumber(data[2]) or now
+    tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate)
+    if tokens < requested then
+        return {0, tostring((requested - tokens) / rate), i - 1}
+    end
+    levels[i] = tokens
+end
+
+for i, key in ipairs(KEYS) do
+    local capacity = tonumber(ARGV[i * 2])
+    local rate = tonumber(ARGV[i * 2 + 1])
+    redis.call('HSET', key, 'tokens', levels[i] - requested, 'ts', now)
+    redis.call('EXPIRE', key, math.ceil(capacity / rate) + 1)
+end
+return {1, '0', -1}
+"""
+
+
+class RedisRateLimitBackend:
+    """Redis 기반 토큰 버킷 저장소 (여러 프로세스/인스턴스 공유)"""
+
+    def __init__(self, redis_url: str, key_prefix: str = "login_rl:"):
+        import redis
+
+        self.key_prefix = key_prefix
+        self._client = redis.Redis.from_url(redis_url, socket_timeout=0.5)
+        self._script = self._client.register_script(_REDIS_TOKEN_BUCKET_SCRIPT)
+
+    def consume(self, key: str, policy: BucketPolicy, amount: float = 1.0) -> Tuple[bool, float]:
+        allowed, retry_after, _ = self.consume_all([(key, policy)], amount)
+        return allowed, retry_after
+
+    def consume_all(self, items: List[Tuple[str, BucketPolicy]], amount: float = 1.0) -> Tuple[bool, float, Optional[int]]:
+        args: List[float] = [amount]
+        for _, policy in items:
+            args.extend([policy.capacity, policy.refill_rate])
+
+        allowed, retry_after, index = self._script(keys=[self.key_prefix + key for key, _ in items], args=args)
+        index = int(index)
+        return bool(int(allowed)), float(retry_after), index if index >= 0 else None
+
+
+class LoginRateLimiter:
+    """로그인 시도 속도 제한 (전역 / IP / 사용자명 단위)
+
+    Cognito로 요청을 보내기 전에 로컬에서 초과 시도를 차단합니다.
+    """
+
+    def __init__(
+        self,
+        backend,
+        username_policy: BucketPolicy,
+        ip_policy: BucketPolicy,
+        global_policy: Optional[BucketPolicy] = None,
+        fallback_backend: Optional[InMemoryRateLimitBackend] = None,
+    ):
+        self.backend = backend
+        self.fallback_backend = fallback_backend or InMemoryRateLimitBackend()
+        self.username_policy = username_policy
+        self.ip_policy = ip_policy
+        self.global_policy = global_policy
+
+    def check(self, username: str, ip_address: Optional[str] = None) -> RateLimitResult:
+        """로그인 시도 허용 여부 검사 (모든 범위가 허용할 때만 토큰 소비)"""
+        checks: List[Tuple[str, str, BucketPolicy]] = []
+
+        if self.global_policy:
+            checks.append(('global', 'global', self.global_policy))
+        if ip_address:
+            checks.append(('ip', f"ip:{ip_address}", self.ip_policy))
+        checks.append(('username', f"user:{username.strip().lower()}", self.username_policy))
+
+        # 모든 범위를 먼저 검사하고 전부 허용될 때만 소비 (IP / 사용자명에서 차단된 시도가 전역 허용량을 쓰지 않도록)
+        allowed, retry_after, index = self._consume_all([(key, policy) for _, key, policy in checks])
+        if not allowed:
+            return RateLimitResult(False, retry_after, checks[index][0] if index is not None else None)
+
+        return RateLimitResult(True)
+
+    def _consume_all(self, items: List[Tuple[str, BucketPolicy]]) -> Tuple[bool, float, Optional[int]]:
+        try:
+            return self.backend.consume_all(items)
+        except Exception as e:
+            # Redis 장애 시 프로세스 메모리 버킷으로 대체
+            if self.backend is self.fallback_backend:
+                raise
+            logger.warning("속도 제한 백엔드 오류, 메모리 버킷 사용: %s", e)
+            return self.fallback_backend.consume_all(items)
+
+
+_login_rate_limiter: Optional[LoginRateLimiter] = None
+_login_rate_limiter_lock = threading.Lock()
+
+
+def get_login_rate_limiter(config: Dict[str, Any]) -> LoginRateLimiter:
+    """프로세스 단위 로그인 속도 제한기 반환"""
+    global _login_rate_limiter
+
+    with _login_rate_limiter_lock:
+        if _login_rate_limiter is None:
+            settings = config.get('rate_limit', {})
+            redis_url = config.get('redis', {}).get('url')
+
+            backend = InMemoryRateLimitBackend()
+            if redis_url:
+                try:
+                    backend = RedisRateLimitBackend(redis_url)
+                except Exception as e:
+                    logger.warning("Redis 속도 제한 백엔드 초기화 실패, 메모리 버킷 사용: %s", e)
+
+            _login_rate_limiter = LoginRateLimiter(
+                backend,
+                username_policy=_policy(settings.get('username_attempts', 5), settings.get('username_window_seconds', 300)),
+                ip_policy=_policy(settings.get('ip_attempts', 20), settings.get('ip_window_seconds', 300)),
+                global_policy=_policy(settings.get('global_attempts', 50), settings.get('global_window_seconds', 1)),
+            )
+
+        return _login_rate_limiter
+
+
+def _policy(attempts: int, window_seconds: float) -> BucketPolicy:
+    """'window_seconds 동안 attempts회' 설정을 토큰 버킷 정책으로 변환"""
+    return BucketPolicy(capacity=float(attempts), refill_rate=float(attempts) / max(window_seconds, 1e-3))
+
+
+def format_retry_after(retry_after: float) -> int:
+    """재시도 대기 시간(초)을 사용자 표시용 정수로 변환"""
+    return max(1, math.ceil(retry_after))
@@ -0,0 +1,274 @@
+import logging
+import os
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+from botocore.exceptions import ClientError
+from sqlalchemy import delete, func, or_, select, update
+from sqlalchemy.dialects.postgresql import insert
+
+from src.auth.cognito_client import get_cognito_client
+from src.database.models import CognitoUser
+
+logger = logging.getLogger(__name__)
+
+# list_users 한 번에 가져올 수 있는 최대 사용자 수
+LIST_USERS_PAGE_LIMIT = 60
+
+
+class UserDirectory:
+    """Cognito 사용자 목록 로컬 캐시
+
+    백그라운드 스레드가 list_users를 페이지 단위로 천천히 순회하며
+    변경된 사용자만 cognito_users 테이블에 반영하고,
+    검색은 항상 로컬 테이블(인덱스)에서 처리합니다.
+    """
+
+    def __init__(
+        self,
+        client,
+        user_pool_id: str,
+        session_factory,
+        refresh_interval: float = 300.0,
+        page_interval: float = 0.2,
+    ):
+        self.client = client
+        self.user_pool_id = user_pool_id
+        self._session_factory = session_factory
+        self.refresh_interval = refresh_interval
+        self.page_interval = page_interval
+
+        self._refresh_event = threading.Event()
+        self._sync_lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self.last_sync: Dict[str, Any] = {}
+
+    def start(self):
+        """백그라운드 동기화 스레드 시작"""
+        if self._thread is not None:
+            return
+
+        self._thread = threading.Thread(target=self._run, name="user-directory-sync", daemon=True)
+        self._thread.start()
+
+    def request_refresh(self):
+        """다음 주기를 기다리지 않고 즉시 동기화 요청"""
+        self._refresh_event.set()
+
+    def is_syncing(self) -> bool:
+        """동기화 진행 여부"""
+        return self._sync_lock.locked()
+
+    def _run(self):
+        while True:
+            try:
+                self.sync_once()
+            except Exception:
+                logger.exception("Cognito 사용자 디렉터리 동기화 실패")
+
+            self._refresh_event.wait(self.refresh_interval)
+            self._refresh_event.clear()
+
+    def sync_once(self) -> Dict[str, Any]:
+        """사용자 풀 전체를 한 바퀴 순회하며 변경분만 반영"""
+        with self._sync_lock:
+            cycle_start = datetime.now(timezone.utc)
+            stats = {'pages': 0, 'seen': 0, 'changed': 0, 'deleted': 0}
+
+            params = {'UserPoolId': self.user_pool_id, 'Limit': LIST_USERS_PAGE_LIMIT}
+            while True:
+                response = self._list_users_page(params)
+                users = [_to_row(user) for user in response.get('Users', [])]
+
+                stats['pages'] += 1
+                stats['seen'] += len(users)
+                stats['changed'] += self._apply_page(users, cycle_start)
+
+                pagination_token = response.get('PaginationToken')
+                if not pagination_token:
+                    break
+
+                params['PaginationToken'] = pagination_token
+                # ListUsers 호출 한도를 넘지 않도록 페이지 간 간격 유지
+                time.sleep(self.page_interval)
+
+            # 이번 순회에서 보이지 않은 사용자는 풀에서 삭제된 것으로 간주
+            with self._session_factory() as session:
+                result = session.execute(delete(CognitoUser).where(CognitoUser.synced_at < cycle_start))
+                session.commit()
+                stats['deleted'] = result.rowcount
+
+            stats['finished_at'] = datetime.now(timezone.utc)
+            stats['duration_seconds'] = round((stats['finished_at'] - cycle_start).total_seconds(), 2)
+            self.last_sync = stats
+            return stats
+
+    def _list_users_page(self, params: Dict[str, Any], max_retries: int = 5) -> Dict[str, Any]:
+        """list_users 호출 (요청 한도 초과 시 지수 백오프)"""
+        for attempt in range(max_retries):
+            try:
+                return self.client.list_users(**params)
+            except ClientError as e:
+                if e.response['Error']['Code'] != 'TooManyRequestsException' or attempt == max_retries - 1:
+                    raise
+                time.sleep(min(30.0, self.page_interval * (2 ** (attempt + 2))))
+        return {}
+
+    def _apply_page(self, users: List[Dict[str, Any]], cycle_start: datetime) -> int:
+        """한 페이지 반영: 신규/변경 사용자만 UPSERT, 나머지는 확인 시각만 갱신"""
+        if not users:
+            return 0
+
+        usernames = [user['username'] for user in users]
+
+        with self._session_factory() as session:
+            known = dict(session.execute(
+                select(CognitoUser.username, CognitoUser.user_modified_at)
+                .where(CognitoUser.username.in_(usernames))
+            ).all())
+
+            changed = [
+                user for user in users
+                if user['username'] not in known or known[user['username']] != user['user_modified_at']
+            ]
+
+            if changed:
+                for user in changed:
+                    user['synced_at'] = cycle_start
+                stmt = insert(CognitoUser).values(changed)
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=[CognitoUser.username],
+                    set_={
+                        column: stmt.excluded[column]
+                        for column in changed[0].keys() if column != 'username'
+                    }
+                )
+                session.execute(stmt)
+
+            changed_usernames = {user['username'] for user in changed}
+            unchanged = [username for username in usernames if username not in changed_usernames]
+            if unchanged:
+                session.execute(
+                    update(CognitoUser)
+                    .where(CognitoUser.username.in_(unchanged))
+                    .values(synced_at=cycle_start)
+                )
+
+            session.commit()
+
+        return len(changed)
+
+    def search(
+        self,
+        query: Optional[str] = None,
+        user_status: Optional[str] = None,
+        enabled: Optional[bool] = None,
+        limit: int = 50,
+        offset: int = 0,
+    ) -> Tuple[List[CognitoUser], int]:
+        """로컬 캐시에서 사용자 검색 (사용자명/이메일 접두어, 상태 필터)"""
+        conditions = _search_conditions(query, user_status, enabled)
+
+        with self._session_factory() as session:
+            total = session.scalar(select(func.count()).select_from(CognitoUser).where(*conditions))
+            users = session.scalars(
+                select(CognitoUser)
+                .where(*conditions)
+                .order_by(CognitoUser.username)
+                .limit(limit)
+                .offset(offset)
+            ).all()
+
+        return list(users), total or 0
+
+    def list_usernames(
+        self,
+        query: Optional[str] = None,
+        user_status: Optional[str] = None,
+        enabled: Optional[bool] = None,
+    ) -> List[str]:
+        """검색 조건에 해당하는 모든 사용자명 (일괄 작업 대상 선택용)"""
+        conditions = _search_conditions(query, user_status, enabled)
+
+        with self._session_factory() as session:
+            return list(session.scalars(
+                select(CognitoUser.username).where(*conditions).order_by(CognitoUser.username)
+            ).all())
+
+    def get_status_counts(self) -> Dict[str, int]:
+        """상태별 사용자 수"""
+        with self._session_factory() as session:
+            rows = session.execute(
+                select(CognitoUser.user_status, func.count()).group_by(CognitoUser.user_status)
+            ).all()
+        return {status or 'UNKNOWN': count for status, count in rows}
+
+
+def _to_row(user: Dict[str, Any]) -> Dict[str, Any]:
+    """list_users 응답 항목을 cognito_users 행으로 변환"""
+    attributes = {attr['Name']: attr['Value'] for attr in user.get('Attributes', [])}
+
+    return {
+        'username': user['Username'],
+        'user_id': attributes.get('sub'),
+        'email': attributes.get('email'),
+        'given_name': attributes.get('given_name'),
+        'family_name': attributes.get('family_name'),
+        'phone_number': attributes.get('phone_number'),
+        'user_status': user.get('UserStatus'),
+        'enabled': user.get('Enabled', True),
+        'attributes': attributes,
+        'user_created_at': user.get('UserCreateDate'),
+        'user_modified_at': user.get('UserLastModifiedDate'),
+    }
+
+
+def _search_conditions(query: Optional[str], user_status: Optional[str], enabled: Optional[bool]) -> list:
+    """검색 조건 생성 (접두어 검색은 lower() + text_pattern_ops 인덱스 사용)"""
+    conditions = []
+
+    if query and query.strip():
+        prefix = _escape_like(query.strip().lower()) + '%'
+        conditions.append(or_(
+            func.lower(CognitoUser.username).like(prefix, escape='\\'),
+            func.lower(CognitoUser.email).like(prefix, escape='\\'),
+        ))
+    if user_status:
+        conditions.append(CognitoUser.user_status == user_status)
+    if enabled is not None:
+        conditions.append(CognitoUser.enabled == enabled)
+
+    return conditions
+
+
+def _escape_like(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+
+
+_user_directory: Optional[UserDirectory] = None
+_user_directory_lock = threading.Lock()
+
+
+def get_user_directory(config: Dict[str, Any]) -> Optional[UserDirectory]:
+    """프로세스 단위 사용자 디렉터리 반환 (DB 미설정 시 None)"""
+    global _user_directory
+
+    with _user_directory_lock:
+        if _user_directory is None:
+            from src.database.supabase_client import SessionLocal, engine
+
+            if engine is None:
+                return None
+
+            _user_directory = UserDirectory(
+                get_cognito_client(config['aws']['region']),
+                config['aws']['cognito_user_pool_id'],
+                SessionLocal,
+                refresh_interval=float(os.getenv('USER_DIRECTORY_REFRESH_SECONDS', '300')),
+                page_interval=float(os.getenv('USER_DIRECTORY_PAGE_INTERVAL', '0.2')),
+            )
+            _user_directory.start()
+
+        return _user_directory
@@ -0,0 +1,181 @@
+import json
+import streamlit as st
+from typing import Any, Dict, List, Optional
+
+# 브라우저 sessionStorage에 인증 세션을 저장하는 키
+STORAGE_KEY = 'streamlit_auth_session'
+
+# 브리지 컴포넌트 위젯 키 (rerun마다 같은 키로 그려 브라우저에서는 한 번만 마운트됨)
+BRIDGE_KEY = 'browser_bridge'
+
+# 서버 쪽 동기화 상태를 보관하는 session_state 키
+_STATE_KEY = '_browser_bridge'
+
+# 브라우저에서 실행되는 브리지 스크립트
+# - data.ops 중 아직 적용하지 않은 변경분만 sessionStorage에 반영 (적용한 seq는 서버 세션별로 기록)
+# - 서버가 미인증 상태이면 저장된 세션을 한 번만 restore 이벤트로 전달
+# - 중간 변경분이 유실되어 이어서 적용할 수 없으면 resync 이벤트로 전체 상태를 다시 요청
+_BRIDGE_JS = """
+const restoreRequested = new Set();
+
+function readJson(key) {
+    try {
+        return JSON.parse(sessionStorage.getItem(key) || 'null');
+    } catch (e) {
+        sessionStorage.removeItem(key);
+        return null;
+    }
+}
+
+export default function (component) {
+    const { data, setTriggerValue } = component;
+    if (!data) {
+        return;
+    }
+
+    const storageKey = data.storage_key;
+    const seqKey = storageKey + ':seq';
+
+    let applied = readJson(seqKey);
+    if (!applied || applied.session !== data.session_id) {
+        applied = { session: data.session_id, seq: 0 };
+    }
+
+    let resync = false;
+    for (const op of JSON.parse(data.ops)) {
+        if (op.seq <= applied.seq) {
+            continue;
+        }
+        if (op.op === 'set') {
+            sessionStorage.setItem(storageKey, JSON.stringify(op.fields));
+        } else if (op.op === 'clear') {
+            sessionStorage.removeItem(storageKey);
+        } else {
+            const stored = readJson(storageKey);
+            if (op.seq !== applied.seq + 1 || !stored) {
+                resync = true;
+                break;
+            }
+            sessionStorage.setItem(storageKey, JSON.stringify(Object.assign(stored, op.fields)));
+        }
+        applied.seq = op.seq;
+    }
+    sessionStorage.setItem(seqKey, JSON.stringify(applied));
+
+    if (resync || applied.seq < data.seq) {
+        setTriggerValue('resync', applied.seq);
+        return;
+    }
+
+    let stored = readJson(storageKey);
+    if (stored && !(stored.expires_at > Date.now())) {
+        sessionStorage.removeItem(storageKey);
+        stored = null;
+    }
+
+    if (!data.authenticated && stored && !restoreRequested.has(data.session_id)) {
+        restoreRequested.add(data.session_id);
+        setTriggerValue('restore', stored);
+    }
+
+    // 만료 시각에 저장된 세션 자동 삭제
+    if (stored) {
+        const timer = setTimeout(function () {
+            const current = readJson(storageKey);
+            if (current && !(current.expires_at > Date.now())) {
+                sessionStorage.removeItem(storageKey);
+            }
+        }, Math.max(0, stored.expires_at - Date.now()));
+        return function () {
+            clearTimeout(timer);
+        };
+    }
+}
+"""
+
+_browser_bridge = st.components.v2.component('browser_bridge', js=_BRIDGE_JS)
+
+
+def _bridge_state() -> Dict[str, Any]:
+    # synced: 브라우저에 반영하도록 보낸 마지막 전체 상태 (None: 모름, {}: 삭제됨)
+    return st.session_state.setdefault(_STATE_KEY, {'seq': 0, 'pending': [], 'synced': None})
+
+
+def _queue_op(state: Dict[str, Any], op: str, fields: Optional[Dict[str, Any]] = None):
+    state['seq'] += 1
+    entry = {'seq': state['seq'], 'op': op}
+    if fields is not None:
+        entry['fields'] = fields
+
+    # 전체 저장/삭제는 이전 변경분을 모두 대체
+    if op in ('set', 'clear'):
+        state['pending'] = [entry]
+    else:
+        state['pending'].append(entry)
+
+
+def queue_session(session: Optional[Dict[str, Any]]):
+    """브라우저 세션 저장소에 반영할 변경분 등록 (None이면 삭제)
+
+    마지막으로 보낸 상태와 달라진 필드만 보내며, 실제 전송은 다음 브리지 렌더링 때 이루어집니다.
+    """
+    state = _bridge_state()
+    synced = state['synced']
+
+    if session is None:
+        if synced != {}:
+            _queue_op(state, 'clear')
+            state['synced'] = {}
+        return
+
+    # 처음 보내거나 빠진 필드가 있으면 전체 저장
+    if not synced or set(synced) - set(session):
+        _queue_op(state, 'set', dict(session))
+    else:
+        changed = {key: value for key, value in session.items() if synced.get(key) != value}
+        if not changed:
+            return
+        _queue_op(state, 'patch', changed)
+    state['synced'] = dict(session)
+
+
+def mark_restored(session: Dict[str, Any]):
+    """브라우저에서 복원한 세션을 이미 동기화된 상태로 기록"""
+    _bridge_state()['synced'] = dict(session)
+
+
+def _resync():
+    # 브라우저가 변경분을 이어서 적용하지 못하면 현재 전체 상태를 다시 보냄
+    state = _bridge_state()
+    synced = state['synced']
+    if synced:
+        _queue_op(state, 'set', dict(synced))
+    else:
+        _queue_op(state, 'clear')
+
+
+def render_browser_bridge(session_id: str, authenticated: bool) -> Optional[Dict[str, Any]]:
+    """브라우저 세션 브리지 렌더링 (rerun마다 한 번 호출)
+
+    대기 중인 변경분을 브라우저로 보내고, 브라우저에 복원할 세션이 있으면 그 데이터를 반환합니다.
+    """
+    state = _bridge_state()
+    pending: List[Dict[str, Any]] = state['pending']
+
+    result = _browser_bridge(
+        key=BRIDGE_KEY,
+        data={
+            'storage_key': STORAGE_KEY,
+            'session_id': session_id,
+            'seq': state['seq'],
+            # 목록/딕셔너리 값은 데이터프레임 여부 검사로 pandas를 import하므로 문자열로 전달
+            'ops': json.dumps(pending),
+            'authenticated': authenticated,
+        },
+        on_restore_change=lambda: None,
+        on_resync_change=_resync,
+    )
+
+    # 보낸 변경분은 비움 (유실되면 브라우저가 resync를 요청)
+    state['pending'] = []
+    return result.get('restore')
@@ -1,54 +1,110 @@
+import math
 import streamlit as st
 import pandas as pd
-import numpy as np
 from datetime import datetime, timedelta
-from typing import Literal
+from src.database.supabase_client import engine
+from src.database.timeseries import fetch_timeseries, format_bucket
+from src.utils.profiling import timed
+from src.utils.shared_cache import get_shared_cache
 
+# 부분 갱신(fragment) 주기 (초)
+CHARTS_REFRESH_SECONDS = 300
+
+# 차트 조회 기간 (일) / 기간 끝 시각을 내림할 단위 (분)
+CHART_WINDOW_DAYS = 30
+CHART_WINDOW_STEP_MINUTES = 5
+
+# 차트 데이터 공유 캐시 유효 기간 / 만료 후 이전 값을 보여주며 백그라운드 갱신할 기간 (초)
+CHART_CACHE_SECONDS = 300
+CHART_STALE_SECONDS = 3600
+
+@st.fragment(run_every=CHARTS_REFRESH_SECONDS)
+@timed('dashboard.charts')
 def render_charts():
-    """차트 렌더링"""
+    """차트 렌더링 (다른 패널과 독립적으로 주기적 갱신)
+
+    선택된 탭의 데이터만 조회하고, 조회 결과는 세션 간 공유 캐시에 보관하여
+    탭을 오가거나 여러 관리자가 동시에 열어도 같은 데이터를 다시 조회하지 않습니다.
+    """
     st.markdown("### 📊 데이터 분석")
     
-    tab1, tab2, tab3 = st.tabs(["📈 방문자 통계", "💹 사용량 분석", "🎯 성과 리포트"])
-    
-    with tab1:
-        _render_visitor_chart()
-    
-    with tab2:
-        _render_usage_chart()
-    
-    with tab3:
-        _render_performance_chart()
+    if engine is None:
+        st.info("차트 데이터를 불러올 수 없습니다. (DB 미설정)")
+        return
+    
+    chart_tabs = [
+        ("📈 방문자 통계", "visitors", _render_visitor_chart),
+        ("💹 사용량 분석", "usage", _render_usage_chart),
+        ("🎯 성과 리포트", "performance", _render_performance_chart),
+    ]
+    
+    # on_change="rerun": 탭 전환 시 (fragment 안에서) 다시 실행되어 tab.open으로 선택 탭 판단
+    tabs = st.tabs([label for label, _, _ in chart_tabs], key="dashboard_chart_tab", on_change="rerun")
+    
+    for tab, (_, chart_type, render) in zip(tabs, chart_tabs):
+        with tab:
+            if not tab.open:
+                continue
+            try:
+                chart_data, bucket, summary = _load_chart_data(chart_type)
+            except Exception as e:
+                st.warning(f"차트 데이터를 불러오지 못했습니다: {e}")
+                continue
+            render(chart_data, bucket, summary)
+
+def _current_window():
+    """차트 조회 기간 (끝 시각을 5분 단위로 내림)"""
+    now = datetime.now()
+    end = now.replace(minute=now.minute - now.minute % CHART_WINDOW_STEP_MINUTES, second=0, microsecond=0)
+    return end - timedelta(days=CHART_WINDOW_DAYS), end
+
+def _load_chart_data(chart_type: str):
+    """탭별 차트 데이터 조회 (모든 세션이 공유하는 캐시, 차트 종류 / 기간 길이 / 기간 끝 날짜별)
+
+    DB에서 기간에 맞는 크기의 버킷으로 집계한 뒤 LTTB로 점 수를 고정하여 반환합니다.
+    같은 날 안에서는 캐시가 만료되면 이전 결과를 보여주면서 백그라운드에서 최신 기간으로 한 번만 다시 조회하고,
+    날짜가 바뀌면 전날 기간의 결과를 쓰지 않도록 새 키로 조회합니다.
+    """
+    start, end = _current_window()
+    
+    @timed('dashboard.charts.load')
+    def _load():
+        return fetch_timeseries(chart_type, start, end)
+    
+    return get_shared_cache().get_or_compute(
+        f'dashboard:chart:{chart_type}:{CHART_WINDOW_DAYS}d:{end:%Y-%m-%d}', _load,
+        ttl=CHART_CACHE_SECONDS, stale_ttl=CHART_STALE_SECONDS
+    )
 
-def _render_visitor_chart():
+def _format_value(value, spec: str = ",.0f") -> str:
+    """요약값 표시 (데이터가 없으면 '-')"""
+    if value is None or (isinstance(value, float) and math.isnan(value)):
+        return "-"
+    return format(value, spec)
+
+def _render_visitor_chart(chart_data: pd.DataFrame, bucket: timedelta, summary: pd.DataFrame):
     """방문자 통계 차트"""
-    st.markdown("**일일 방문자 추이**")
-    
-    # 데이터 생성
-    chart_data = create_time_series_data("visitors")
+    bucket_label = format_bucket(bucket)
+    st.markdown(f"**방문자 추이** ({bucket_label} 단위)")
     
     # 차트 표시
     st.line_chart(chart_data)
     
-    # 요약 통계
+    # 요약 통계 (다운샘플링 전 전체 버킷 기준)
     col1, col2, col3 = st.columns(3)
     
     with col1:
-        avg_visitors = chart_data['일일 방문자'].mean()
-        st.metric("평균 일일 방문자", f"{avg_visitors:.0f}")
+        st.metric("총 로그인", _format_value(summary.at['sum', '로그인']))
     
     with col2:
-        max_visitors = chart_data['일일 방문자'].max()
-        st.metric("최대 방문자", f"{max_visitors:.0f}")
+        st.metric(f"최대 방문자 ({bucket_label})", _format_value(summary.at['max', '방문자']))
     
     with col3:
-        total_visitors = chart_data['일일 방문자'].sum()
-        st.metric("총 방문자", f"{total_visitors:.0f}")
+        st.metric("총 페이지 조회", _format_value(summary.at['sum', '페이지 조회']))
 
-def _render_usage_chart():
+def _render_usage_chart(chart_data: pd.DataFrame, bucket: timedelta, summary: pd.DataFrame):
     """사용량 분석 차트"""
-    st.markdown("**시스템 사용량 분석**")
-    
-    chart_data = create_time_series_data("usage")
+    st.markdown(f"**시스템 사용량 분석** ({format_bucket(bucket)} 단위)")
     
     # 바 차트로 표시
     st.bar_chart(chart_data)
@@ -56,75 +112,38 @@ def _render_usage_chart():
     # 상세 정보
     with st.expander("📋 상세 사용량 정보", expanded=False):
         st.dataframe(
-            chart_data.describe().round(2),
+            summary.rename(index={'sum': '합계', 'max': '최대', 'mean': '평균'}).round(2),
             width='stretch'
         )
 
-def _render_performance_chart():
+def _render_performance_chart(chart_data: pd.DataFrame, bucket: timedelta, summary: pd.DataFrame):
     """성과 리포트 차트"""
-    st.markdown("**성과 지표 트렌드**")
+    st.markdown(f"**성과 지표 트렌드** ({format_bucket(bucket)} 단위)")
     
-    chart_data = create_time_series_data("performance")
+    col1, col2 = st.columns(2)
     
-    # 영역 차트로 표시
-    st.area_chart(chart_data)
+    with col1:
+        st.line_chart(chart_data[['평균 응답시간(초)']])
+    
+    with col2:
+        st.bar_chart(chart_data[['로그인 실패']])
     
     # 성과 요약
     col1, col2 = st.columns(2)
     
     with col1:
         st.markdown("**📊 주요 지표**")
-        response_time_avg = chart_data['평균 응답시간'].mean()
-        throughput_avg = chart_data['처리량'].mean()
-        
-        st.write(f"• 평균 응답시간: {response_time_avg:.2f}초")
-        st.write(f"• 평균 처리량: {throughput_avg:.0f} req/min")
+        st.write(f"• 평균 응답시간: {_format_value(summary.at['mean', '평균 응답시간(초)'], '.2f')}초")
+        st.write(f"• 로그인 실패: {_format_value(summary.at['sum', '로그인 실패'])}건")
     
     with col2:
         st.markdown("**📈 개선 사항**")
         
-        # 트렌드 분석
-        response_trend = "📉 개선됨" if chart_data['평균 응답시간'].iloc[-1] < chart_data['평균 응답시간'].iloc[0] else "📈 증가함"
-        throughput_trend = "📈 증가함" if chart_data['처리량'].iloc[-1] > chart_data['처리량'].iloc[0] else "📉 감소함"
+        # 트렌드 분석 (값이 있는 첫 구간과 마지막 구간 비교)
+        response_times = chart_data['평균 응답시간(초)'].dropna()
+        if len(response_times) >= 2:
+            response_trend = "📉 개선됨" if response_times.iloc[-1] < response_times.iloc[0] else "📈 증가함"
+        else:
+            response_trend = "-"
         
         st.write(f"• 응답시간: {response_trend}")
-        st.write(f"• 처리량: {throughput_trend}")
-
-def create_time_series_data(chart_type: Literal["visitors", "usage", "performance"]) -> pd.DataFrame:
-    """시계열 데이터 생성"""
-    dates = pd.date_range(
-        start=datetime.now() - timedelta(days=29),
-        end=datetime.now(),
-        freq='D'
-    )
-    
-    np.random.seed(42)  # 일관된 데이터를 위한 시드 설정
-    
-    if chart_type == "visitors":
-        return pd.DataFrame({
-            '일일 방문자': np.random.randint(100, 1000, len(dates)) + 
-                          np.sin(np.arange(len(dates)) * 0.2) * 200,
-            '신규 방문자': np.random.randint(20, 300, len(dates)) + 
-                          np.sin(np.arange(len(dates)) * 0.15) * 80,
-            '재방문자': np.random.randint(50, 400, len(dates)) + 
-                       np.sin(np.arange(len(dates)) * 0.25) * 120
-        }, index=dates)
-    
-    elif chart_type == "usage":
-        return pd.DataFrame({
-            'API 호출': np.random.randint(1000, 5000, len(dates)) + 
-                       np.sin(np.arange(len(dates)) * 0.3) * 1000,
-            '스토리지 사용량(GB)': np.random.randint(100, 500, len(dates)) + 
-                                 np.cumsum(np.random.randn(len(dates)) * 0.1),
-            '대역폭(GB)': np.random.randint(50, 200, len(dates)) + 
-                        np.sin(np.arange(len(dates)) * 0.4) * 50
-        }, index=dates)
-    
-    else:  # performance
-        return pd.DataFrame({
-            '평균 응답시간': np.random.uniform(0.5, 3.0, len(dates)) + 
-                           np.sin(np.arange(len(dates)) * 0.1) * 0.5,
-            '처리량': np.random.randint(100, 500, len(dates)) + 
-                     np.sin(np.arange(len(dates)) * 0.2) * 100,
-            '에러율(%)': np.random.uniform(0.1, 2.0, len(dates))
-        }, index=dates)
\ No newline at end of file
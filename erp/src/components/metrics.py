@@ -1,56 +1,88 @@
 import streamlit as st
+import math
 import random
-from datetime import datetime, timedelta
+from src.database.rollups import get_dashboard_summary
+from src.utils.resource_sampler import get_resource_sampler
+from src.utils.shared_cache import get_shared_cache
+from src.utils.profiling import timed
 
+# 시스템 상태 차트에 표시할 최근 샘플 수
+RESOURCE_HISTORY_POINTS = 60
+
+# 부분 갱신(fragment) 주기 (초) - 지표는 공유 캐시 주기에 맞춤
+METRICS_REFRESH_SECONDS = 30
+# 지표 캐시가 만료된 뒤 이전 값을 계속 보여주며 백그라운드 갱신할 수 있는 기간 (초)
+METRICS_STALE_SECONDS = 300
+SYSTEM_STATUS_REFRESH_SECONDS = 10
+
+def _load_dashboard_summary():
+    """롤업 테이블 기반 대시보드 지표 (세션 간 공유 캐시, 30초 후 백그라운드 갱신)"""
+    try:
+        return get_shared_cache().get_or_compute(
+            'dashboard:summary', get_dashboard_summary,
+            ttl=METRICS_REFRESH_SECONDS, stale_ttl=METRICS_STALE_SECONDS
+        )
+    except Exception:
+        return None
+
+@timed('dashboard.metrics')
 def render_metrics():
     """메트릭스 렌더링"""
     st.markdown("### 📊 주요 지표")
     
-    # 실시간 데이터 시뮬레이션
+    _render_metric_cards()
+    
+    # 추가 통계 정보
+    _render_additional_stats()
+
+@st.fragment(run_every=METRICS_REFRESH_SECONDS)
+@timed('dashboard.metric_cards')
+def _render_metric_cards():
+    """주요 지표 카드 (주기적으로 이 영역만 갱신)"""
+    summary = _load_dashboard_summary()
+    if summary is None:
+        st.info("지표 데이터를 불러올 수 없습니다. (DB 미설정 또는 롤업 미실행)")
+        summary = {}
+    
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
-        total_users = _get_random_metric(1000, 1500)
-        user_change = _get_random_change(-5, 15)
         st.metric(
             "총 사용자", 
-            f"{total_users:,}", 
-            f"{user_change:+d}",
-            help="플랫폼에 등록된 총 사용자 수"
+            f"{summary.get('total_users', 0):,}", 
+            f"{summary.get('total_users_change', 0):+d}",
+            help="플랫폼에 등록된 총 사용자 수 (전일 대비)"
         )
     
     with col2:
-        daily_visitors = _get_random_metric(200, 800)
-        visitor_change = _get_random_change(-10, 20)
         st.metric(
             "오늘 방문자", 
-            f"{daily_visitors:,}", 
-            f"{visitor_change:+d}",
-            help="오늘 플랫폼에 접속한 순 방문자 수"
+            f"{summary.get('today_visitors', 0):,}", 
+            f"{summary.get('today_visitors_change', 0):+d}",
+            help="오늘 플랫폼에 접속한 순 방문자 수 (전일 대비)"
         )
     
     with col3:
-        active_sessions = _get_random_metric(50, 150)
-        session_change = _get_random_change(-5, 10)
         st.metric(
             "활성 세션", 
-            f"{active_sessions:,}", 
-            f"{session_change:+d}",
-            help="현재 활성화된 사용자 세션 수"
+            f"{summary.get('active_sessions', 0):,}", 
+            f"{summary.get('active_sessions_change', 0):+d}",
+            help="현재 활성화된 사용자 세션 수 (1시간 전 대비)"
         )
     
     with col4:
-        response_time = _get_random_metric(150, 350) / 100
-        time_change = _get_random_change(-50, 30) / 100
+        response_time = summary.get('response_time')
+        time_change = summary.get('response_time_change')
         st.metric(
             "평균 응답시간", 
-            f"{response_time:.2f}s", 
-            f"{time_change:+.2f}s",
-            help="시스템의 평균 응답 시간"
+            f"{response_time:.2f}s" if response_time is not None else "-", 
+            f"{time_change:+.2f}s" if time_change is not None else None,
+            delta_color="inverse",
+            help="오늘 로그인 인증 요청의 평균 응답 시간 (전일 대비)"
         )
     
-    # 추가 통계 정보
-    _render_additional_stats()
+    if summary.get('updated_at'):
+        st.caption(f"🕒 지표 집계 시각: {summary['updated_at'].astimezone().strftime('%Y-%m-%d %H:%M')}")
 
 def _render_additional_stats():
     """추가 통계 정보 렌더링"""
@@ -73,21 +105,39 @@ def _render_additional_stats():
     
     with col2:
         st.markdown("**💻 시스템 상태**")
-        
-        # CPU 사용률
-        cpu_usage = random.uniform(20, 80)
-        st.progress(cpu_usage / 100)
-        st.caption(f"CPU 사용률: {cpu_usage:.1f}%")
-        
-        # 메모리 사용률
-        memory_usage = random.uniform(40, 85)
-        st.progress(memory_usage / 100)
-        st.caption(f"메모리 사용률: {memory_usage:.1f}%")
+        _render_system_status()
+
+@st.fragment(run_every=SYSTEM_STATUS_REFRESH_SECONDS)
+@timed('dashboard.system_status')
+def _render_system_status():
+    """백그라운드 수집기의 최근 자원 사용량 표시 (메모리에서만 읽으며 주기적으로 이 영역만 갱신)"""
+    sampler = get_resource_sampler()
+    if sampler is None:
+        st.caption("psutil이 설치되지 않아 시스템 상태를 표시할 수 없습니다.")
+        return
 
-def _get_random_metric(min_val: int, max_val: int) -> int:
-    """랜덤 메트릭 값 생성"""
-    return random.randint(min_val, max_val)
+    latest = sampler.latest()
+    if latest is None:
+        st.caption("시스템 상태 수집 중...")
+        return
 
-def _get_random_change(min_change: int, max_change: int) -> int:
-    """랜덤 변화량 생성"""
-    return random.randint(min_change, max_change)
\ No newline at end of file
+    # CPU 사용률
+    cpu_usage = latest['cpu_percent']
+    st.progress(min(cpu_usage, 100.0) / 100)
+    st.caption(f"CPU 사용률: {cpu_usage:.1f}%")
+    
+    # 메모리 사용률
+    memory_usage = latest['memory_percent']
+    st.progress(min(memory_usage, 100.0) / 100)
+    st.caption(f"메모리 사용률: {memory_usage:.1f}%")
+    
+    connections = latest['process_connections']
+    connections_text = "-" if math.isnan(connections) else f"{int(connections):,}"
+    st.caption(f"앱 메모리(RSS): {latest['process_rss_mb']:,.0f}MB · 열린 연결: {connections_text}")
+    
+    history = sampler.history(RESOURCE_HISTORY_POINTS)
+    if len(history['timestamp']) > 1:
+        st.line_chart(
+            {"CPU %": history['cpu_percent'], "메모리 %": history['memory_percent']},
+            height=140
+        )
@@ -0,0 +1,283 @@
+import atexit
+import ipaddress
+import logging
+import os
+import queue
+import threading
+import time
+import uuid
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from dotenv import load_dotenv
+from sqlalchemy import insert, update
+
+from .models import LoginHistory, UserActivity
+
+logger = logging.getLogger(__name__)
+
+# 큐 항목: (작업 종류, 모델, 행 데이터)
+_Event = Tuple[str, Any, Dict[str, Any]]
+
+# INSERT 직전에 행을 보강하는 함수 (모델, 행 목록) → None
+Enricher = Callable[[Any, List[Dict[str, Any]]], None]
+
+# 종료 요청 확인 주기 (초)
+_STOP_CHECK_INTERVAL = 0.2
+
+
+class EventLogger:
+    """로그인 이력 / 사용자 활동 지연 기록(write-behind) 큐
+
+    UI 스레드는 이벤트를 메모리 큐에 넣기만 하고,
+    백그라운드 스레드가 크기 또는 시간 기준으로 모아서 일괄 INSERT 합니다.
+    """
+
+    def __init__(
+        self,
+        session_factory: Optional[Callable] = None,
+        batch_size: int = 200,
+        flush_interval: float = 2.0,
+        max_queue_size: int = 10000,
+    ):
+        self._session_factory = session_factory
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+
+        # 메모리 상한 (가득 차면 새 이벤트는 버림)
+        self._queue: "queue.Queue[_Event]" = queue.Queue(maxsize=max_queue_size)
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._stats_lock = threading.Lock()
+        self._stats = {'written': 0, 'dropped': 0, 'failed': 0, 'batches': 0}
+        self._enrichers: List[Enricher] = []
+
+    @property
+    def enabled(self) -> bool:
+        """DB가 설정되어 기록이 가능한지 여부"""
+        return self._session_factory is not None
+
+    def add_enricher(self, enricher: Enricher):
+        """INSERT 직전 행 보강 함수 등록 (지역 정보 등 UI 스레드에서 계산하지 않을 값)"""
+        self._enrichers.append(enricher)
+
+    def start(self):
+        """백그라운드 플러시 스레드 시작"""
+        if not self.enabled or self._thread is not None:
+            return
+
+        self._thread = threading.Thread(
+            target=self._run, name="event-logger", daemon=True
+        )
+        self._thread.start()
+        atexit.register(self.shutdown)
+
+    def shutdown(self, timeout: float = 10.0):
+        """남은 이벤트를 모두 기록하고 스레드 종료"""
+        if self._thread is None:
+            return
+
+        self._stop_event.set()
+        self._thread.join(timeout)
+        self._thread = None
+
+    def log_login(
+        self,
+        user_id: str,
+        username: str,
+        success: bool = True,
+        failure_reason: Optional[str] = None,
+        ip_address: Optional[str] = None,
+        user_agent: Optional[str] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """로그인 이력 기록 (로그아웃 시 갱신할 키 반환)"""
+        if not self.enabled:
+            return None
+
+        row = {
+            'id': uuid.uuid4(),
+            'user_id': user_id,
+            'username': username,
+            'login_time': _utcnow(),
+            'success': success,
+            'failure_reason': failure_reason[:500] if failure_reason else None,
+            'ip_address': _normalize_ip(ip_address),
+            'user_agent': user_agent,
+        }
+
+        if not self._enqueue('insert', LoginHistory, row):
+            return None
+
+        return {'id': row['id'], 'login_time': row['login_time']}
+
+    def log_logout(self, login_key: Dict[str, Any]):
+        """로그인 이력에 로그아웃 시간 및 세션 지속 시간 기록"""
+        if not self.enabled or not login_key:
+            return
+
+        logout_time = _utcnow()
+        row = {
+            'id': login_key['id'],
+            'login_time': login_key['login_time'],
+            'logout_time': logout_time,
+            'session_duration': logout_time - login_key['login_time'],
+        }
+        self._enqueue('update', LoginHistory, row)
+
+    def log_activity(
+        self,
+        session_id: str,
+        user_id: str,
+        activity_type: str,
+        activity_detail: Optional[Dict[str, Any]] = None,
+        page_path: Optional[str] = None,
+        ip_address: Optional[str] = None,
+        user_agent: Optional[str] = None,
+    ):
+        """사용자 활동 기록"""
+        if not self.enabled:
+            return
+
+        row = {
+            'id': uuid.uuid4(),
+            'session_id': session_id,
+            'user_id': user_id,
+            'activity_type': activity_type,
+            'activity_detail': activity_detail or {},
+            'page_path': page_path,
+            'timestamp': _utcnow(),
+            'ip_address': _normalize_ip(ip_address),
+            'user_agent': user_agent,
+        }
+        self._enqueue('insert', UserActivity, row)
+
+    def get_stats(self) -> Dict[str, int]:
+        """기록 통계 반환"""
+        with self._stats_lock:
+            stats = dict(self._stats)
+        stats['queued'] = self._queue.qsize()
+        return stats
+
+    def _enqueue(self, op: str, model, row: Dict[str, Any]) -> bool:
+        """큐에 이벤트 추가 (UI 스레드를 절대 블로킹하지 않음)"""
+        try:
+            self._queue.put_nowait((op, model, row))
+            return True
+        except queue.Full:
+            self._add_stat('dropped', 1)
+            return False
+
+    def _run(self):
+        """크기 또는 시간 임계값에 도달하면 일괄 기록"""
+        batch: List[_Event] = []
+        deadline = time.monotonic() + self.flush_interval
+
+        while True:
+            stopping = self._stop_event.is_set()
+            # 빈 큐에서 flush_interval 내내 기다리면 shutdown()이 join 시간 초과까지 멈추므로 짧게 나눠 대기
+            timeout = min(max(0.0, deadline - time.monotonic()), _STOP_CHECK_INTERVAL)
+
+            try:
+                batch.append(self._queue.get(timeout=0 if stopping else timeout))
+            except queue.Empty:
+                pass
+
+            if len(batch) >= self.batch_size or time.monotonic() >= deadline or (stopping and self._queue.empty()):
+                if batch:
+                    self._write(batch)
+                    batch = []
+                deadline = time.monotonic() + self.flush_interval
+
+                if stopping and self._queue.empty():
+                    return
+
+    def _write(self, batch: List[_Event]):
+        """이벤트 묶음을 모델별로 나누어 일괄 INSERT / UPDATE"""
+        grouped: Dict[Tuple[str, Any], List[Dict[str, Any]]] = {}
+        for op, model, row in batch:
+            grouped.setdefault((op, model), []).append(row)
+
+        # 같은 묶음 안에서는 INSERT가 UPDATE보다 먼저 실행되어야 함
+        ordered = sorted(grouped.items(), key=lambda item: item[0][0] != 'insert')
+
+        for (op, model), rows in ordered:
+            if op != 'insert':
+                continue
+            for enricher in self._enrichers:
+                try:
+                    enricher(model, rows)
+                except Exception:
+                    logger.exception("이벤트 보강 실패 (%s)", model.__tablename__)
+
+        try:
+            with self._session_factory() as session:
+                for (op, model), rows in ordered:
+                    if op == 'insert':
+                        session.execute(insert(model), rows)
+                    else:
+                        session.execute(update(model), rows)
+                session.commit()
+
+            self._add_stat('written', len(batch))
+            self._add_stat('batches', 1)
+        except Exception:
+            logger.exception("이벤트 %d건 기록 실패", len(batch))
+            self._add_stat('failed', len(batch))
+
+    def _add_stat(self, key: str, value: int):
+        with self._stats_lock:
+            self._stats[key] += value
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def _normalize_ip(ip_address: Optional[str]) -> Optional[str]:
+    """INET 컬럼에 넣을 수 없는 값은 None 처리 (배치 전체 실패 방지)"""
+    if not ip_address:
+        return None
+    try:
+        return str(ipaddress.ip_address(ip_address.strip()))
+    except ValueError:
+        return None
+
+
+_event_logger: Optional[EventLogger] = None
+_event_logger_lock = threading.Lock()
+
+
+def get_event_logger() -> EventLogger:
+    """프로세스 단위 이벤트 로거 반환 (DATABASE_URL이 없으면 비활성)"""
+    global _event_logger
+
+    with _event_logger_lock:
+        if _event_logger is None:
+            load_dotenv()
+
+            if os.getenv("DATABASE_URL"):
+                from .supabase_client import SessionLocal
+
+                from src.utils.geoip import enrich_login_locations, get_geoip_index
+                from src.utils.user_agent import enrich_user_agents
+
+                _event_logger = EventLogger(
+                    SessionLocal,
+                    batch_size=int(os.getenv("EVENT_LOG_BATCH_SIZE", "200")),
+                    flush_interval=float(os.getenv("EVENT_LOG_FLUSH_INTERVAL", "2.0")),
+                    max_queue_size=int(os.getenv("EVENT_LOG_MAX_QUEUE", "10000")),
+                )
+
+                # User-Agent → 브라우저 / OS / 기기 유형
+                _event_logger.add_enricher(enrich_user_agents)
+
+                # 로그인 IP → 국가/도시 (로컬 인덱스가 있을 때만)
+                geoip = get_geoip_index()
+                if geoip is not None:
+                    _event_logger.add_enricher(enrich_login_locations(geoip))
+
+                _event_logger.start()
+            else:
+                _event_logger = EventLogger(None)
+
+        return _event_logger
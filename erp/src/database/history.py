@@ -0,0 +1,128 @@
+import uuid
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy import select, tuple_
+
+from .json_filters import jsonb_conditions
+from .models import CognitoUser, LoginHistory, UserActivity
+
+# keyset 커서: 마지막으로 본 행의 (시간, id)
+HistoryCursor = Tuple[datetime, uuid.UUID]
+
+
+def _session_factory(session_factory):
+    if session_factory is not None:
+        return session_factory
+
+    from .supabase_client import SessionLocal, engine
+
+    return SessionLocal if engine is not None else None
+
+
+def resolve_user_ids(user: Optional[str], session_factory=None) -> List[str]:
+    """사용자 ID 또는 사용자명을 기록에 쓰이는 user_id 후보 목록으로 변환
+
+    로그인 성공/활동은 Cognito sub를, 로그인 실패는 입력한 사용자명을 user_id로 기록하므로
+    캐시된 디렉터리에서 sub를 찾아 함께 조회합니다.
+    """
+    if not user or not user.strip():
+        return []
+
+    user = user.strip()
+    user_ids = [user]
+
+    session_factory = _session_factory(session_factory)
+    with session_factory() as session:
+        user_id = session.scalar(select(CognitoUser.user_id).where(CognitoUser.username == user))
+
+    if user_id and user_id != user:
+        user_ids.append(user_id)
+    return user_ids
+
+
+def _seek_page(
+    model,
+    time_column,
+    conditions: list,
+    after: Optional[HistoryCursor],
+    limit: int,
+    session_factory,
+) -> Tuple[list, Optional[HistoryCursor]]:
+    """(시간, id) 내림차순 keyset 페이지 조회
+
+    OFFSET 없이 마지막 행의 (시간, id)보다 작은 행부터 읽으므로
+    (…, 시간, id) 복합 인덱스를 역순으로 limit개만 훑고 끝납니다.
+    """
+    if after is not None:
+        conditions = [*conditions, tuple_(time_column, model.id) < tuple_(*after)]
+
+    session_factory = _session_factory(session_factory)
+    with session_factory() as session:
+        # 다음 페이지 존재 여부 확인을 위해 한 행 더 조회
+        rows = session.scalars(
+            select(model)
+            .where(*conditions)
+            .order_by(time_column.desc(), model.id.desc())
+            .limit(limit + 1)
+        ).all()
+
+    rows, has_more = list(rows[:limit]), len(rows) > limit
+    if not has_more:
+        return rows, None
+
+    last = rows[-1]
+    return rows, (getattr(last, time_column.key), last.id)
+
+
+def fetch_login_history(
+    user_ids: Sequence[str] = (),
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    success: Optional[bool] = None,
+    after: Optional[HistoryCursor] = None,
+    limit: int = 100,
+    session_factory=None,
+) -> Tuple[List[LoginHistory], Optional[HistoryCursor]]:
+    """로그인 이력 페이지 조회 (다음 페이지 커서 함께 반환, 마지막 페이지면 None)"""
+    conditions = []
+    if user_ids:
+        conditions.append(LoginHistory.user_id.in_(user_ids))
+    if start is not None:
+        conditions.append(LoginHistory.login_time >= start)
+    if end is not None:
+        conditions.append(LoginHistory.login_time < end)
+    if success is True:
+        conditions.append(LoginHistory.success.is_(True))
+    elif success is False:
+        # 부분 인덱스(ix_login_history_failed_time_id) 조건과 같은 형태로 작성
+        conditions.append(~LoginHistory.success)
+
+    return _seek_page(LoginHistory, LoginHistory.login_time, conditions, after, limit, session_factory)
+
+
+def fetch_user_activities(
+    user_ids: Sequence[str] = (),
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    activity_type: Optional[str] = None,
+    detail_filters: Optional[Dict[str, Any]] = None,
+    after: Optional[HistoryCursor] = None,
+    limit: int = 100,
+    session_factory=None,
+) -> Tuple[List[UserActivity], Optional[HistoryCursor]]:
+    """사용자 활동 페이지 조회 (다음 페이지 커서 함께 반환, 마지막 페이지면 None)"""
+    conditions = []
+    if user_ids:
+        conditions.append(UserActivity.user_id.in_(user_ids))
+    if start is not None:
+        conditions.append(UserActivity.timestamp >= start)
+    if end is not None:
+        conditions.append(UserActivity.timestamp < end)
+    if activity_type:
+        conditions.append(UserActivity.activity_type == activity_type)
+    if detail_filters:
+        # activity_detail GIN 인덱스를 쓰는 @> 포함 조건
+        conditions.extend(jsonb_conditions(UserActivity.activity_detail, equals=detail_filters))
+
+    return _seek_page(UserActivity, UserActivity.timestamp, conditions, after, limit, session_factory)
@@ -0,0 +1,92 @@
+import copy
+import json
+from typing import Any, Dict, Iterable, List, Optional
+
+from sqlalchemy import or_
+
+
+def _nest(path: str, value: Any) -> Dict[str, Any]:
+    """점 표기 경로를 중첩 딕셔너리로 변환 ('a.b', 1 → {'a': {'b': 1}})"""
+    keys = [key for key in path.split('.') if key]
+    if not keys:
+        raise ValueError(f"잘못된 JSON 경로입니다: {path!r}")
+
+    document: Any = value
+    for key in reversed(keys):
+        document = {key: document}
+    return document
+
+
+def _merge(target: Dict[str, Any], source: Dict[str, Any]):
+    for key, value in source.items():
+        if isinstance(value, dict) and isinstance(target.get(key), dict):
+            _merge(target[key], value)
+        else:
+            target[key] = value
+
+
+def containment_document(filters: Dict[str, Any]) -> Dict[str, Any]:
+    """경로/값 조건들을 하나의 @> 포함 문서로 병합"""
+    document: Dict[str, Any] = {}
+    for path, value in filters.items():
+        _merge(document, _nest(path, value))
+    return document
+
+
+def jsonb_conditions(
+    column,
+    equals: Optional[Dict[str, Any]] = None,
+    contains: Optional[Any] = None,
+    any_of: Optional[Dict[str, Iterable[Any]]] = None,
+) -> List[Any]:
+    """JSONB 컬럼 필터를 GIN(jsonb_path_ops) 인덱스를 쓰는 @> 조건으로 변환
+
+    - equals: {'feature': 'analytics', 'meta.source': 'web'} 처럼 경로별 값 일치
+      (값이 리스트면 배열이 해당 원소들을 모두 포함하는지 검사)
+    - contains: 포함 여부를 검사할 JSON 객체를 그대로 지정
+    - any_of: {'feature': ['a', 'b']} 처럼 경로 값이 후보 중 하나인지 검사
+
+    ->> 로 꺼내 비교하면 인덱스를 쓰지 못하므로 모든 조건을 포함 연산으로 표현합니다.
+    """
+    conditions = []
+
+    document = containment_document(equals or {})
+    if contains:
+        _merge(document, copy.deepcopy(contains))
+    if document:
+        conditions.append(column.contains(document))
+
+    for path, candidates in (any_of or {}).items():
+        candidates = list(candidates)
+        if candidates:
+            conditions.append(or_(*(column.contains(_nest(path, candidate)) for candidate in candidates)))
+
+    return conditions
+
+
+def parse_filter_expression(expression: str) -> Dict[str, Any]:
+    """'key=value, a.b=1' 형태의 입력을 경로/값 딕셔너리로 변환
+
+    값은 JSON으로 해석되면(숫자, true/false, null, 배열) 그 값을, 아니면 문자열을 사용합니다.
+    """
+    filters: Dict[str, Any] = {}
+    if not expression or not expression.strip():
+        return filters
+
+    for part in expression.split(','):
+        if not part.strip():
+            continue
+        if '=' not in part:
+            raise ValueError(f"'키=값' 형식이 아닙니다: {part.strip()!r}")
+
+        path, raw_value = (item.strip() for item in part.split('=', 1))
+        if not path:
+            raise ValueError(f"키가 비어 있습니다: {part.strip()!r}")
+
+        try:
+            value = json.loads(raw_value)
+        except ValueError:
+            value = raw_value
+        filters[path] = value
+
+    return filters
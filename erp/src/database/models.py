@@ -1,6 +1,6 @@
 import uuid
-from sqlalchemy import Column, String, Boolean, DateTime, JSON, Interval, Text
-from sqlalchemy.dialects.postgresql import UUID, INET
+from sqlalchemy import Column, String, Boolean, DateTime, Date, JSON, Interval, Text, Index, DDL, event, Integer, Float, text
+from sqlalchemy.dialects.postgresql import UUID, INET, JSONB
 from sqlalchemy.sql import func
 from .supabase_client import Base
 
@@ -17,31 +17,74 @@ class UserSession(Base):
     email = Column(String(255))
     access_token = Column(Text)
     refresh_token = Column(Text)
-    user_attributes = Column(JSON, default={})
+    user_attributes = Column(JSONB, default={})
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
     expires_at = Column(DateTime(timezone=True), nullable=False)
     is_active = Column(Boolean, default=True)
     user_agent = Column(Text)
+    # user_agent를 기록 시점에 한 번 분류한 값 (리포트 GROUP BY용)
+    browser = Column(String(50))
+    os = Column(String(50))
+    device_type = Column(String(20))
     ip_address = Column(INET)
     login_method = Column(String(50), default="cognito")
 
 
+# 사용자별 활성 세션 조회 (session_id까지 인덱스에 포함하여 index-only scan)
+Index(
+    "ix_user_sessions_user_active",
+    UserSession.user_id,
+    UserSession.expires_at,
+    postgresql_where=UserSession.is_active.is_(True),
+    postgresql_include=["session_id"],
+)
+# 만료 세션 정리용 (활성 세션만 대상으로 하여 인덱스 크기 최소화)
+Index(
+    "ix_user_sessions_active_expires",
+    UserSession.expires_at,
+    postgresql_where=UserSession.is_active.is_(True),
+)
+# user_attributes @> '{...}' 포함 검색용
+Index(
+    "ix_user_sessions_attributes_gin",
+    UserSession.user_attributes,
+    postgresql_using="gin",
+    postgresql_ops={"user_attributes": "jsonb_path_ops"},
+)
+# 기기 / OS / 브라우저별 집계용
+Index("ix_user_sessions_device", UserSession.device_type, UserSession.os, UserSession.browser)
+
+
 # ---------------------------
 # 2. 로그인 이력 테이블
 # ---------------------------
 class LoginHistory(Base):
     __tablename__ = "login_history"
+    # login_time 기준 월별 RANGE 파티션 (파티션 키는 기본키에 포함되어야 함)
+    # (시간, id) 복합 인덱스는 이력 조회 화면의 keyset 페이지네이션용
+    __table_args__ = (
+        Index("ix_login_history_time_id", "login_time", "id"),
+        Index("ix_login_history_user_time_id", "user_id", "login_time", "id"),
+        Index("ix_login_history_failed_time_id", "login_time", "id", postgresql_where=text("NOT success")),
+        # 기기 / OS / 브라우저별 집계용
+        Index("ix_login_history_device", "device_type", "os", "browser"),
+        {"postgresql_partition_by": "RANGE (login_time)"},
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     user_id = Column(String(255), nullable=False)
     username = Column(String(255), nullable=False)
-    login_time = Column(DateTime(timezone=True), server_default=func.now())
+    login_time = Column(DateTime(timezone=True), primary_key=True, server_default=func.now())
     logout_time = Column(DateTime(timezone=True))
     success = Column(Boolean, default=True, nullable=False)
     failure_reason = Column(String(500))
     ip_address = Column(INET)
     user_agent = Column(Text)
+    # user_agent를 기록 시점에 한 번 분류한 값 (리포트 GROUP BY용)
+    browser = Column(String(50))
+    os = Column(String(50))
+    device_type = Column(String(20))
     session_duration = Column(Interval)
     location_country = Column(String(100))
     location_city = Column(String(100))
@@ -52,16 +95,32 @@ class LoginHistory(Base):
 # ---------------------------
 class UserActivity(Base):
     __tablename__ = "user_activities"
+    # timestamp 기준 월별 RANGE 파티션 (파티션 키는 기본키에 포함되어야 함)
+    # (시간, id) 복합 인덱스는 이력 조회 화면의 keyset 페이지네이션용
+    __table_args__ = (
+        Index("ix_user_activities_time_id", "timestamp", "id"),
+        Index("ix_user_activities_user_time_id", "user_id", "timestamp", "id"),
+        Index("ix_user_activities_type_time_id", "activity_type", "timestamp", "id"),
+        Index("ix_user_activities_device", "device_type", "os", "browser"),
+        # activity_detail @> '{...}' 포함 검색용
+        Index("ix_user_activities_detail_gin", "activity_detail",
+              postgresql_using="gin", postgresql_ops={"activity_detail": "jsonb_path_ops"}),
+        {"postgresql_partition_by": "RANGE (timestamp)"},
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     session_id = Column(String(255), nullable=False)
     user_id = Column(String(255), nullable=False)
     activity_type = Column(String(100), nullable=False)
-    activity_detail = Column(JSON, default={})
+    activity_detail = Column(JSONB, default={})
     page_path = Column(String(500))
-    timestamp = Column(DateTime(timezone=True), server_default=func.now())
+    timestamp = Column(DateTime(timezone=True), primary_key=True, server_default=func.now())
     ip_address = Column(INET)
     user_agent = Column(Text)
+    # user_agent를 기록 시점에 한 번 분류한 값 (리포트 GROUP BY용)
+    browser = Column(String(50))
+    os = Column(String(50))
+    device_type = Column(String(20))
 
 
 # ---------------------------
@@ -69,13 +128,137 @@ class UserActivity(Base):
 # ---------------------------
 class SystemSetting(Base):
     __tablename__ = "system_settings"
+    __table_args__ = (
+        # setting_value @> '{...}' 포함 검색용
+        Index("ix_system_settings_value_gin", "setting_value",
+              postgresql_using="gin", postgresql_ops={"setting_value": "jsonb_path_ops"}),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     setting_key = Column(String(255), unique=True, nullable=False)
-    setting_value = Column(JSON, nullable=False)
+    setting_value = Column(JSONB, nullable=False)
     description = Column(Text)
     category = Column(String(100), default="general")
     is_active = Column(Boolean, default=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
-    updated_by = Column(String(255))
\ No newline at end of file
+    updated_by = Column(String(255))
+
+
+# 설정 변경 알림 채널 / 버전 카운터 (SettingsCache가 LISTEN 또는 폴링으로 감지)
+# 버전은 한 행짜리 테이블에 두어 설정 변경과 같은 트랜잭션이 커밋될 때에만 보이게 함
+# (시퀀스는 커밋 전에 증가가 보여서, 새 버전과 커밋 전의 이전 설정을 함께 읽을 수 있음)
+SYSTEM_SETTINGS_CHANNEL = "system_settings_changed"
+SYSTEM_SETTINGS_VERSION_TABLE = "system_settings_version"
+
+SYSTEM_SETTINGS_NOTIFY_DDL = [
+    f"""
+    CREATE TABLE IF NOT EXISTS {SYSTEM_SETTINGS_VERSION_TABLE} (
+        id smallint PRIMARY KEY DEFAULT 1 CHECK (id = 1),
+        version bigint NOT NULL DEFAULT 0
+    )
+    """,
+    f"INSERT INTO {SYSTEM_SETTINGS_VERSION_TABLE} (id, version) VALUES (1, 0) ON CONFLICT (id) DO NOTHING",
+    f"""
+    CREATE OR REPLACE FUNCTION notify_system_settings_change() RETURNS trigger AS $$
+    BEGIN
+        UPDATE {SYSTEM_SETTINGS_VERSION_TABLE} SET version = version + 1 WHERE id = 1;
+        PERFORM pg_notify('{SYSTEM_SETTINGS_CHANNEL}', COALESCE(NEW.setting_key, OLD.setting_key));
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql
+    """,
+    "DROP TRIGGER IF EXISTS system_settings_notify ON system_settings",
+    """
+    CREATE TRIGGER system_settings_notify
+    AFTER INSERT OR UPDATE OR DELETE ON system_settings
+    FOR EACH ROW EXECUTE FUNCTION notify_system_settings_change()
+    """,
+]
+
+for _statement in SYSTEM_SETTINGS_NOTIFY_DDL:
+    event.listen(SystemSetting.__table__, "after_create", DDL(_statement).execute_if(dialect="postgresql"))
+
+
+# ---------------------------
+# 5. Cognito 사용자 디렉터리 캐시 테이블
+# ---------------------------
+class CognitoUser(Base):
+    __tablename__ = "cognito_users"
+    __table_args__ = (
+        Index("ix_cognito_users_status", "user_status", "enabled"),
+    )
+
+    username = Column(String(255), primary_key=True)
+    user_id = Column(String(255), index=True)
+    email = Column(String(255))
+    given_name = Column(String(255))
+    family_name = Column(String(255))
+    phone_number = Column(String(50))
+    user_status = Column(String(50))
+    enabled = Column(Boolean, default=True)
+    attributes = Column(JSON, default={})
+    user_created_at = Column(DateTime(timezone=True))
+    user_modified_at = Column(DateTime(timezone=True))
+    synced_at = Column(DateTime(timezone=True), server_default=func.now())
+
+
+# 대소문자 무시 접두어 검색(LIKE 'abc%')용 인덱스
+Index(
+    "ix_cognito_users_username_lower",
+    func.lower(CognitoUser.username).label("username_lower"),
+    postgresql_ops={"username_lower": "text_pattern_ops"},
+)
+Index(
+    "ix_cognito_users_email_lower",
+    func.lower(CognitoUser.email).label("email_lower"),
+    postgresql_ops={"email_lower": "text_pattern_ops"},
+)
+
+
+# ---------------------------
+# 6. 대시보드 지표 롤업 테이블 (RollupJob이 워터마크 이후 행만 누적 반영)
+# ---------------------------
+class HourlyMetric(Base):
+    __tablename__ = "metrics_hourly"
+
+    bucket_start = Column(DateTime(timezone=True), primary_key=True)
+    logins = Column(Integer, nullable=False, default=0)
+    login_failures = Column(Integer, nullable=False, default=0)
+    page_views = Column(Integer, nullable=False, default=0)
+    activities = Column(Integer, nullable=False, default=0)
+    response_ms_sum = Column(Float, nullable=False, default=0)
+    response_count = Column(Integer, nullable=False, default=0)
+    active_sessions = Column(Integer)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+
+class DailyMetric(Base):
+    __tablename__ = "metrics_daily"
+
+    day = Column(Date, primary_key=True)
+    logins = Column(Integer, nullable=False, default=0)
+    login_failures = Column(Integer, nullable=False, default=0)
+    page_views = Column(Integer, nullable=False, default=0)
+    activities = Column(Integer, nullable=False, default=0)
+    response_ms_sum = Column(Float, nullable=False, default=0)
+    response_count = Column(Integer, nullable=False, default=0)
+    unique_visitors = Column(Integer, nullable=False, default=0)
+    total_users = Column(Integer)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+
+class DailyVisitor(Base):
+    """일별 순 방문자 집계용 (day, user_id) 집합"""
+    __tablename__ = "metrics_daily_visitors"
+
+    day = Column(Date, primary_key=True)
+    user_id = Column(String(255), primary_key=True)
+
+
+class RollupWatermark(Base):
+    __tablename__ = "rollup_watermarks"
+
+    name = Column(String(100), primary_key=True)
+    watermark = Column(DateTime(timezone=True), nullable=False)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
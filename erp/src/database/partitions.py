@@ -0,0 +1,225 @@
+import logging
+import os
+import re
+from datetime import date, datetime, timezone
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import text
+
+logger = logging.getLogger(__name__)
+
+# 월별 RANGE 파티션 대상 테이블: 테이블명 → (파티션 키 컬럼, 기본 보존 개월 수)
+PARTITIONED_TABLES: Dict[str, Tuple[str, int]] = {
+    'user_activities': ('timestamp', 12),
+    'login_history': ('login_time', 24),
+}
+
+_PARTITION_NAME_PATTERN = re.compile(r'^(?P<table>.+)_p(?P<year>\d{4})(?P<month>\d{2})$')
+
+
+def partition_name(table: str, month_start: date) -> str:
+    """월 파티션 이름 (예: user_activities_p202401)"""
+    return f"{table}_p{month_start:%Y%m}"
+
+
+def default_partition_name(table: str) -> str:
+    """범위 밖 행을 받는 기본 파티션 이름"""
+    return f"{table}_default"
+
+
+def is_partition_table_name(name: str) -> bool:
+    """파티션 자식 테이블 여부 (Alembic autogenerate 제외용)"""
+    for table in PARTITIONED_TABLES:
+        if name == default_partition_name(table):
+            return True
+    match = _PARTITION_NAME_PATTERN.match(name)
+    return bool(match and match.group('table') in PARTITIONED_TABLES)
+
+
+def add_months(month_start: date, months: int) -> date:
+    index = month_start.year * 12 + month_start.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def current_month(now: Optional[datetime] = None) -> date:
+    now = now or datetime.now(timezone.utc)
+    return date(now.year, now.month, 1)
+
+
+def _bound(month_start: date) -> str:
+    return f"{month_start:%Y-%m-%d} 00:00:00+00"
+
+
+def list_partitions(connection, table: str) -> List[str]:
+    """테이블에 붙어 있는 모든 자식 파티션 이름 (기본 파티션 포함)"""
+    return list(connection.execute(text("""
+        SELECT child.relname
+        FROM pg_inherits
+        JOIN pg_class parent ON parent.oid = pg_inherits.inhparent
+        JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+        WHERE parent.relname = :table
+        ORDER BY child.relname
+    """), {'table': table}).scalars().all())
+
+
+def list_month_partitions(connection, table: str) -> List[date]:
+    """테이블에 붙어 있는 월 파티션의 시작일 목록"""
+    months = []
+    for name in list_partitions(connection, table):
+        match = _PARTITION_NAME_PATTERN.match(name)
+        if match and match.group('table') == table:
+            months.append(date(int(match.group('year')), int(match.group('month')), 1))
+    return sorted(months)
+
+
+def create_default_partition(connection, table: str):
+    """기본 파티션 생성 (미리 만들지 않은 기간의 행이 INSERT 실패하지 않도록)"""
+    connection.execute(text(
+        f'CREATE TABLE IF NOT EXISTS "{default_partition_name(table)}" PARTITION OF "{table}" DEFAULT'
+    ))
+
+
+def create_month_partition(connection, table: str, month_start: date) -> bool:
+    """월 파티션 생성 (기본 파티션에 해당 기간 행이 있으면 옮긴 뒤 연결)"""
+    column, _ = PARTITIONED_TABLES[table]
+    name = partition_name(table, month_start)
+    start, end = _bound(month_start), _bound(add_months(month_start, 1))
+
+    if month_start in list_month_partitions(connection, table):
+        return False
+
+    default_name = default_partition_name(table)
+    has_default = connection.execute(text("SELECT to_regclass(:name) IS NOT NULL"), {'name': default_name}).scalar()
+    has_stray_rows = has_default and connection.execute(text(
+        f'SELECT EXISTS (SELECT 1 FROM "{default_name}" WHERE "{column}" >= :start AND "{column}" < :end)'
+    ), {'start': start, 'end': end}).scalar()
+
+    if not has_stray_rows:
+        connection.execute(text(
+            f"""CREATE TABLE "{name}" PARTITION OF "{table}" FOR VALUES FROM ('{start}') TO ('{end}')"""
+        ))
+        return True
+
+    # 기본 파티션에 같은 기간 행이 있으면 PARTITION OF가 실패하므로 옮긴 후 ATTACH
+    connection.execute(text(f'CREATE TABLE "{name}" (LIKE "{table}" INCLUDING DEFAULTS INCLUDING CONSTRAINTS)'))
+    connection.execute(text(f"""
+        WITH moved AS (
+            DELETE FROM "{default_name}" WHERE "{column}" >= :start AND "{column}" < :end RETURNING *
+        )
+        INSERT INTO "{name}" SELECT * FROM moved
+    """), {'start': start, 'end': end})
+    connection.execute(text(
+        f"""ALTER TABLE "{table}" ATTACH PARTITION "{name}" FOR VALUES FROM ('{start}') TO ('{end}')"""
+    ))
+    return True
+
+
+def ensure_partitions(connection, table: str, months_ahead: int = 3, start_month: Optional[date] = None) -> List[str]:
+    """start_month(기본: 이번 달)부터 months_ahead개월 뒤까지 파티션 생성"""
+    create_default_partition(connection, table)
+
+    this_month = current_month()
+    month = start_month or this_month
+    created = []
+    while month <= add_months(this_month, months_ahead):
+        if create_month_partition(connection, table, month):
+            created.append(partition_name(table, month))
+        month = add_months(month, 1)
+    return created
+
+
+def create_partitioned_index(
+    connection,
+    table: str,
+    index_name: str,
+    columns: str,
+    where: Optional[str] = None,
+    using: Optional[str] = None,
+):
+    """파티션 테이블 인덱스를 잠금 없이 생성
+
+    부모에는 ON ONLY로 빈 인덱스를 만들고, 파티션마다 CONCURRENTLY로 만든 인덱스를 ATTACH 합니다.
+    CONCURRENTLY를 쓰므로 autocommit 커넥션에서 호출해야 합니다.
+    """
+    where_clause = f" WHERE {where}" if where else ""
+    using_clause = f" USING {using}" if using else ""
+    connection.execute(text(
+        f'CREATE INDEX IF NOT EXISTS "{index_name}" ON ONLY "{table}"{using_clause} ({columns}){where_clause}'
+    ))
+
+    for child in list_partitions(connection, table):
+        # create_all / 파티션 생성 시 자동으로 만들어져 이미 붙은 파티션 인덱스가 있으면 건너뜀
+        already_attached = connection.execute(text("""
+            SELECT EXISTS (
+                SELECT 1 FROM pg_inherits
+                JOIN pg_index ON pg_index.indexrelid = pg_inherits.inhrelid
+                WHERE pg_inherits.inhparent = CAST(:parent AS regclass)
+                  AND pg_index.indrelid = CAST(:child AS regclass)
+            )
+        """), {'parent': f'"{index_name}"', 'child': f'"{child}"'}).scalar()
+        if already_attached:
+            continue
+
+        child_index = f"{child}_{index_name.removeprefix(f'ix_{table}_')}_idx"
+        connection.execute(text(
+            f'CREATE INDEX CONCURRENTLY IF NOT EXISTS "{child_index}" ON "{child}"{using_clause} ({columns}){where_clause}'
+        ))
+        connection.execute(text(f'ALTER INDEX "{index_name}" ATTACH PARTITION "{child_index}"'))
+
+
+def expire_partitions(connection, table: str, retention_months: int, archive_schema: Optional[str] = None) -> List[str]:
+    """보존 기간이 지난 월 파티션을 분리하고 보관 스키마로 옮기거나 삭제
+
+    파티션 단위로 분리하므로 행 수와 무관하게 일정한 시간에 끝납니다.
+    """
+    cutoff = add_months(current_month(), -retention_months)
+    expired = []
+
+    for month_start in list_month_partitions(connection, table):
+        if month_start >= cutoff:
+            continue
+
+        name = partition_name(table, month_start)
+        connection.execute(text(f'ALTER TABLE "{table}" DETACH PARTITION "{name}"'))
+
+        if archive_schema:
+            connection.execute(text(f'CREATE SCHEMA IF NOT EXISTS "{archive_schema}"'))
+            connection.execute(text(f'ALTER TABLE "{name}" SET SCHEMA "{archive_schema}"'))
+        else:
+            connection.execute(text(f'DROP TABLE "{name}"'))
+
+        expired.append(name)
+
+    return expired
+
+
+def run_maintenance(
+    engine,
+    months_ahead: int = 3,
+    retention_months: Optional[Dict[str, int]] = None,
+    archive_schema: Optional[str] = None,
+) -> Dict[str, Dict[str, List[str]]]:
+    """모든 파티션 테이블의 미래 파티션 생성 및 만료 파티션 정리"""
+    retention_months = retention_months or {}
+    report = {}
+
+    for table, (_, default_retention) in PARTITIONED_TABLES.items():
+        with engine.begin() as connection:
+            created = ensure_partitions(connection, table, months_ahead)
+        with engine.begin() as connection:
+            expired = expire_partitions(
+                connection, table, retention_months.get(table, default_retention), archive_schema
+            )
+
+        report[table] = {'created': created, 'expired': expired}
+        logger.info("파티션 유지보수 %s: 생성 %s, 만료 %s", table, created, expired)
+
+    return report
+
+
+def retention_from_env() -> Dict[str, int]:
+    """환경변수의 테이블별 보존 개월 수 (예: PARTITION_RETENTION_USER_ACTIVITIES=6)"""
+    retention = {}
+    for table, (_, default_retention) in PARTITIONED_TABLES.items():
+        retention[table] = int(os.getenv(f"PARTITION_RETENTION_{table.upper()}", str(default_retention)))
+    return retention
@@ -0,0 +1,137 @@
+import time
+from typing import Optional
+
+from sqlalchemy import event
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+from src.utils.metrics_registry import MetricsRegistry, get_registry
+from src.utils.tracing import get_tracer
+
+# 커넥션 레코드 info 딕셔너리에 저장하는 키
+_CREATED_AT = '_metrics_created_at'
+_CHECKED_OUT_AT = '_metrics_checked_out_at'
+
+# Connection info 딕셔너리에 저장하는 쿼리 시작 시각 (trace 구간 기록용)
+_QUERY_STARTED_AT = '_trace_query_started_at'
+
+
+class _CheckoutWaitTimingMixin:
+    """풀에서 커넥션을 얻기까지 대기한 시간 측정"""
+
+    metrics_prefix = 'db.pool'
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            get_registry().histogram(
+                f'{self.metrics_prefix}.checkout_wait_ms', '커넥션 획득 대기 시간(ms)'
+            ).observe((time.perf_counter() - started) * 1000)
+
+
+class InstrumentedQueuePool(_CheckoutWaitTimingMixin, QueuePool):
+    """대기 시간 측정이 추가된 QueuePool"""
+
+
+class InstrumentedAsyncQueuePool(_CheckoutWaitTimingMixin, AsyncAdaptedQueuePool):
+    """대기 시간 측정이 추가된 AsyncAdaptedQueuePool"""
+
+
+def instrument_engine(engine, name: str = 'sync', registry: Optional[MetricsRegistry] = None):
+    """엔진 풀 이벤트에 메트릭 수집 리스너 연결"""
+    registry = registry or get_registry()
+    pool = engine.pool
+    prefix = f'db.pool.{name}'
+
+    if isinstance(pool, _CheckoutWaitTimingMixin):
+        pool.metrics_prefix = prefix
+
+    connections_created = registry.counter(f'{prefix}.connections_created', '새로 연결된 커넥션 수')
+    connections_closed = registry.counter(f'{prefix}.connections_closed', '종료된 커넥션 수')
+    checkouts = registry.counter(f'{prefix}.checkouts', '커넥션 대여 횟수')
+    invalidations = registry.counter(f'{prefix}.invalidations', '무효화된 커넥션 수')
+    pre_ping_failures = registry.counter(f'{prefix}.pre_ping_failures', 'pre-ping 실패 횟수')
+    connection_age = registry.histogram(f'{prefix}.connection_age_s', '대여 시점의 커넥션 나이(초)')
+    connection_lifetime = registry.histogram(f'{prefix}.connection_lifetime_s', '종료된 커넥션의 수명(초)')
+    checkout_duration = registry.histogram(f'{prefix}.checkout_duration_ms', '커넥션 점유 시간(ms)')
+    overflow_gauge = registry.gauge(f'{prefix}.overflow', '현재 사용 중인 overflow 커넥션 수')
+    registry.histogram(f'{prefix}.checkout_wait_ms', '커넥션 획득 대기 시간(ms)')
+
+    registry.gauge(f'{prefix}.size', '설정된 풀 크기', fn=lambda: pool.size())
+    registry.gauge(f'{prefix}.checked_out', '대여 중인 커넥션 수', fn=lambda: pool.checkedout())
+    registry.gauge(f'{prefix}.checked_in', '풀에서 대기 중인 커넥션 수', fn=lambda: pool.checkedin())
+
+    @event.listens_for(pool, 'connect')
+    def _on_connect(dbapi_connection, connection_record):
+        connection_record.info[_CREATED_AT] = time.monotonic()
+        connections_created.inc()
+
+    @event.listens_for(pool, 'checkout')
+    def _on_checkout(dbapi_connection, connection_record, connection_proxy):
+        now = time.monotonic()
+        checkouts.inc()
+        connection_record.info[_CHECKED_OUT_AT] = now
+        connection_age.observe(now - connection_record.info.get(_CREATED_AT, now))
+        overflow_gauge.set(max(0, pool.overflow()))
+
+    @event.listens_for(pool, 'checkin')
+    def _on_checkin(dbapi_connection, connection_record):
+        checked_out_at = connection_record.info.pop(_CHECKED_OUT_AT, None)
+        if checked_out_at is not None:
+            checkout_duration.observe((time.monotonic() - checked_out_at) * 1000)
+        overflow_gauge.set(max(0, pool.overflow()))
+
+    @event.listens_for(pool, 'invalidate')
+    def _on_invalidate(dbapi_connection, connection_record, exception):
+        invalidations.inc()
+
+    @event.listens_for(pool, 'close')
+    def _on_close(dbapi_connection, connection_record):
+        connections_closed.inc()
+        created_at = connection_record.info.get(_CREATED_AT)
+        if created_at is not None:
+            connection_lifetime.observe(time.monotonic() - created_at)
+
+    @event.listens_for(engine, 'handle_error')
+    def _on_error(context):
+        if getattr(context, 'is_pre_ping', False):
+            pre_ping_failures.inc()
+
+
+def instrument_query_tracing(engine, max_statement_length: int = 300):
+    """쿼리 실행을 현재 rerun trace의 db.query 구간으로 기록 (파라미터 값은 기록하지 않음)"""
+    tracer = get_tracer()
+
+    @event.listens_for(engine, 'before_cursor_execute')
+    def _before_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault(_QUERY_STARTED_AT, []).append((time.time(), time.perf_counter()))
+
+    @event.listens_for(engine, 'after_cursor_execute')
+    def _after_execute(conn, cursor, statement, parameters, context, executemany):
+        stack = conn.info.get(_QUERY_STARTED_AT)
+        if not stack:
+            return
+        start_time, started = stack.pop()
+        tracer.record_span(
+            'db.query',
+            start_time,
+            (time.perf_counter() - started) * 1000,
+            statement=' '.join(statement.split())[:max_statement_length],
+            rowcount=cursor.rowcount,
+            executemany=executemany,
+        )
+
+    @event.listens_for(engine, 'handle_error')
+    def _on_query_error(context):
+        stack = context.connection.info.get(_QUERY_STARTED_AT) if context.connection is not None else None
+        if not stack:
+            return
+        start_time, started = stack.pop()
+        tracer.record_span(
+            'db.query',
+            start_time,
+            (time.perf_counter() - started) * 1000,
+            statement=' '.join((context.statement or '').split())[:max_statement_length],
+            error=f"{type(context.original_exception).__name__}: {context.original_exception}"[:500],
+        )
@@ -0,0 +1,345 @@
+import atexit
+import logging
+import os
+import threading
+import time
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Dict, Optional
+
+from dotenv import load_dotenv
+from sqlalchemy import Date, cast, func, select, text
+
+from src.utils.metrics_registry import get_registry
+
+from .models import DailyMetric, HourlyMetric
+
+logger = logging.getLogger(__name__)
+
+WATERMARK_NAME = "dashboard_metrics"
+
+# 워터마크 이후 ~ hi 구간의 원본 행을 시간 단위로 집계한 증분
+_DELTA_CTE = """
+    WITH delta AS (
+        SELECT bucket,
+               sum(logins) AS logins, sum(login_failures) AS login_failures,
+               sum(page_views) AS page_views, sum(activities) AS activities,
+               sum(response_ms_sum) AS response_ms_sum, sum(response_count) AS response_count
+        FROM (
+            SELECT date_trunc('hour', login_time) AS bucket,
+                   count(*) FILTER (WHERE success) AS logins,
+                   count(*) FILTER (WHERE NOT success) AS login_failures,
+                   0 AS page_views, 0 AS activities, 0 AS response_ms_sum, 0 AS response_count
+            FROM login_history
+            WHERE login_time > :lo AND login_time <= :hi
+            GROUP BY 1
+            UNION ALL
+            SELECT date_trunc('hour', "timestamp"),
+                   0, 0,
+                   count(*) FILTER (WHERE activity_type = 'page_view'),
+                   count(*),
+                   coalesce(sum((activity_detail->>'auth_ms')::float)
+                            FILTER (WHERE activity_type = 'login' AND activity_detail->>'auth_ms' IS NOT NULL), 0),
+                   count(*) FILTER (WHERE activity_type = 'login' AND activity_detail->>'auth_ms' IS NOT NULL)
+            FROM user_activities
+            WHERE "timestamp" > :lo AND "timestamp" <= :hi
+            GROUP BY 1
+        ) raw
+        GROUP BY bucket
+    )
+"""
+
+_ADDITIVE_COLUMNS = ('logins', 'login_failures', 'page_views', 'activities', 'response_ms_sum', 'response_count')
+
+
+def _additive_update(table: str) -> str:
+    return ", ".join(f"{column} = {table}.{column} + EXCLUDED.{column}" for column in _ADDITIVE_COLUMNS)
+
+
+_COLUMNS = ", ".join(_ADDITIVE_COLUMNS)
+_SUM_COLUMNS = ", ".join(f"sum({column})" for column in _ADDITIVE_COLUMNS)
+
+# 시간/일 롤업을 원본 한 번 스캔으로 함께 갱신
+# (일 버킷은 시간 버킷에서 만들므로 정시 단위 오프셋의 시간대를 전제로 함)
+_APPLY_DELTA_SQL = _DELTA_CTE + f"""
+    , hourly AS (
+        INSERT INTO metrics_hourly (bucket_start, {_COLUMNS})
+        SELECT bucket, {_COLUMNS} FROM delta
+        ON CONFLICT (bucket_start) DO UPDATE SET {_additive_update('metrics_hourly')}, updated_at = now()
+    )
+    INSERT INTO metrics_daily (day, {_COLUMNS})
+    SELECT (bucket AT TIME ZONE :tz)::date, {_SUM_COLUMNS} FROM delta GROUP BY 1
+    ON CONFLICT (day) DO UPDATE SET {_additive_update('metrics_daily')}, updated_at = now()
+"""
+
+_DAILY_VISITORS_SQL = """
+    INSERT INTO metrics_daily_visitors (day, user_id)
+    SELECT DISTINCT (ts AT TIME ZONE :tz)::date, user_id
+    FROM (
+        SELECT login_time AS ts, user_id FROM login_history
+        WHERE success AND login_time > :lo AND login_time <= :hi
+        UNION ALL
+        SELECT "timestamp", user_id FROM user_activities
+        WHERE "timestamp" > :lo AND "timestamp" <= :hi
+    ) visits
+    ON CONFLICT DO NOTHING
+"""
+
+_UNIQUE_VISITORS_SQL = """
+    UPDATE metrics_daily
+    SET unique_visitors = (SELECT count(*) FROM metrics_daily_visitors v WHERE v.day = metrics_daily.day),
+        updated_at = now()
+    WHERE day BETWEEN (CAST(:lo AS timestamptz) AT TIME ZONE :tz)::date AND (CAST(:hi AS timestamptz) AT TIME ZONE :tz)::date
+"""
+
+# 누적 지표가 아닌 현재 값(스냅샷) 갱신
+_SNAPSHOT_SQL = [
+    """
+    INSERT INTO metrics_hourly (bucket_start, {columns}, active_sessions)
+    SELECT date_trunc('hour', now()), 0, 0, 0, 0, 0, 0,
+           (SELECT count(*) FROM user_sessions WHERE is_active IS true AND expires_at > now())
+    ON CONFLICT (bucket_start) DO UPDATE SET active_sessions = EXCLUDED.active_sessions, updated_at = now()
+    """.format(columns=_COLUMNS),
+    """
+    INSERT INTO metrics_daily (day, {columns}, unique_visitors, total_users)
+    SELECT (now() AT TIME ZONE :tz)::date, 0, 0, 0, 0, 0, 0, 0, (SELECT count(*) FROM cognito_users)
+    ON CONFLICT (day) DO UPDATE SET total_users = EXCLUDED.total_users, updated_at = now()
+    """.format(columns=_COLUMNS),
+]
+
+
+class RollupJob:
+    """대시보드 지표 롤업 증분 갱신 작업
+
+    rollup_watermarks에 기록된 시점 이후의 원본 행만 집계하여 시간/일 롤업에 더하고
+    워터마크를 같은 트랜잭션에서 전진시킵니다. 이벤트 로거의 지연 기록분을 놓치지 않도록
+    현재 시각보다 lag_seconds 이전까지만 처리합니다.
+    """
+
+    def __init__(
+        self,
+        engine,
+        interval: float = 60.0,
+        lag_seconds: float = 300.0,
+        max_window_hours: int = 24,
+        timezone_name: str = "Asia/Seoul",
+        visitor_retention_days: int = 35,
+    ):
+        self.engine = engine
+        self.interval = interval
+        self.lag = timedelta(seconds=lag_seconds)
+        # 한 트랜잭션에서 처리할 최대 구간 (초기 적재 시 트랜잭션이 길어지지 않도록)
+        self.max_window = timedelta(hours=max_window_hours)
+        self.timezone_name = timezone_name
+        self.visitor_retention_days = visitor_retention_days
+
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.last_run: Dict[str, Any] = {}
+
+        self._run_ms = get_registry().histogram('rollups.run_ms', '롤업 갱신 소요 시간(ms)')
+
+    def start(self):
+        """백그라운드 롤업 스레드 시작"""
+        if self._thread is not None:
+            return
+
+        self._thread = threading.Thread(target=self._run, name="rollup-job", daemon=True)
+        self._thread.start()
+        atexit.register(self.shutdown)
+
+    def shutdown(self, timeout: float = 5.0):
+        """롤업 스레드 종료"""
+        if self._thread is None:
+            return
+
+        self._stop_event.set()
+        self._thread.join(timeout)
+        self._thread = None
+
+    def _run(self):
+        while not self._stop_event.is_set():
+            try:
+                self.run_once()
+            except Exception:
+                logger.exception("대시보드 지표 롤업 실패")
+
+            self._stop_event.wait(self.interval)
+
+    def run_once(self) -> Dict[str, Any]:
+        """워터마크를 따라잡을 때까지 구간별 증분 반영 후 스냅샷 갱신"""
+        started = time.perf_counter()
+        stats = {'windows': 0, 'skipped': False}
+
+        while not self._stop_event.is_set():
+            result = self._apply_next_window()
+            if result is None:
+                stats['skipped'] = True
+                break
+            stats['windows'] += 1
+            if not result:
+                break
+
+        with self.engine.begin() as connection:
+            for statement in _SNAPSHOT_SQL:
+                connection.execute(text(statement), {'tz': self.timezone_name})
+            connection.execute(
+                text("DELETE FROM metrics_daily_visitors WHERE day < :cutoff"),
+                {'cutoff': date.today() - timedelta(days=self.visitor_retention_days)},
+            )
+
+        self._run_ms.observe((time.perf_counter() - started) * 1000)
+        stats['finished_at'] = datetime.now(timezone.utc)
+        self.last_run = stats
+        return stats
+
+    def _apply_next_window(self) -> Optional[bool]:
+        """다음 구간 하나를 반영 (True: 남은 구간 있음, False: 따라잡음, None: 다른 인스턴스가 처리 중)"""
+        with self.engine.begin() as connection:
+            watermark = self._lock_watermark(connection)
+            if watermark is None:
+                return None
+
+            target = connection.execute(text("SELECT now()")).scalar() - self.lag
+            hi = min(target, watermark + self.max_window)
+            if hi <= watermark:
+                return False
+
+            params = {'lo': watermark, 'hi': hi, 'tz': self.timezone_name}
+            connection.execute(text(_APPLY_DELTA_SQL), params)
+            connection.execute(text(_DAILY_VISITORS_SQL), params)
+            connection.execute(text(_UNIQUE_VISITORS_SQL), params)
+
+            connection.execute(
+                text("UPDATE rollup_watermarks SET watermark = :hi, updated_at = now() WHERE name = :name"),
+                {'hi': hi, 'name': WATERMARK_NAME},
+            )
+            return hi < target
+
+    def _lock_watermark(self, connection) -> Optional[datetime]:
+        """워터마크 행을 잠그고 반환 (다른 인스턴스가 잡고 있으면 None)"""
+        # 최초 실행 시 가장 오래된 원본 행 직전부터 시작
+        connection.execute(text("""
+            INSERT INTO rollup_watermarks (name, watermark)
+            SELECT :name,
+                   coalesce(least((SELECT min(login_time) FROM login_history),
+                                  (SELECT min("timestamp") FROM user_activities)) - interval '1 microsecond',
+                            now() - make_interval(secs => :lag))
+            ON CONFLICT (name) DO NOTHING
+        """), {'name': WATERMARK_NAME, 'lag': self.lag.total_seconds()})
+
+        return connection.execute(
+            text("SELECT watermark FROM rollup_watermarks WHERE name = :name FOR UPDATE SKIP LOCKED"),
+            {'name': WATERMARK_NAME},
+        ).scalar()
+
+
+def get_dashboard_summary(async_session_factory=None, timezone_name: Optional[str] = None,
+                          timeout: Optional[float] = None) -> Optional[Dict[str, Any]]:
+    """대시보드 상단 지표 (롤업 테이블의 최근 2일 / 최신 및 1시간 전 시간 행만 조회)
+
+    서로 독립적인 조회는 비동기 엔진으로 동시에 실행하므로 async_session_factory는
+    async_sessionmaker여야 합니다 (동기 sessionmaker 아님). timeout초(기본 DB_QUERY_TIMEOUT)를
+    넘기면 TimeoutError가 발생합니다.
+    """
+    from .supabase_client import DB_QUERY_TIMEOUT, get_async_session_factory, run_concurrently
+
+    if async_session_factory is None:
+        async_session_factory = get_async_session_factory()
+        if async_session_factory is None:
+            return None
+
+    timezone_name = timezone_name or os.getenv("METRICS_TIMEZONE", "Asia/Seoul")
+    today_expression = cast(func.timezone(timezone_name, func.now()), Date)
+
+    # AsyncSession은 동시에 여러 쿼리를 실행할 수 없으므로 조회마다 세션을 따로 엶
+    async def _scalar(statement):
+        async with async_session_factory() as session:
+            return (await session.execute(statement)).scalar()
+
+    async def _scalars(statement):
+        async with async_session_factory() as session:
+            return (await session.execute(statement)).scalars().all()
+
+    today, daily_rows, latest_hour, hour_ago = run_concurrently(
+        _scalar(select(today_expression)),
+        _scalars(select(DailyMetric).where(DailyMetric.day >= today_expression - 1)),
+        _scalar(
+            select(HourlyMetric).where(HourlyMetric.active_sessions.is_not(None))
+            .order_by(HourlyMetric.bucket_start.desc()).limit(1)
+        ),
+        # 스냅샷 사이에 빈 시간이 있을 수 있으므로 직전 행이 아니라 1시간 전 시점의 스냅샷과 비교
+        # (시간 버킷의 스냅샷은 그 시간 동안 계속 갱신되므로 now - 1h를 포함하는 버킷)
+        _scalar(
+            select(HourlyMetric).where(
+                HourlyMetric.active_sessions.is_not(None),
+                HourlyMetric.bucket_start <= func.now() - timedelta(hours=1),
+                HourlyMetric.bucket_start > func.now() - timedelta(hours=2),
+            ).order_by(HourlyMetric.bucket_start.desc()).limit(1)
+        ),
+        timeout=DB_QUERY_TIMEOUT if timeout is None else timeout,
+    )
+    days = {row.day: row for row in daily_rows}
+
+    current, previous = days.get(today), days.get(today - timedelta(days=1))
+
+    total_users = _attribute(current, 'total_users')
+    previous_total_users = _attribute(previous, 'total_users')
+    response_time, previous_response_time = _average_response_seconds(current), _average_response_seconds(previous)
+
+    return {
+        'total_users': total_users if total_users is not None else previous_total_users or 0,
+        'total_users_change': _change(total_users, previous_total_users) or 0,
+        'today_visitors': _attribute(current, 'unique_visitors') or 0,
+        'today_visitors_change': _change(_attribute(current, 'unique_visitors') or 0,
+                                         _attribute(previous, 'unique_visitors') or 0),
+        'active_sessions': latest_hour.active_sessions if latest_hour else 0,
+        'active_sessions_change': _change(_attribute(latest_hour, 'active_sessions'),
+                                          _attribute(hour_ago, 'active_sessions')) or 0,
+        'response_time': response_time,
+        'response_time_change': _change(response_time, previous_response_time),
+        'updated_at': max((row.updated_at for row in [current, latest_hour] if row is not None), default=None),
+    }
+
+
+def _attribute(row, name: str):
+    return getattr(row, name) if row is not None else None
+
+
+def _change(current, previous):
+    if current is None or previous is None:
+        return None
+    return current - previous
+
+
+def _average_response_seconds(row) -> Optional[float]:
+    if row is None or not row.response_count:
+        return None
+    return row.response_ms_sum / row.response_count / 1000
+
+
+_rollup_job: Optional[RollupJob] = None
+_rollup_job_lock = threading.Lock()
+
+
+def get_rollup_job(start: bool = True) -> Optional[RollupJob]:
+    """프로세스 단위 롤업 작업 반환 (DB 미설정 시 None)"""
+    global _rollup_job
+
+    with _rollup_job_lock:
+        if _rollup_job is None:
+            load_dotenv()
+            from .supabase_client import engine
+
+            if engine is None:
+                return None
+
+            _rollup_job = RollupJob(
+                engine,
+                interval=float(os.getenv("ROLLUP_INTERVAL", "60")),
+                lag_seconds=float(os.getenv("ROLLUP_LAG_SECONDS", "300")),
+                timezone_name=os.getenv("METRICS_TIMEZONE", "Asia/Seoul"),
+            )
+
+        if start:
+            _rollup_job.start()
+        return _rollup_job
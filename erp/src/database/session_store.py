@@ -0,0 +1,152 @@
+import logging
+import secrets
+import threading
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+
+from dotenv import load_dotenv
+from sqlalchemy import func, select, update
+from sqlalchemy.dialects.postgresql import insert
+
+from src.utils.metrics_registry import get_registry
+from src.utils.user_agent import classify_user_agent
+
+from .event_logger import _normalize_ip
+from .models import UserSession
+
+logger = logging.getLogger(__name__)
+
+
+class SessionStore:
+    """로그인 세션 서버 저장소 (user_sessions 테이블)
+
+    토큰은 DB에만 두고 브라우저에는 추측할 수 없는 세션 키만 저장하므로,
+    새로고침이나 재연결로 다른 인스턴스에 연결되어도 같은 세션을 복원할 수 있습니다.
+    로그아웃은 is_active를 끄는 것으로 모든 인스턴스에 즉시 반영됩니다.
+    """
+
+    def __init__(self, session_factory):
+        self._session_factory = session_factory
+
+        registry = get_registry()
+        self._saves = registry.counter('sessions.store.saves', '세션 저장 횟수')
+        self._restores = registry.counter('sessions.store.restores', '세션 복원 성공 횟수')
+        self._misses = registry.counter('sessions.store.misses', '없거나 만료된 세션 복원 요청 수')
+        self._errors = registry.counter('sessions.store.errors', '세션 저장소 오류 수')
+
+    @staticmethod
+    def new_key() -> str:
+        """새 세션 키 발급"""
+        return secrets.token_urlsafe(32)
+
+    def save(
+        self,
+        session_key: str,
+        access_token: str,
+        user_info: Dict[str, Any],
+        expires_at: datetime,
+        ip_address: Optional[str] = None,
+        user_agent: Optional[str] = None,
+    ) -> bool:
+        """세션 저장 (같은 키가 있으면 토큰 / 만료 시각 갱신), 실패 시 False"""
+        user_id = user_info.get('sub', 'anonymous')
+        values = {
+            'session_id': session_key,
+            'user_id': user_id,
+            'username': user_info.get('cognito:username') or user_info.get('email') or user_id,
+            'email': user_info.get('email'),
+            'access_token': access_token,
+            'user_attributes': user_info,
+            'expires_at': expires_at.astimezone(timezone.utc),
+            'is_active': True,
+            'user_agent': user_agent,
+            'ip_address': _normalize_ip(ip_address),
+            **(classify_user_agent(user_agent) if user_agent else {}),
+        }
+
+        statement = insert(UserSession).values(**values)
+        statement = statement.on_conflict_do_update(
+            index_elements=[UserSession.session_id],
+            set_={
+                'access_token': statement.excluded.access_token,
+                'user_attributes': statement.excluded.user_attributes,
+                'expires_at': statement.excluded.expires_at,
+                'is_active': True,
+                'updated_at': func.now(),
+            },
+        )
+
+        try:
+            with self._session_factory() as session:
+                session.execute(statement)
+                session.commit()
+        except Exception as e:
+            self._errors.inc()
+            logger.warning("세션 저장 실패: %s", e)
+            return False
+
+        self._saves.inc()
+        return True
+
+    def load(self, session_key: str) -> Optional[Dict[str, Any]]:
+        """활성이고 만료되지 않은 세션 조회 (없거나 오류 시 None)"""
+        try:
+            with self._session_factory() as session:
+                row = session.execute(
+                    select(UserSession.access_token, UserSession.user_attributes, UserSession.expires_at)
+                    .where(
+                        UserSession.session_id == session_key,
+                        UserSession.is_active.is_(True),
+                        UserSession.expires_at > func.now(),
+                    )
+                ).first()
+        except Exception as e:
+            self._errors.inc()
+            logger.warning("세션 조회 실패: %s", e)
+            return None
+
+        if row is None or not row.access_token:
+            self._misses.inc()
+            return None
+
+        self._restores.inc()
+        return {
+            'access_token': row.access_token,
+            'user_info': row.user_attributes,
+            'expires_at': row.expires_at,
+        }
+
+    def revoke(self, session_key: str):
+        """세션 비활성화 (로그아웃)"""
+        try:
+            with self._session_factory() as session:
+                session.execute(
+                    update(UserSession)
+                    .where(UserSession.session_id == session_key)
+                    .values(is_active=False, access_token=None, updated_at=func.now())
+                )
+                session.commit()
+        except Exception as e:
+            self._errors.inc()
+            logger.warning("세션 비활성화 실패: %s", e)
+
+
+_session_store: Optional[SessionStore] = None
+_session_store_lock = threading.Lock()
+
+
+def get_session_store() -> Optional[SessionStore]:
+    """프로세스 단위 세션 저장소 반환 (DB 미설정 시 None)"""
+    global _session_store
+
+    with _session_store_lock:
+        if _session_store is None:
+            load_dotenv()
+            from .supabase_client import SessionLocal, engine
+
+            if engine is None:
+                return None
+
+            _session_store = SessionStore(SessionLocal)
+
+        return _session_store
@@ -0,0 +1,143 @@
+import atexit
+import logging
+import os
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+
+from dotenv import load_dotenv
+from sqlalchemy import func, select, update
+
+from src.utils.metrics_registry import get_registry
+
+from .models import UserSession
+
+logger = logging.getLogger(__name__)
+
+
+class SessionSweeper:
+    """만료된 user_sessions 행을 비활성화하는 백그라운드 정리 작업
+
+    한 번에 batch_size개씩 FOR UPDATE SKIP LOCKED로 잡아 짧은 트랜잭션으로 처리하므로
+    다른 요청이나 다른 인스턴스의 정리 작업과 잠금 대기 없이 동시에 실행할 수 있습니다.
+    """
+
+    def __init__(
+        self,
+        engine,
+        batch_size: int = 500,
+        interval: float = 60.0,
+        max_batches: int = 100,
+    ):
+        self.engine = engine
+        self.batch_size = batch_size
+        self.interval = interval
+        # 한 주기에 처리할 최대 배치 수 (밀린 행이 많아도 주기 단위로 끊어서 처리)
+        self.max_batches = max_batches
+
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.last_sweep: Dict[str, Any] = {}
+
+        registry = get_registry()
+        self._deactivated = registry.counter('sessions.sweeper.deactivated', '비활성화된 만료 세션 수')
+        self._batch_ms = registry.histogram('sessions.sweeper.batch_ms', '정리 배치 처리 시간(ms)')
+
+    def start(self):
+        """백그라운드 정리 스레드 시작"""
+        if self._thread is not None:
+            return
+
+        self._thread = threading.Thread(target=self._run, name="session-sweeper", daemon=True)
+        self._thread.start()
+        atexit.register(self.shutdown)
+
+    def shutdown(self, timeout: float = 5.0):
+        """정리 스레드 종료"""
+        if self._thread is None:
+            return
+
+        self._stop_event.set()
+        self._thread.join(timeout)
+        self._thread = None
+
+    def _run(self):
+        while not self._stop_event.is_set():
+            try:
+                self.sweep_once()
+            except Exception:
+                logger.exception("만료 세션 정리 실패")
+
+            self._stop_event.wait(self.interval)
+
+    def sweep_batch(self) -> int:
+        """만료된 활성 세션을 최대 batch_size개 비활성화하고 처리 건수 반환"""
+        # 다른 트랜잭션이 잡고 있는 행은 건너뛰므로 잠금 대기가 발생하지 않음
+        expired_ids = (
+            select(UserSession.id)
+            .where(UserSession.is_active.is_(True), UserSession.expires_at < func.now())
+            .order_by(UserSession.expires_at)
+            .limit(self.batch_size)
+            .with_for_update(skip_locked=True)
+        )
+
+        started = time.perf_counter()
+        with self.engine.begin() as connection:
+            result = connection.execute(
+                update(UserSession)
+                .where(UserSession.id.in_(expired_ids.scalar_subquery()))
+                .values(is_active=False, updated_at=func.now())
+            )
+        self._batch_ms.observe((time.perf_counter() - started) * 1000)
+
+        deactivated = result.rowcount or 0
+        self._deactivated.inc(deactivated)
+        return deactivated
+
+    def sweep_once(self) -> Dict[str, Any]:
+        """배치가 비거나 max_batches에 도달할 때까지 정리"""
+        stats = {'batches': 0, 'deactivated': 0}
+
+        while stats['batches'] < self.max_batches and not self._stop_event.is_set():
+            deactivated = self.sweep_batch()
+            stats['batches'] += 1
+            stats['deactivated'] += deactivated
+
+            if deactivated < self.batch_size:
+                break
+
+        stats['finished_at'] = datetime.now(timezone.utc)
+        self.last_sweep = stats
+
+        if stats['deactivated']:
+            logger.info("만료 세션 %d건 비활성화 (배치 %d회)", stats['deactivated'], stats['batches'])
+        return stats
+
+
+_session_sweeper: Optional[SessionSweeper] = None
+_session_sweeper_lock = threading.Lock()
+
+
+def get_session_sweeper(start: bool = True) -> Optional[SessionSweeper]:
+    """프로세스 단위 세션 정리 작업 반환 (DB 미설정 시 None)"""
+    global _session_sweeper
+
+    with _session_sweeper_lock:
+        if _session_sweeper is None:
+            load_dotenv()
+            from .supabase_client import engine
+
+            if engine is None:
+                return None
+
+            _session_sweeper = SessionSweeper(
+                engine,
+                batch_size=int(os.getenv("SESSION_SWEEP_BATCH_SIZE", "500")),
+                interval=float(os.getenv("SESSION_SWEEP_INTERVAL", "60")),
+                max_batches=int(os.getenv("SESSION_SWEEP_MAX_BATCHES", "100")),
+            )
+
+        if start:
+            _session_sweeper.start()
+        return _session_sweeper
@@ -0,0 +1,371 @@
+import atexit
+import logging
+import os
+import select as select_module
+import threading
+import time
+from typing import Any, Dict, List, Optional, Set
+
+from dotenv import load_dotenv
+from sqlalchemy import select, text
+from sqlalchemy.dialects.postgresql import insert
+
+from src.utils.metrics_registry import get_registry
+
+from .models import SYSTEM_SETTINGS_CHANNEL, SYSTEM_SETTINGS_VERSION_TABLE, SystemSetting
+
+logger = logging.getLogger(__name__)
+
+
+class SettingsCache:
+    """system_settings 프로세스 내 캐시
+
+    시작 시 활성 설정을 모두 메모리에 올리고 읽기는 딕셔너리 조회만 합니다.
+    변경은 LISTEN/NOTIFY로 받은 키만 무효화하여 다음 읽기 때 다시 조회(read-through)하고,
+    NOTIFY를 쓸 수 없는 환경(pgbouncer 트랜잭션 풀러 등)에서는 버전 테이블을 폴링합니다.
+    """
+
+    def __init__(
+        self,
+        engine,
+        session_factory,
+        use_listen: bool = True,
+        poll_interval: float = 5.0,
+        listen_poll_interval: float = 60.0,
+        max_listen_backoff: float = 300.0,
+    ):
+        self.engine = engine
+        self._session_factory = session_factory
+        self.use_listen = use_listen
+        # 폴링 주기 (LISTEN 사용 중에는 놓친 알림 보정용으로 더 길게)
+        self.poll_interval = poll_interval
+        self.listen_poll_interval = listen_poll_interval
+        # LISTEN 연결이 계속 실패하면 재시도 간격을 poll_interval부터 두 배씩 늘림
+        self.max_listen_backoff = max_listen_backoff
+        self._listen_failures = 0
+        self._listen_retry_at = 0.0
+        self._version_failed = False
+        # 적재 전 읽기가 DB 장애 중에 매번 재적재를 시도하지 않도록 실패 시 재시도 간격을 늘림
+        self._reload_failures = 0
+        self._reload_retry_at = 0.0
+
+        self._values: Dict[str, Any] = {}
+        self._categories: Dict[str, str] = {}
+        self._stale: Set[str] = set()
+        self._loaded = False
+        self._version: Optional[int] = None
+        self._lock = threading.Lock()
+
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.listening = False
+
+        registry = get_registry()
+        self._reloads = registry.counter('settings.cache.reloads', '설정 전체 재적재 횟수')
+        self._read_through = registry.counter('settings.cache.read_through', '무효화된 키 재조회 횟수')
+        self._invalidations = registry.counter('settings.cache.invalidations', '변경 알림으로 무효화된 키 수')
+
+    # ---------------------------
+    # 읽기
+    # ---------------------------
+    def get(self, key: str, default: Any = None) -> Any:
+        """설정 값 조회 (메모리에서 반환, 무효화된 키만 DB 재조회)"""
+        if not self._loaded and not self._try_reload():
+            return default
+
+        value = self._values.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+
+        if key in self._stale:
+            value = self._load_key(key)
+            if value is not _MISSING:
+                return value
+
+        return default
+
+    def get_category(self, category: str) -> Dict[str, Any]:
+        """카테고리에 속한 설정 전체"""
+        if not self._loaded and not self._try_reload():
+            return {}
+
+        for key in list(self._stale):
+            self._load_key(key)
+
+        with self._lock:
+            return {
+                key: self._values[key]
+                for key, key_category in self._categories.items()
+                if key_category == category and key in self._values
+            }
+
+    # ---------------------------
+    # 쓰기
+    # ---------------------------
+    def set(self, key: str, value: Any, category: str = "general", description: Optional[str] = None,
+            updated_by: Optional[str] = None):
+        """설정 저장 (트리거가 다른 인스턴스에 변경을 알림)"""
+        values = {
+            'setting_key': key,
+            'setting_value': value,
+            'category': category,
+            'is_active': True,
+            'updated_by': updated_by,
+        }
+        if description is not None:
+            values['description'] = description
+
+        statement = insert(SystemSetting).values(**values)
+        statement = statement.on_conflict_do_update(
+            index_elements=[SystemSetting.setting_key],
+            set_={**{k: statement.excluded[k] for k in values if k != 'setting_key'}, 'updated_at': text('now()')},
+        )
+
+        with self._session_factory() as session:
+            session.execute(statement)
+            session.commit()
+
+        # 자기 인스턴스는 알림을 기다리지 않고 바로 반영
+        self.invalidate(key)
+
+    # ---------------------------
+    # 적재 / 무효화
+    # ---------------------------
+    def reload(self):
+        """활성 설정 전체 재적재"""
+        with self._session_factory() as session:
+            # 버전과 설정 행을 같은 스냅샷에서 읽어야 버전만 새것이고 값은 이전 것인 상태가 생기지 않음
+            session.connection(execution_options={'isolation_level': 'REPEATABLE READ'})
+            version = self._read_version(session)
+            rows = session.execute(
+                select(SystemSetting.setting_key, SystemSetting.setting_value, SystemSetting.category)
+                .where(SystemSetting.is_active.is_(True))
+            ).all()
+
+        with self._lock:
+            self._values = {row.setting_key: row.setting_value for row in rows}
+            self._categories = {row.setting_key: row.category for row in rows}
+            self._stale = set()
+            self._version = version
+            self._loaded = True
+
+        self._reloads.inc()
+
+    def _try_reload(self) -> bool:
+        """전체 재적재 시도 (실패가 이어지면 poll_interval부터 두 배씩 max_listen_backoff까지 건너뜀)"""
+        if time.monotonic() < self._reload_retry_at:
+            return False
+
+        try:
+            self.reload()
+        except Exception as e:
+            self._reload_failures += 1
+            delay = min(self.poll_interval * 2 ** (self._reload_failures - 1), self.max_listen_backoff)
+            self._reload_retry_at = time.monotonic() + delay
+            if self._reload_failures == 1:
+                logger.exception("시스템 설정 적재 실패 (%.0f초 동안 기본값 사용)", delay)
+            else:
+                logger.warning("시스템 설정 적재 실패 %d회째, %.0f초 후 재시도: %s", self._reload_failures, delay, e)
+            return False
+
+        if self._reload_failures:
+            logger.info("시스템 설정 적재 복구")
+        self._reload_failures = 0
+        self._reload_retry_at = 0.0
+        return True
+
+    def invalidate(self, key: str):
+        """키 무효화 (다음 읽기 때 DB에서 다시 조회)"""
+        with self._lock:
+            self._values.pop(key, None)
+            self._stale.add(key)
+        self._invalidations.inc()
+
+    def _load_key(self, key: str) -> Any:
+        with self._session_factory() as session:
+            row = session.execute(
+                select(SystemSetting.setting_value, SystemSetting.category)
+                .where(SystemSetting.setting_key == key, SystemSetting.is_active.is_(True))
+            ).first()
+
+        with self._lock:
+            # 조회 도중 다시 무효화되었으면 다음 읽기에서 재조회
+            if key in self._stale:
+                self._stale.discard(key)
+                if row is None:
+                    self._categories.pop(key, None)
+                else:
+                    self._values[key] = row.setting_value
+                    self._categories[key] = row.category
+
+        self._read_through.inc()
+        return _MISSING if row is None else row.setting_value
+
+    def _read_version(self, session_or_connection) -> Optional[int]:
+        try:
+            return session_or_connection.execute(
+                text(f"SELECT version FROM {SYSTEM_SETTINGS_VERSION_TABLE} WHERE id = 1")
+            ).scalar()
+        except Exception:
+            logger.warning("설정 버전 테이블을 읽을 수 없습니다 (마이그레이션 필요)")
+            session_or_connection.rollback()
+            return None
+
+    def check_version(self) -> bool:
+        """버전이 바뀌었으면 전체 재적재 (폴링 경로)"""
+        with self.engine.connect() as connection:
+            version = self._read_version(connection)
+
+        if version is not None and version != self._version:
+            self.reload()
+            return True
+        return False
+
+    # ---------------------------
+    # 변경 감지 스레드
+    # ---------------------------
+    def start(self):
+        """변경 감지 스레드 시작"""
+        if self._thread is not None:
+            return
+
+        self._thread = threading.Thread(target=self._run, name="settings-cache", daemon=True)
+        self._thread.start()
+        atexit.register(self.shutdown)
+
+    def shutdown(self, timeout: float = 5.0):
+        """변경 감지 스레드 종료"""
+        if self._thread is None:
+            return
+
+        self._stop_event.set()
+        self._thread.join(timeout)
+        self._thread = None
+
+    def _run(self):
+        while not self._stop_event.is_set():
+            if self.use_listen and time.monotonic() >= self._listen_retry_at:
+                try:
+                    self._listen_loop()
+                except Exception as e:
+                    self._on_listen_failure(e)
+                finally:
+                    self.listening = False
+
+            try:
+                self.check_version()
+                if self._version_failed:
+                    logger.info("설정 버전 확인 복구")
+                self._version_failed = False
+            except Exception as e:
+                # 장애가 이어지는 동안 같은 traceback을 주기마다 남기지 않음
+                if not self._version_failed:
+                    logger.exception("설정 버전 확인 실패")
+                else:
+                    logger.debug("설정 버전 확인 실패: %s", e)
+                self._version_failed = True
+
+            self._stop_event.wait(self.poll_interval)
+
+    def _on_listen_failure(self, error: Exception):
+        """LISTEN 실패 기록 (첫 실패만 traceback, 이후는 경고와 함께 재시도 간격을 늘림)"""
+        self._listen_failures += 1
+        delay = min(self.poll_interval * 2 ** (self._listen_failures - 1), self.max_listen_backoff)
+        self._listen_retry_at = time.monotonic() + delay
+
+        if self._listen_failures == 1:
+            logger.exception("설정 변경 LISTEN 연결 실패, 폴링으로 대체 (%.0f초 후 재시도)", delay)
+        else:
+            logger.warning("설정 변경 LISTEN 재연결 실패 %d회째, %.0f초 후 재시도: %s",
+                           self._listen_failures, delay, error)
+
+    def _listen_loop(self):
+        """전용 커넥션에서 LISTEN 후 알림을 받을 때마다 해당 키 무효화"""
+        connection = self.engine.raw_connection()
+        try:
+            dbapi_connection = connection.driver_connection
+            dbapi_connection.autocommit = True
+            cursor = dbapi_connection.cursor()
+            cursor.execute(f"LISTEN {SYSTEM_SETTINGS_CHANNEL}")
+            cursor.close()
+            self.listening = True
+            if self._listen_failures:
+                logger.info("설정 변경 LISTEN 재연결 성공")
+            self._listen_failures = 0
+
+            # LISTEN 시작 이후 변경이 누락되지 않도록 한 번 동기화
+            self.check_version()
+            last_check = time.monotonic()
+
+            while not self._stop_event.is_set():
+                for key in _wait_for_notifies(dbapi_connection, timeout=1.0):
+                    self.invalidate(key)
+
+                if time.monotonic() - last_check >= self.listen_poll_interval:
+                    self.check_version()
+                    last_check = time.monotonic()
+        finally:
+            # 풀에 LISTEN 상태가 남지 않도록 커넥션을 폐기
+            connection.invalidate()
+
+
+def _wait_for_notifies(dbapi_connection, timeout: float) -> List[str]:
+    """드라이버별 NOTIFY 수신 (psycopg2 / psycopg 3)"""
+    if hasattr(dbapi_connection, 'poll'):
+        # psycopg2: 소켓이 읽기 가능해질 때까지 대기 후 poll()
+        readable, _, _ = select_module.select([dbapi_connection], [], [], timeout)
+        if not readable:
+            return []
+        dbapi_connection.poll()
+        payloads = [notify.payload for notify in dbapi_connection.notifies]
+        dbapi_connection.notifies.clear()
+        return payloads
+
+    # psycopg 3
+    return [notify.payload for notify in dbapi_connection.notifies(timeout=timeout, stop_after=100)]
+
+
+class _Missing:
+    def __repr__(self) -> str:
+        return '<missing>'
+
+
+_MISSING = _Missing()
+
+_settings_cache: Optional[SettingsCache] = None
+_settings_cache_lock = threading.Lock()
+
+
+def get_settings_cache() -> Optional[SettingsCache]:
+    """프로세스 단위 설정 캐시 반환 (DB 미설정 시 None)"""
+    global _settings_cache
+
+    with _settings_cache_lock:
+        if _settings_cache is None:
+            load_dotenv()
+            from .supabase_client import DATABASE_PGBOUNCER, SessionLocal, engine
+
+            if engine is None:
+                return None
+
+            # 트랜잭션 풀러 경유 시 LISTEN 세션이 유지되지 않으므로 폴링만 사용
+            use_listen = os.getenv("SETTINGS_CACHE_LISTEN", "false" if DATABASE_PGBOUNCER else "true")
+
+            _settings_cache = SettingsCache(
+                engine,
+                SessionLocal,
+                use_listen=use_listen.strip().lower() in ("1", "true", "yes"),
+                poll_interval=float(os.getenv("SETTINGS_CACHE_POLL_INTERVAL", "5")),
+            )
+            _settings_cache._try_reload()
+            _settings_cache.start()
+
+        return _settings_cache
+
+
+def get_setting(key: str, default: Any = None) -> Any:
+    """시스템 설정 값 조회 (DB 미설정 시 기본값)"""
+    cache = get_settings_cache()
+    if cache is None:
+        return default
+    return cache.get(key, default)
@@ -1,7 +1,14 @@
+import asyncio
+import concurrent.futures
+import contextvars
 import os
+import threading
+from typing import Any, Awaitable, List, Optional
 from dotenv import load_dotenv
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
 from sqlalchemy.orm import sessionmaker, declarative_base
+from .pool_monitor import InstrumentedAsyncQueuePool, InstrumentedQueuePool, instrument_engine, instrument_query_tracing
 
 
 # .env 불러오기
@@ -9,17 +16,148 @@ load_dotenv()
 
 DATABASE_URL = os.getenv("DATABASE_URL")
 
+# SQL 로그 출력 ("true" / "debug", 운영 환경에서는 기본 비활성)
+_echo_setting = os.getenv("DATABASE_ECHO", "false").strip().lower()
+DATABASE_ECHO = "debug" if _echo_setting == "debug" else _echo_setting in ("1", "true", "yes")
+
+# Supabase 트랜잭션 풀러(pgbouncer) 사용 여부 (prepared statement 캐시 비활성 필요)
+DATABASE_PGBOUNCER = os.getenv("DATABASE_PGBOUNCER", "false").strip().lower() in ("1", "true", "yes")
+
+# 비동기 쿼리 최대 대기 시간 (초, 스크립트 스레드가 멈춘 DB를 무한정 기다리지 않도록)
+DB_QUERY_TIMEOUT = float(os.getenv("DB_QUERY_TIMEOUT", "10"))
+
 
 # SQLAlchemy 엔진 생성 (세션 풀 포함)
+# DATABASE_URL이 없으면 엔진 없이 모델만 import 가능하도록 함
 engine = create_engine(
     DATABASE_URL,
+    poolclass=InstrumentedQueuePool,  # 커넥션 대기 시간 측정
     pool_size=10,        # 최소 10개 커넥션 유지
     max_overflow=20,     # 최대 20개 추가 커넥션
-    echo=True            # SQL 로그 출력
-)
+    pool_pre_ping=True,  # 끊어진 커넥션 사전 감지
+    echo=DATABASE_ECHO   # SQL 로그 출력
+) if DATABASE_URL else None
+
+# 풀 메트릭 수집 (디버그 사이드바에서 확인) / 쿼리 trace 구간 기록
+if engine is not None:
+    instrument_engine(engine, 'sync')
+    instrument_query_tracing(engine)
 
 # 세션 생성기
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 # Base 모델 선언
-Base = declarative_base()
\ No newline at end of file
+Base = declarative_base()
+
+
+# ---------------------------
+# 비동기 엔진 (asyncpg)
+# ---------------------------
+def get_async_database_url(url: str) -> str:
+    """동기 DATABASE_URL을 asyncpg 드라이버 URL로 변환"""
+    parsed = make_url(url.replace("postgres://", "postgresql://", 1))
+    parsed = parsed.set(drivername="postgresql+asyncpg")
+
+    # asyncpg는 sslmode 대신 ssl 파라미터를 사용
+    query = dict(parsed.query)
+    if "sslmode" in query:
+        query["ssl"] = query.pop("sslmode")
+    return parsed.set(query=query).render_as_string(hide_password=False)
+
+
+_async_lock = threading.Lock()
+_async_engine = None
+_async_session_factory = None
+_async_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def get_async_engine():
+    """비동기 엔진 반환 (최초 호출 시 생성, DATABASE_URL 미설정 시 None)"""
+    global _async_engine
+
+    if not DATABASE_URL:
+        return None
+
+    with _async_lock:
+        if _async_engine is None:
+            from sqlalchemy.ext.asyncio import create_async_engine
+
+            connect_args = {}
+            if DATABASE_PGBOUNCER:
+                connect_args = {"statement_cache_size": 0, "prepared_statement_cache_size": 0}
+
+            _async_engine = create_async_engine(
+                get_async_database_url(DATABASE_URL),
+                poolclass=InstrumentedAsyncQueuePool,
+                pool_size=10,
+                max_overflow=20,
+                pool_pre_ping=True,
+                echo=DATABASE_ECHO,
+                connect_args=connect_args,
+            )
+            instrument_engine(_async_engine.sync_engine, 'async')
+            instrument_query_tracing(_async_engine.sync_engine)
+        return _async_engine
+
+
+def get_async_session_factory():
+    """비동기 세션 생성기 (async_sessionmaker) 반환"""
+    global _async_session_factory
+
+    async_engine = get_async_engine()
+    if async_engine is None:
+        return None
+
+    with _async_lock:
+        if _async_session_factory is None:
+            from sqlalchemy.ext.asyncio import async_sessionmaker
+
+            _async_session_factory = async_sessionmaker(async_engine, expire_on_commit=False, autoflush=False)
+        return _async_session_factory
+
+
+def _get_async_loop() -> asyncio.AbstractEventLoop:
+    """비동기 엔진 전용 이벤트 루프 (프로세스당 하나의 백그라운드 스레드)
+
+    asyncpg 커넥션은 생성된 이벤트 루프에 묶이므로, Streamlit 스크립트 스레드마다
+    asyncio.run()을 호출하지 않고 항상 같은 루프에서 실행합니다.
+    """
+    global _async_loop
+
+    with _async_lock:
+        if _async_loop is None:
+            _async_loop = asyncio.new_event_loop()
+            threading.Thread(target=_async_loop.run_forever, name="db-async-loop", daemon=True).start()
+        return _async_loop
+
+
+def run_async(coro: Awaitable, timeout: Optional[float] = None) -> Any:
+    """코루틴을 DB 전용 이벤트 루프에서 실행하고 결과를 동기적으로 반환
+
+    timeout(기본 DB_QUERY_TIMEOUT)초 안에 끝나지 않으면 루프 쪽 코루틴을 취소하고 TimeoutError를 발생시킵니다.
+    """
+    timeout = DB_QUERY_TIMEOUT if timeout is None else timeout
+    # 호출한 스크립트 스레드의 컨텍스트(진행 중인 trace 등)를 루프 쪽 태스크로 전달
+    context = contextvars.copy_context()
+
+    async def _run_in_context():
+        for variable, value in context.items():
+            variable.set(value)
+        # 시간 초과 시 루프 안에서 코루틴을 취소하여 커넥션을 풀에 돌려줌
+        return await asyncio.wait_for(coro, timeout)
+
+    future = asyncio.run_coroutine_threadsafe(_run_in_context(), _get_async_loop())
+    try:
+        # 루프 자체가 막힌 경우를 대비해 약간의 여유를 두고 호출 쪽에서도 대기 제한
+        return future.result(timeout + 1.0)
+    except concurrent.futures.TimeoutError:
+        future.cancel()
+        raise TimeoutError(f"DB 쿼리가 {timeout:g}초 안에 끝나지 않았습니다") from None
+
+
+def run_concurrently(*coros: Awaitable, timeout: Optional[float] = None) -> List[Any]:
+    """서로 독립적인 쿼리 코루틴들을 동시에 실행하고 결과를 순서대로 반환 (전체에 timeout 적용)"""
+    async def _gather():
+        return await asyncio.gather(*coros)
+
+    return run_async(_gather(), timeout)
@@ -0,0 +1,175 @@
+import os
+import threading
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+from zoneinfo import ZoneInfo
+
+import pandas as pd
+from sqlalchemy import text
+
+from src.utils.downsampling import downsample_frame
+
+# 선택 가능한 버킷 크기 (date_trunc 단위가 있는 크기만 date_trunc 폴백에서 사용)
+BUCKET_SIZES: List[Tuple[timedelta, Optional[str]]] = [
+    (timedelta(minutes=1), 'minute'),
+    (timedelta(minutes=5), None),
+    (timedelta(minutes=15), None),
+    (timedelta(hours=1), 'hour'),
+    (timedelta(hours=6), None),
+    (timedelta(days=1), 'day'),
+    (timedelta(weeks=1), 'week'),
+]
+
+# DB에서 가져올 최대 버킷 수 / 화면에 보낼 최대 점 수
+MAX_BUCKETS = 5000
+DEFAULT_POINT_BUDGET = 500
+
+# 버킷 경계 기준 시각 (월요일 0시라 date_trunc('week')와도 경계가 같음)
+_BUCKET_ORIGIN = datetime(2000, 1, 3)
+
+# 차트별 원본 집계: (테이블, 시간 컬럼, [(열 이름, 집계식, 빈 버킷 채움값)])
+CHART_SERIES: Dict[str, List[Tuple[str, str, List[Tuple[str, str, Optional[float]]]]]] = {
+    'visitors': [
+        ('user_activities', '"timestamp"', [
+            ('방문자', 'count(DISTINCT user_id)', 0),
+            ('페이지 조회', "count(*) FILTER (WHERE activity_type = 'page_view')", 0),
+        ]),
+        ('login_history', 'login_time', [
+            ('로그인', 'count(*) FILTER (WHERE success)', 0),
+        ]),
+    ],
+    'usage': [
+        ('user_activities', '"timestamp"', [
+            ('페이지 조회', "count(*) FILTER (WHERE activity_type = 'page_view')", 0),
+            ('기능 선택', "count(*) FILTER (WHERE activity_type = 'feature_select')", 0),
+            ('기타 활동', "count(*) FILTER (WHERE activity_type NOT IN ('page_view', 'feature_select'))", 0),
+        ]),
+    ],
+    'performance': [
+        ('user_activities', '"timestamp"', [
+            ('평균 응답시간(초)',
+             "avg((activity_detail->>'auth_ms')::float / 1000) "
+             "FILTER (WHERE activity_type = 'login' AND activity_detail->>'auth_ms' IS NOT NULL)",
+             None),
+        ]),
+        ('login_history', 'login_time', [
+            ('로그인 실패', 'count(*) FILTER (WHERE NOT success)', 0),
+        ]),
+    ],
+}
+
+_bucket_functions: Dict[str, str] = {}
+_bucket_functions_lock = threading.Lock()
+
+
+def choose_bucket(start: datetime, end: datetime, max_buckets: int = MAX_BUCKETS,
+                  date_trunc_only: bool = False) -> Tuple[timedelta, Optional[str]]:
+    """조회 기간의 버킷 수가 max_buckets 이하가 되는 가장 작은 버킷 크기"""
+    candidates = [bucket for bucket in BUCKET_SIZES if bucket[1] or not date_trunc_only]
+    span = end - start
+    for size, unit in candidates:
+        if span / size <= max_buckets:
+            return size, unit
+    return candidates[-1]
+
+
+def _bucket_function(connection) -> str:
+    """사용할 버킷 함수 (TimescaleDB time_bucket > PG14+ date_bin > date_trunc)"""
+    key = str(connection.engine.url)
+    with _bucket_functions_lock:
+        if key not in _bucket_functions:
+            has_timescale = connection.execute(
+                text("SELECT 1 FROM pg_extension WHERE extname = 'timescaledb'")
+            ).first() is not None
+            if has_timescale:
+                _bucket_functions[key] = 'time_bucket'
+            elif connection.dialect.server_version_info >= (14,):
+                _bucket_functions[key] = 'date_bin'
+            else:
+                _bucket_functions[key] = 'date_trunc'
+        return _bucket_functions[key]
+
+
+def _bucket_expression(function: str, unit: Optional[str], local_time: str) -> str:
+    if function == 'time_bucket':
+        return f"time_bucket(CAST(:bucket AS interval), {local_time}, CAST(:origin AS timestamp))"
+    if function == 'date_bin':
+        return f"date_bin(CAST(:bucket AS interval), {local_time}, CAST(:origin AS timestamp))"
+    return f"date_trunc('{unit}', {local_time})"
+
+
+def _floor_bucket(moment: datetime, size: timedelta) -> datetime:
+    return _BUCKET_ORIGIN + ((moment - _BUCKET_ORIGIN) // size) * size
+
+
+def fetch_timeseries(
+    chart_type: str,
+    start: datetime,
+    end: datetime,
+    max_points: int = DEFAULT_POINT_BUDGET,
+    engine=None,
+    timezone_name: Optional[str] = None,
+) -> Tuple[pd.DataFrame, timedelta, pd.DataFrame]:
+    """원본 이벤트를 DB에서 시간 버킷으로 집계하고 LTTB로 max_points 이하로 줄여 반환
+
+    버킷 크기는 조회 기간에 맞춰 고르므로 기간이 길어져도 DB 결과와 화면 점 수가 일정합니다.
+    반환값: (로컬 시각 인덱스 DataFrame, 버킷 크기, 다운샘플링 전 열별 합계/최대/평균)
+    """
+    if engine is None:
+        from .supabase_client import engine
+
+    timezone_name = timezone_name or os.getenv("METRICS_TIMEZONE", "Asia/Seoul")
+    zone = ZoneInfo(timezone_name)
+    start = start if start.tzinfo else start.astimezone()
+    end = end if end.tzinfo else end.astimezone()
+
+    frames = []
+    with engine.connect() as connection:
+        function = _bucket_function(connection)
+        size, unit = choose_bucket(start, end, date_trunc_only=function == 'date_trunc')
+
+        for table, time_column, series in CHART_SERIES[chart_type]:
+            bucket = _bucket_expression(function, unit, f"({time_column} AT TIME ZONE :tz)")
+            aggregates = ", ".join(f'{expression} AS "{label}"' for label, expression, _ in series)
+            rows = connection.execute(text(f"""
+                SELECT {bucket} AS bucket, {aggregates}
+                FROM {table}
+                WHERE {time_column} >= :start AND {time_column} < :end
+                GROUP BY 1
+                ORDER BY 1
+            """), {
+                'start': start, 'end': end, 'tz': timezone_name,
+                'bucket': f"{int(size.total_seconds())} seconds", 'origin': _BUCKET_ORIGIN,
+            }).all()
+            frames.append(pd.DataFrame(
+                [row[1:] for row in rows],
+                index=pd.DatetimeIndex([row[0] for row in rows]),
+                columns=[label for label, _, _ in series],
+                dtype=float,
+            ))
+
+    # 이벤트가 없는 버킷도 점으로 표시되도록 전체 버킷으로 재색인
+    local_start = _floor_bucket(start.astimezone(zone).replace(tzinfo=None), size)
+    local_end = end.astimezone(zone).replace(tzinfo=None)
+    index = pd.date_range(local_start, local_end, freq=size, inclusive='left')
+
+    frame = pd.concat(frames, axis=1).reindex(index) if frames else pd.DataFrame(index=index)
+    for _, _, series in CHART_SERIES[chart_type]:
+        for label, _, fill_value in series:
+            if fill_value is not None:
+                frame[label] = frame[label].fillna(fill_value)
+
+    # 합계 등 요약값은 줄이기 전 전체 버킷 기준으로 계산
+    summary = frame.agg(['sum', 'max', 'mean'])
+    return downsample_frame(frame, max_points), size, summary
+
+
+def format_bucket(size: timedelta) -> str:
+    """버킷 크기 표시용 문자열 (예: 15분, 1시간, 1일)"""
+    seconds = int(size.total_seconds())
+    if seconds % 86400 == 0:
+        days = seconds // 86400
+        return "1주" if days == 7 else f"{days}일"
+    if seconds % 3600 == 0:
+        return f"{seconds // 3600}시간"
+    return f"{seconds // 60}분"
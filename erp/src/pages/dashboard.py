@@ -3,17 +3,30 @@ from datetime import datetime
 from src.auth.cognito_auth import CognitoAuth
 from src.components.metrics import render_metrics
 from src.components.charts import render_charts
+from src.database.settings_cache import get_setting
+from src.utils.profiling import timed
+
+# 부분 갱신(fragment) 주기 (초)
+SESSION_STATUS_REFRESH_SECONDS = 30
+
+# 세션 만료 경고를 띄우기 시작하는 남은 시간 (분), system_settings의 같은 키로 변경 가능
+SESSION_WARNING_MINUTES_SETTING = 'dashboard.session_warning_minutes'
+DEFAULT_SESSION_WARNING_MINUTES = 30
 
 def show_page(auth: CognitoAuth):
-    """대시보드 페이지 렌더링"""
+    """대시보드 페이지 렌더링
+
+    세션 상태, 지표, 차트는 각각 fragment로 렌더링되어
+    주기적 갱신이나 패널 안의 버튼 클릭 시 해당 패널만 다시 실행됩니다.
+    """
     user_info = auth.session_mgr.get_user_info()
     session_info = auth.session_mgr.get_session_info()
     
-    # 헤더
-    _render_header(auth, user_info, session_info)
+    # 페이지 조회 기록
+    auth.session_mgr.log_page_view('dashboard')
     
-    # 세션 만료 경고
-    _render_session_warning(auth, session_info)
+    # 헤더 (세션 상태 / 만료 경고 포함)
+    _render_header(auth, user_info)
     
     # 메트릭스
     render_metrics()
@@ -28,12 +41,12 @@ def show_page(auth: CognitoAuth):
     render_charts()
     
     # 기능 메뉴
-    _render_feature_menu()
+    _render_feature_menu(auth)
 
-def _render_header(auth: CognitoAuth, user_info, session_info):
+@timed('dashboard.header')
+def _render_header(auth: CognitoAuth, user_info):
     """헤더 렌더링"""
     username = _get_display_name(user_info)
-    last_login = auth.session_mgr.get_last_login_time()
     
     # 헤더 전체를 하나의 컨테이너로 만들기
     st.markdown(f"""
@@ -48,6 +61,14 @@ def _render_header(auth: CognitoAuth, user_info, session_info):
     </div>
     """, unsafe_allow_html=True)
     
+    _render_session_status(auth)
+
+@st.fragment(run_every=SESSION_STATUS_REFRESH_SECONDS)
+@timed('dashboard.session_status')
+def _render_session_status(auth: CognitoAuth):
+    """상단 메뉴바 / 세션 카운트다운 / 만료 경고 (주기적으로 이 영역만 갱신)"""
+    session_info = auth.session_mgr.get_session_info()
+    last_login = auth.session_mgr.get_last_login_time()
     
     # 상단 메뉴바
     col1, col2, col3, col4, col5 = st.columns([2, 2, 2, 2, 2])
@@ -59,8 +80,10 @@ def _render_header(auth: CognitoAuth, user_info, session_info):
     with col2:
         if st.button("⏰ 세션 연장", help="세션 유효시간을 연장합니다"):
             if auth.session_mgr.extend_session():
-                st.success("세션이 연장되었습니다!")
-                st.rerun()
+                auth.session_mgr.log_activity('session_extend', page_path='dashboard')
+                st.toast("세션이 연장되었습니다!")
+                # 브라우저 세션 갱신은 전체 rerun 때 브리지 컴포넌트로 전달되므로 fragment가 아닌 앱 전체를 다시 실행
+                st.rerun(scope="app")
             else:
                 st.error("세션 연장에 실패했습니다.")
     
@@ -92,12 +115,17 @@ def _render_header(auth: CognitoAuth, user_info, session_info):
     if last_login:
         st.markdown(f'<p class="last-login-time">마지막 로그인: {last_login.strftime("%Y-%m-%d %H:%M:%S")}</p>', 
                    unsafe_allow_html=True)
+    
+    # 세션 만료 경고
+    _render_session_warning(auth, session_info)
 
+@timed('dashboard.session_warning')
 def _render_session_warning(auth: CognitoAuth, session_info):
     """세션 만료 경고"""
     remaining_minutes = session_info.get('expires_in_minutes', 0)
+    warning_minutes = _session_warning_minutes()
     
-    if remaining_minutes <= 30 and remaining_minutes > 0:
+    if remaining_minutes <= warning_minutes and remaining_minutes > 0:
         st.warning(
             f"⚠️ 세션이 {remaining_minutes}분 후에 만료됩니다. "
             f"계속 사용하시려면 '세션 연장' 버튼을 클릭하세요.",
@@ -111,6 +139,15 @@ def _render_session_warning(auth: CognitoAuth, session_info):
         if st.button("다시 로그인하기", type="primary"):
             auth.logout()
 
+def _session_warning_minutes() -> int:
+    """세션 만료 경고 기준 (분, 설정 캐시에서 읽으므로 rerun마다 DB를 조회하지 않음)"""
+    value = get_setting(SESSION_WARNING_MINUTES_SETTING, DEFAULT_SESSION_WARNING_MINUTES)
+    try:
+        return max(0, int(value))
+    except (TypeError, ValueError):
+        return DEFAULT_SESSION_WARNING_MINUTES
+
+@timed('dashboard.session_info')
 def _render_session_info(session_info, auth):
     """세션 정보 표시"""
     with st.expander("🔐 세션 정보", expanded=False):
@@ -183,6 +220,7 @@ def _handle_logout(auth: CognitoAuth):
     """로그아웃 처리"""
     auth.logout()
 
+@timed('dashboard.user_info')
 def _render_user_info(user_info):
     """사용자 정보 렌더링"""
     if not user_info:
@@ -237,7 +275,8 @@ def _render_user_info(user_info):
                 except:
                     st.info(f"**최근 업데이트:** {updated_at}")
 
-def _render_feature_menu():
+@timed('dashboard.feature_menu')
+def _render_feature_menu(auth: CognitoAuth):
     """기능 메뉴 렌더링"""
     st.markdown("### 🛠️ 주요 기능")
     
@@ -245,18 +284,24 @@ def _render_feature_menu():
     
     with col1:
         if st.button("📁 파일 관리", width='stretch'):
+            auth.session_mgr.log_activity('feature_select', {'feature': 'file_management'}, page_path='dashboard')
             st.info("📁 파일 관리 기능이 선택되었습니다.")
     
     with col2:
         if st.button("👥 사용자 관리", width='stretch'):
-            st.info("👥 사용자 관리 기능이 선택되었습니다.")
+            auth.session_mgr.log_activity('feature_select', {'feature': 'user_management'}, page_path='dashboard')
+            st.session_state.current_page = 'user_directory'
+            st.rerun()
     
     with col3:
-        if st.button("📈 분석 도구", width='stretch'):
-            st.info("📈 분석 도구 기능이 선택되었습니다.")
+        if st.button("📜 접속 이력", width='stretch'):
+            auth.session_mgr.log_activity('feature_select', {'feature': 'history_browser'}, page_path='dashboard')
+            st.session_state.current_page = 'history_browser'
+            st.rerun()
     
     with col4:
         if st.button("⚙️ 시스템 설정", width='stretch'):
+            auth.session_mgr.log_activity('feature_select', {'feature': 'system_settings'}, page_path='dashboard')
             st.info("⚙️ 시스템 설정 기능이 선택되었습니다.")
 
     # 세션 테스트 섹션
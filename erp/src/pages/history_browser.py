@@ -0,0 +1,211 @@
+import streamlit as st
+from datetime import datetime, time, timedelta
+from src.auth.cognito_auth import CognitoAuth
+from src.database.history import fetch_login_history, fetch_user_activities, resolve_user_ids
+from src.database.json_filters import parse_filter_expression
+from src.database.supabase_client import engine
+
+PAGE_SIZE = 100
+
+# 화면에 누적해 둘 최대 행 수 (넘으면 더 보기 대신 필터를 좁히도록 안내)
+MAX_LOADED_ROWS = 5000
+
+SUCCESS_OPTIONS = {
+    "전체": None,
+    "성공": True,
+    "실패": False,
+}
+
+ACTIVITY_TYPE_OPTIONS = {
+    "전체": None,
+    "페이지 조회 (page_view)": "page_view",
+    "로그인 (login)": "login",
+    "로그아웃 (logout)": "logout",
+    "세션 연장 (session_extend)": "session_extend",
+    "기능 선택 (feature_select)": "feature_select",
+    "일괄 작업 (bulk_user_action)": "bulk_user_action",
+}
+
+def show_page(auth: CognitoAuth):
+    """로그인 이력 / 사용자 활동 조회 페이지 렌더링 (관리자는 전체, 그 외에는 본인 기록만)"""
+    _render_header()
+
+    if engine is None:
+        st.warning("이력 조회를 사용하려면 DATABASE_URL 환경변수를 설정해주세요.")
+        return
+
+    own_user_ids = None if auth.is_admin() else _own_user_ids(auth)
+    if own_user_ids is not None and not own_user_ids:
+        st.error("🚫 사용자 정보를 확인할 수 없어 이력을 조회할 수 없습니다.")
+        return
+
+    auth.session_mgr.log_page_view('history_browser')
+
+    mode = st.radio("조회 대상", ["로그인 이력", "사용자 활동"], horizontal=True, key="history_mode")
+    filters = _render_filters(mode, own_user_ids)
+
+    # 조회 조건이 바뀌면 누적된 행과 커서 초기화
+    if st.session_state.get('history_filters') != filters:
+        st.session_state.history_filters = filters
+        st.session_state.history_rows = []
+        st.session_state.history_cursor = None
+        st.session_state.history_exhausted = False
+        _load_next_page(filters)
+
+    _render_results(filters)
+
+def _render_header():
+    """헤더 및 뒤로가기 버튼"""
+    col1, col2 = st.columns([4, 1])
+
+    with col1:
+        st.markdown("## 📜 접속 이력 조회")
+        st.caption("로그인 이력과 사용자 활동을 최신순으로 조회합니다.")
+
+    with col2:
+        if st.button("⬅️ 대시보드로", width='stretch'):
+            st.session_state.current_page = 'dashboard'
+            st.rerun()
+
+def _own_user_ids(auth: CognitoAuth):
+    """본인 기록의 user_id 후보 (성공/활동은 Cognito sub, 로그인 실패는 사용자명으로 기록됨)"""
+    identity = auth.get_identity()
+    user_info = auth.session_mgr.get_user_info() or {}
+    if identity is None or not user_info.get('sub'):
+        return ()
+
+    # 로그인 실패는 입력한 값(사용자명 또는 이메일)으로 기록되므로 함께 조회
+    candidates = [user_info['sub'], identity['username'], user_info.get('email')]
+    return tuple(dict.fromkeys(candidate for candidate in candidates if candidate))
+
+def _render_filters(mode: str, own_user_ids=None):
+    """조회 조건 입력 (own_user_ids가 있으면 사용자 검색 없이 본인 기록으로 제한)"""
+    col1, col2, col3 = st.columns([2, 2, 2])
+
+    with col1:
+        if own_user_ids is None:
+            user = st.text_input("사용자", placeholder="사용자명 또는 사용자 ID", key="history_user")
+        else:
+            user = ""
+            st.text_input("사용자", value="본인 기록만 조회할 수 있습니다.", disabled=True, key="history_user_own")
+
+    with col2:
+        today = datetime.now().date()
+        date_range = st.date_input(
+            "기간",
+            value=(today - timedelta(days=7), today),
+            max_value=today,
+            key="history_date_range"
+        )
+
+    with col3:
+        if mode == "로그인 이력":
+            option = st.selectbox("결과", list(SUCCESS_OPTIONS.keys()), key="history_success")
+        else:
+            option = st.selectbox("활동 유형", list(ACTIVITY_TYPE_OPTIONS.keys()), key="history_activity_type")
+
+    detail_expression = ""
+    if mode == "사용자 활동":
+        detail_expression = st.text_input(
+            "상세 조건",
+            placeholder="예: feature=user_management, action=disable",
+            help="활동 상세(activity_detail)에서 키=값이 모두 일치하는 기록만 조회합니다.",
+            key="history_detail"
+        ).strip()
+
+    # 기간 선택 도중(시작일만 선택)에는 시작일 하루만 조회
+    if isinstance(date_range, (tuple, list)):
+        start_date = date_range[0] if date_range else today
+        end_date = date_range[1] if len(date_range) > 1 else start_date
+    else:
+        start_date = end_date = date_range
+
+    return (mode, user.strip(), start_date, end_date, option, detail_expression, own_user_ids)
+
+def _load_next_page(filters):
+    """다음 페이지를 조회하여 누적 행에 추가"""
+    mode, user, start_date, end_date, option, detail_expression, own_user_ids = filters
+
+    # 로컬 시간대 기준 하루 단위 범위 [시작일 00:00, 종료일 다음날 00:00)
+    start = datetime.combine(start_date, time.min).astimezone()
+    end = datetime.combine(end_date + timedelta(days=1), time.min).astimezone()
+    user_ids = list(own_user_ids) if own_user_ids is not None else resolve_user_ids(user)
+
+    if mode == "로그인 이력":
+        rows, cursor = fetch_login_history(
+            user_ids, start, end, SUCCESS_OPTIONS[option],
+            after=st.session_state.history_cursor, limit=PAGE_SIZE
+        )
+        st.session_state.history_rows.extend(_login_row(row) for row in rows)
+    else:
+        try:
+            detail_filters = parse_filter_expression(detail_expression)
+        except ValueError as e:
+            st.error(f"상세 조건 오류: {e}")
+            st.session_state.history_exhausted = True
+            return
+
+        rows, cursor = fetch_user_activities(
+            user_ids, start, end, ACTIVITY_TYPE_OPTIONS[option], detail_filters,
+            after=st.session_state.history_cursor, limit=PAGE_SIZE
+        )
+        st.session_state.history_rows.extend(_activity_row(row) for row in rows)
+
+    st.session_state.history_cursor = cursor
+    st.session_state.history_exhausted = cursor is None
+
+def _render_results(filters):
+    """누적된 조회 결과와 더 보기 버튼"""
+    rows = st.session_state.history_rows
+
+    if not rows:
+        st.info("조건에 해당하는 기록이 없습니다.")
+        return
+
+    st.dataframe(rows, width='stretch', hide_index=True, height=600)
+
+    col1, col2 = st.columns([3, 1])
+
+    with col1:
+        suffix = "" if st.session_state.history_exhausted else " (더 있음)"
+        st.caption(f"{len(rows):,}건 표시{suffix}")
+
+    with col2:
+        if st.session_state.history_exhausted:
+            return
+
+        if len(rows) >= MAX_LOADED_ROWS:
+            st.caption("표시 가능한 최대 건수에 도달했습니다. 기간이나 사용자로 범위를 좁혀주세요.")
+            return
+
+        if st.button("⬇️ 더 보기", width='stretch'):
+            _load_next_page(filters)
+            st.rerun()
+
+def _login_row(row):
+    """로그인 이력 행을 표시용 딕셔너리로 변환"""
+    return {
+        "로그인 시각": row.login_time.astimezone().strftime('%Y-%m-%d %H:%M:%S'),
+        "사용자명": row.username,
+        "결과": "✅ 성공" if row.success else "❌ 실패",
+        "실패 사유": row.failure_reason,
+        "IP": str(row.ip_address) if row.ip_address else None,
+        "기기": row.device_type,
+        "OS": row.os,
+        "브라우저": row.browser,
+        "로그아웃 시각": row.logout_time.astimezone().strftime('%Y-%m-%d %H:%M:%S') if row.logout_time else None,
+        "세션 시간": str(row.session_duration).split('.')[0] if row.session_duration else None,
+        "사용자 ID": row.user_id,
+    }
+
+def _activity_row(row):
+    """사용자 활동 행을 표시용 딕셔너리로 변환"""
+    return {
+        "시각": row.timestamp.astimezone().strftime('%Y-%m-%d %H:%M:%S'),
+        "활동": row.activity_type,
+        "페이지": row.page_path,
+        "상세": str(row.activity_detail) if row.activity_detail else None,
+        "IP": str(row.ip_address) if row.ip_address else None,
+        "사용자 ID": row.user_id,
+        "세션 ID": row.session_id,
+    }
@@ -1,6 +1,8 @@
 import streamlit as st
+import time
 from src.auth.cognito_auth import CognitoAuth
 from src.utils.validators import validate_login_form
+from src.utils.client_info import get_client_ip
 
 def show_page(auth: CognitoAuth):
     """로그인 페이지 렌더링"""
@@ -120,7 +122,9 @@ def _handle_login(auth: CognitoAuth, username: str, password: str):
     
     # 로그인 시도
     with st.spinner("로그인 중..."):
-        result = auth.sign_in(username, password)
+        auth_started = time.perf_counter()
+        result = auth.sign_in(username, password, ip_address=get_client_ip())
+        auth_ms = (time.perf_counter() - auth_started) * 1000
     
     if result['success']:
         # 사용자 정보 조회
@@ -135,6 +139,11 @@ def _handle_login(auth: CognitoAuth, username: str, password: str):
                     user_info_result['user_attributes']
                 )
             
+            # 로그인 이력 기록
+            user_attributes = user_info_result['user_attributes']
+            session_mgr.record_login(user_attributes.get('sub', username.strip()), username.strip())
+            session_mgr.log_activity('login', {'auth_ms': round(auth_ms, 1)}, page_path='login')
+            
             st.success("""
             🎉 **로그인 완료!**
             
@@ -145,12 +154,17 @@ def _handle_login(auth: CognitoAuth, username: str, password: str):
             """)
             
             # 잠시 후 자동으로 대시보드로 이동
-            import time
             time.sleep(1)
             st.rerun()
         else:
             st.error(f"사용자 정보 조회 실패: {user_info_result['message']}")
     else:
+        session_mgr.record_login(
+            username.strip(),
+            username.strip(),
+            success=False,
+            failure_reason=result.get('error_code') or result['message']
+        )
         session_mgr.increment_login_attempts()
         remaining_attempts = 5 - session_mgr.get_login_attempts()
         
@@ -0,0 +1,241 @@
+import streamlit as st
+from src.auth.cognito_auth import CognitoAuth
+from src.auth.bulk_admin import BULK_ACTIONS, BulkUserOperator
+from src.auth.user_directory import get_user_directory
+
+PAGE_SIZE = 50
+
+USER_STATUS_OPTIONS = {
+    "전체": None,
+    "확인됨 (CONFIRMED)": "CONFIRMED",
+    "미확인 (UNCONFIRMED)": "UNCONFIRMED",
+    "비밀번호 변경 필요 (FORCE_CHANGE_PASSWORD)": "FORCE_CHANGE_PASSWORD",
+    "비밀번호 재설정 필요 (RESET_REQUIRED)": "RESET_REQUIRED",
+    "외부 제공자 (EXTERNAL_PROVIDER)": "EXTERNAL_PROVIDER",
+}
+
+ENABLED_OPTIONS = {
+    "전체": None,
+    "활성": True,
+    "비활성": False,
+}
+
+def show_page(auth: CognitoAuth):
+    """사용자 디렉터리 페이지 렌더링 (관리자 그룹 전용)"""
+    _render_header()
+
+    # 모든 사용자의 이메일 / 전화번호가 표시되므로 관리자만 조회 가능
+    if not auth.is_admin():
+        st.error(f"🚫 사용자 디렉터리는 '{auth.admin_group}' 그룹 사용자만 사용할 수 있습니다.")
+        return
+
+    directory = get_user_directory(auth.config)
+    if directory is None:
+        st.warning("사용자 디렉터리를 사용하려면 DATABASE_URL 환경변수를 설정해주세요.")
+        return
+
+    auth.session_mgr.log_page_view('user_directory')
+
+    _render_sync_status(directory)
+    search_filters, page_usernames = _render_search(directory)
+    _render_bulk_actions(auth, directory, search_filters, page_usernames)
+
+def _render_header():
+    """헤더 및 뒤로가기 버튼"""
+    col1, col2 = st.columns([4, 1])
+
+    with col1:
+        st.markdown("## 👥 사용자 디렉터리")
+        st.caption("Cognito 사용자 풀을 주기적으로 동기화한 로컬 목록에서 검색합니다.")
+
+    with col2:
+        if st.button("⬅️ 대시보드로", width='stretch'):
+            st.session_state.current_page = 'dashboard'
+            st.rerun()
+
+def _render_sync_status(directory):
+    """동기화 상태 표시"""
+    col1, col2, col3 = st.columns([2, 2, 1])
+    last_sync = directory.last_sync
+
+    with col1:
+        if directory.is_syncing():
+            st.info("🔄 Cognito 사용자 목록 동기화 중...")
+        elif last_sync.get('finished_at'):
+            st.info(
+                f"🕒 마지막 동기화: {last_sync['finished_at'].astimezone().strftime('%Y-%m-%d %H:%M:%S')} "
+                f"(변경 {last_sync['changed']}명, 삭제 {last_sync['deleted']}명)"
+            )
+        else:
+            st.info("⏳ 첫 동기화를 기다리는 중입니다.")
+
+    with col2:
+        status_counts = directory.get_status_counts()
+        st.metric("캐시된 사용자", f"{sum(status_counts.values()):,}")
+
+    with col3:
+        if st.button("🔄 지금 동기화", width='stretch', disabled=directory.is_syncing()):
+            directory.request_refresh()
+            st.toast("동기화를 요청했습니다.")
+
+def _render_search(directory):
+    """검색 및 필터"""
+    col1, col2, col3 = st.columns([3, 2, 1])
+
+    with col1:
+        query = st.text_input("검색", placeholder="사용자명 또는 이메일 앞부분", key="user_directory_query")
+
+    with col2:
+        status_label = st.selectbox("계정 상태", list(USER_STATUS_OPTIONS.keys()), key="user_directory_status")
+
+    with col3:
+        enabled_label = st.selectbox("활성 여부", list(ENABLED_OPTIONS.keys()), key="user_directory_enabled")
+
+    filters = (query, status_label, enabled_label)
+    if st.session_state.get('user_directory_filters') != filters:
+        # 필터가 바뀌면 첫 페이지로 이동
+        st.session_state.user_directory_filters = filters
+        st.session_state.user_directory_page = 0
+
+    page = st.session_state.get('user_directory_page', 0)
+    search_filters = {
+        'query': query,
+        'user_status': USER_STATUS_OPTIONS[status_label],
+        'enabled': ENABLED_OPTIONS[enabled_label],
+    }
+    users, total = directory.search(**search_filters, limit=PAGE_SIZE, offset=page * PAGE_SIZE)
+
+    st.caption(f"검색 결과: {total:,}명")
+
+    st.dataframe(
+        [
+            {
+                "사용자명": user.username,
+                "이메일": user.email,
+                "이름": f"{user.family_name or ''} {user.given_name or ''}".strip(),
+                "상태": user.user_status,
+                "활성": user.enabled,
+                "생성일": user.user_created_at.strftime('%Y-%m-%d') if user.user_created_at else None,
+                "수정일": user.user_modified_at.strftime('%Y-%m-%d %H:%M') if user.user_modified_at else None,
+            }
+            for user in users
+        ],
+        width='stretch',
+        hide_index=True
+    )
+
+    _render_pagination(page, total)
+
+    return search_filters, [user.username for user in users]
+
+def _render_pagination(page: int, total: int):
+    """페이지 이동 버튼"""
+    last_page = max(0, (total - 1) // PAGE_SIZE)
+
+    col1, col2, col3 = st.columns([1, 2, 1])
+
+    with col1:
+        if st.button("◀ 이전", disabled=page <= 0, width='stretch'):
+            st.session_state.user_directory_page = page - 1
+            st.rerun()
+
+    with col2:
+        st.markdown(
+            f'<p style="text-align: center;">{page + 1} / {last_page + 1} 페이지</p>',
+            unsafe_allow_html=True
+        )
+
+    with col3:
+        if st.button("다음 ▶", disabled=page >= last_page, width='stretch'):
+            st.session_state.user_directory_page = page + 1
+            st.rerun()
+
+def _render_bulk_actions(auth: CognitoAuth, directory, search_filters, page_usernames):
+    """여러 사용자에 대한 일괄 관리자 작업 (관리자 그룹 전용, 실행 시점에도 BulkUserOperator가 확인)"""
+    with st.expander("🛠️ 일괄 작업", expanded=False):
+        target_mode = st.radio(
+            "대상",
+            ["직접 선택", "검색 결과 전체"],
+            horizontal=True,
+            key="bulk_target_mode"
+        )
+
+        if target_mode == "직접 선택":
+            usernames = st.multiselect("사용자 선택", page_usernames, key="bulk_selected_users")
+        else:
+            usernames = directory.list_usernames(**search_filters)
+            st.caption(f"현재 검색 조건에 해당하는 사용자 {len(usernames):,}명이 대상입니다.")
+
+        identity = auth.get_identity()
+        if identity and identity['username'] in usernames:
+            st.caption(f"본인 계정({identity['username']})은 대상에서 제외됩니다.")
+
+        col1, col2 = st.columns(2)
+
+        with col1:
+            action = st.selectbox(
+                "작업",
+                list(BULK_ACTIONS.keys()),
+                format_func=lambda key: BULK_ACTIONS[key][1],
+                key="bulk_action"
+            )
+
+        group_name = None
+        with col2:
+            if action == 'add_to_group':
+                group_name = st.text_input("그룹 이름", key="bulk_group_name")
+
+        confirmed = st.checkbox(
+            f"{len(usernames):,}명에게 '{BULK_ACTIONS[action][1]}' 작업을 실행합니다.",
+            key="bulk_confirm"
+        )
+
+        if st.button("🚀 실행", type="primary", disabled=not (usernames and confirmed)):
+            if action == 'add_to_group' and not (group_name and group_name.strip()):
+                st.error("그룹 이름을 입력해주세요.")
+                return
+
+            _run_bulk_action(auth, directory, action, usernames, group_name.strip() if group_name else None)
+
+def _run_bulk_action(auth: CognitoAuth, directory, action: str, usernames, group_name):
+    """일괄 작업 실행 및 진행 상황 실시간 표시"""
+    try:
+        operator = BulkUserOperator(auth)
+    except PermissionError as e:
+        st.error(f"🚫 {e}")
+        return
+
+    progress = st.progress(0.0)
+    status = st.empty()
+    result_table = st.empty()
+
+    results = []
+    success_count = 0
+
+    for result in operator.run(action, usernames, group_name=group_name):
+        results.append({
+            "사용자명": result.username,
+            "결과": "✅ 성공" if result.success else "❌ 실패",
+            "메시지": result.message,
+            "시도": result.attempts,
+            "소요(ms)": result.elapsed_ms,
+        })
+        success_count += int(result.success)
+
+        progress.progress(len(results) / len(usernames))
+        status.caption(f"{len(results):,} / {len(usernames):,} 처리됨 (성공 {success_count:,}, 실패 {len(results) - success_count:,})")
+        result_table.dataframe(results, width='stretch', hide_index=True)
+
+    auth.session_mgr.log_activity(
+        'bulk_user_action',
+        {'action': action, 'group_name': group_name, 'total': len(usernames), 'succeeded': success_count},
+        page_path='user_directory'
+    )
+
+    # 변경된 계정 상태를 디렉터리에 반영
+    directory.request_refresh()
+
+    if success_count == len(usernames):
+        st.success(f"🎉 {success_count:,}명 모두 처리되었습니다.")
+    else:
+        st.warning(f"{len(usernames) - success_count:,}명의 작업이 실패했습니다. 결과 표를 확인해주세요.")
@@ -0,0 +1,71 @@
+import argparse
+import json
+import statistics
+from typing import Any, Dict, List
+
+def _percentile(ordered: List[float], ratio: float) -> float:
+    return ordered[min(len(ordered) - 1, int(len(ordered) * ratio))]
+
+def load_traces(path: str) -> List[List[Dict[str, Any]]]:
+    """JSON Lines trace 파일 읽기 (한 줄 = 한 rerun의 구간 목록)"""
+    traces = []
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            if line.strip():
+                traces.append(json.loads(line))
+    return traces
+
+def summarize_spans(traces: List[List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+    """구간 이름별 지연 분포 (rerun 안에서 같은 이름은 합산)"""
+    per_name: Dict[str, List[float]] = {}
+    for spans in traces:
+        totals: Dict[str, float] = {}
+        for span in spans:
+            totals[span['name']] = totals.get(span['name'], 0.0) + span['duration_ms']
+        for name, total in totals.items():
+            per_name.setdefault(name, []).append(total)
+
+    rows = []
+    for name, values in per_name.items():
+        ordered = sorted(values)
+        rows.append({
+            'name': name,
+            'count': len(ordered),
+            'p50': round(statistics.median(ordered), 1),
+            'p95': round(_percentile(ordered, 0.95), 1),
+            'p99': round(_percentile(ordered, 0.99), 1),
+            'max': round(ordered[-1], 1),
+        })
+    return sorted(rows, key=lambda row: row['p99'], reverse=True)
+
+def analyze_traces():
+    """trace 파일의 구간별 꼬리 지연과 가장 느린 rerun 출력"""
+    parser = argparse.ArgumentParser(description="rerun trace 꼬리 지연 분석")
+    parser.add_argument('path', nargs='?', default='logs/traces.jsonl', help="trace 파일 (TRACE_FILE)")
+    parser.add_argument('--slowest', type=int, default=5, help="표시할 가장 느린 rerun 수")
+    args = parser.parse_args()
+
+    traces = load_traces(args.path)
+    if not traces:
+        print("❌ 분석할 trace가 없습니다")
+        return
+
+    print(f"📊 trace {len(traces)}건\n")
+    print(f"{'p50':>9} | {'p95':>9} | {'p99':>9} | {'max':>9} | {'횟수':>5} | 구간")
+    print('-' * 70)
+    for row in summarize_spans(traces):
+        print(f"{row['p50']:>9.1f} | {row['p95']:>9.1f} | {row['p99']:>9.1f} | {row['max']:>9.1f} | {row['count']:>5} | {row['name']}")
+
+    def _root(spans):
+        return next((span for span in spans if span['parent_id'] is None), spans[-1])
+
+    print(f"\n🐢 가장 느린 rerun {args.slowest}건")
+    for spans in sorted(traces, key=lambda spans: _root(spans)['duration_ms'], reverse=True)[:args.slowest]:
+        root = _root(spans)
+        print(f"\n- {root['trace_id']} {root['duration_ms']:.1f}ms ({len(spans)}개 구간)")
+        for span in sorted((s for s in spans if s is not root), key=lambda s: s['duration_ms'], reverse=True)[:5]:
+            detail = span['attributes'].get('statement') or span['attributes'].get('error') or ''
+            print(f"    {span['duration_ms']:>9.1f}ms  {span['name']}  {detail[:80]}")
+
+if __name__ == "__main__":
+    analyze_traces()
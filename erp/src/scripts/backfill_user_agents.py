@@ -0,0 +1,41 @@
+import sys
+
+from sqlalchemy import select, update
+
+from src.database.models import LoginHistory, UserActivity, UserSession
+from src.database.supabase_client import SessionLocal, engine
+from src.utils.user_agent import classify_user_agent
+
+def backfill_user_agents(batch_size: int = 500):
+    """기존 행의 browser / os / device_type 채우기
+
+    행 단위가 아니라 서로 다른 user_agent 문자열 단위로 분류하여 UPDATE 합니다.
+    """
+    if engine is None:
+        print("❌ DATABASE_URL이 설정되지 않았습니다")
+        return
+
+    for model in (UserSession, LoginHistory, UserActivity):
+        with SessionLocal() as session:
+            user_agents = session.scalars(
+                select(model.user_agent)
+                .where(model.user_agent.is_not(None), model.device_type.is_(None))
+                .distinct()
+            ).all()
+
+        updated = 0
+        for start in range(0, len(user_agents), batch_size):
+            with SessionLocal() as session:
+                for user_agent in user_agents[start:start + batch_size]:
+                    result = session.execute(
+                        update(model)
+                        .where(model.user_agent == user_agent, model.device_type.is_(None))
+                        .values(**classify_user_agent(user_agent))
+                    )
+                    updated += result.rowcount
+                session.commit()
+
+        print(f"✅ {model.__tablename__}: User-Agent {len(user_agents)}종, {updated}건 갱신")
+
+if __name__ == "__main__":
+    backfill_user_agents(int(sys.argv[1]) if len(sys.argv) > 1 else 500)
@@ -0,0 +1,20 @@
+import argparse
+import os
+from src.utils.geoip import build_geoip_index, read_range_csv
+
+def build_index(source: str, output: str, country_column: int, city_column: int = None):
+    """IP 범위 CSV로 GeoIP 인덱스 파일 생성 (앱은 GEOIP_DB_PATH로 읽음)"""
+    count = build_geoip_index(read_range_csv(source, country_column, city_column), output)
+    print(f"✅ GeoIP 인덱스 생성 완료: {output} ({count:,}개 범위, {os.path.getsize(output) / 1024 / 1024:.1f}MB)")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="IP 범위 CSV로 GeoIP 인덱스 생성")
+    parser.add_argument("source", help="IP 범위 CSV (예: DB-IP lite 'dbip-city-lite.csv', IP2Location LITE 'IP2LOCATION-LITE-DB1.CSV')")
+    parser.add_argument("--output", default=os.getenv("GEOIP_DB_PATH", "data/geoip.idx"),
+                        help="생성할 인덱스 파일 경로")
+    parser.add_argument("--country-column", type=int, default=2, help="국가 코드 컬럼 번호 (0부터)")
+    parser.add_argument("--city-column", type=int, default=None,
+                        help="도시 컬럼 번호 (DB-IP city lite는 --country-column 3 --city-column 5)")
+    args = parser.parse_args()
+    
+    build_index(args.source, args.output, args.country_column, args.city_column)
@@ -1,10 +1,20 @@
 from src.database.supabase_client import engine, Base
-from src.database.models import UserSession, LoginHistory, UserActivity, SystemSetting
+from src.database.partitions import PARTITIONED_TABLES, ensure_partitions
+from src.database.models import (
+    UserSession, LoginHistory, UserActivity, SystemSetting, CognitoUser,
+    HourlyMetric, DailyMetric, DailyVisitor, RollupWatermark
+)
 
 def init_db():
     # 모든 테이블 생성
     Base.metadata.create_all(bind=engine)
     print("✅ 모든 테이블 생성 완료")
+    
+    # 파티션 테이블의 기본/월별 파티션 생성
+    with engine.begin() as connection:
+        for table in PARTITIONED_TABLES:
+            created = ensure_partitions(connection, table)
+            print(f"✅ {table} 파티션 생성: {', '.join(created) or '변경 없음'}")
 
 if __name__ == "__main__":
     init_db()
@@ -0,0 +1,26 @@
+import argparse
+import os
+from src.database.supabase_client import engine
+from src.database.partitions import run_maintenance, retention_from_env
+
+def maintain_partitions(months_ahead: int, archive_schema: str = None):
+    """미래 월 파티션 생성 및 보존 기간이 지난 파티션 정리 (cron 등에서 매일 실행)"""
+    report = run_maintenance(
+        engine,
+        months_ahead=months_ahead,
+        retention_months=retention_from_env(),
+        archive_schema=archive_schema
+    )
+    
+    for table, result in report.items():
+        print(f"✅ {table}: 생성 {result['created'] or '없음'}, 만료 {result['expired'] or '없음'}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="파티션 테이블 유지보수")
+    parser.add_argument("--months-ahead", type=int, default=int(os.getenv("PARTITION_MONTHS_AHEAD", "3")),
+                        help="미리 만들어 둘 미래 파티션 개월 수")
+    parser.add_argument("--archive-schema", default=os.getenv("PARTITION_ARCHIVE_SCHEMA"),
+                        help="만료 파티션을 삭제하지 않고 옮겨 둘 스키마 (미지정 시 삭제)")
+    args = parser.parse_args()
+    
+    maintain_partitions(args.months_ahead, args.archive_schema)
@@ -0,0 +1,17 @@
+from src.database.rollups import get_rollup_job
+
+def run_rollups():
+    """대시보드 지표 롤업 한 번 실행 (앱 외부 cron 등에서 사용)"""
+    job = get_rollup_job(start=False)
+    if job is None:
+        print("❌ DATABASE_URL이 설정되지 않았습니다")
+        return
+
+    stats = job.run_once()
+    if stats['skipped']:
+        print("⏭️ 다른 인스턴스가 롤업을 처리 중입니다")
+    else:
+        print(f"✅ 롤업 구간 {stats['windows']}개 반영 완료")
+
+if __name__ == "__main__":
+    run_rollups()
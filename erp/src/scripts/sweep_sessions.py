@@ -0,0 +1,14 @@
+from src.database.session_sweeper import get_session_sweeper
+
+def sweep_sessions():
+    """만료된 세션 일괄 비활성화 (앱 외부 cron 등에서 한 번 실행)"""
+    sweeper = get_session_sweeper(start=False)
+    if sweeper is None:
+        print("❌ DATABASE_URL이 설정되지 않았습니다")
+        return
+
+    stats = sweeper.sweep_once()
+    print(f"✅ 만료 세션 {stats['deactivated']}건 비활성화 (배치 {stats['batches']}회)")
+
+if __name__ == "__main__":
+    sweep_sessions()
@@ -0,0 +1,52 @@
+import os
+import streamlit as st
+from typing import List, Optional
+
+
+def get_client_ip() -> Optional[str]:
+    """클라이언트 IP 반환
+
+    X-Forwarded-For는 클라이언트가 임의로 채울 수 있으므로, TRUSTED_PROXY_HOPS(앱 앞단의 신뢰하는
+    리버스 프록시 수)가 설정된 경우에만 프록시가 덧붙인 오른쪽 항목을 사용하고,
+    그 외에는 연결 주소(st.context.ip_address)를 사용합니다.
+    """
+    peer_ip = getattr(st.context, 'ip_address', None)
+
+    hops = _trusted_proxy_hops()
+    if hops <= 0:
+        return peer_ip
+
+    # 각 프록시는 자신에게 연결한 주소를 오른쪽 끝에 덧붙이므로 오른쪽에서 hops번째가 클라이언트
+    forwarded = _forwarded_for()
+    if len(forwarded) < hops:
+        # 프록시를 거치지 않은 요청 (헤더가 없거나 모자람)
+        return peer_ip
+
+    return forwarded[-hops]
+
+
+def get_user_agent() -> Optional[str]:
+    """클라이언트 User-Agent 반환"""
+    return _get_headers().get('User-Agent')
+
+
+def _trusted_proxy_hops() -> int:
+    try:
+        return int(os.getenv('TRUSTED_PROXY_HOPS', '0'))
+    except ValueError:
+        return 0
+
+
+def _forwarded_for() -> List[str]:
+    """X-Forwarded-For 항목 목록 (여러 헤더로 나뉘어 온 경우 순서대로 합침)"""
+    headers = _get_headers()
+    values = headers.get_all('X-Forwarded-For') if hasattr(headers, 'get_all') else [headers.get('X-Forwarded-For')]
+    return [entry.strip() for value in values if value for entry in value.split(',') if entry.strip()]
+
+
+def _get_headers():
+    """요청 헤더 반환 (Streamlit 버전에 따라 없을 수 있음)"""
+    try:
+        return st.context.headers or {}
+    except Exception:
+        return {}
@@ -13,6 +13,20 @@ def load_app_config() -> Dict[str, Any]:
             'cognito_client_id': os.getenv('AWS_COGNITO_CLIENT_ID'),
             'cognito_user_pool_id': os.getenv('AWS_COGNITO_USER_POOL_ID'),
             'region': os.getenv('AWS_REGION', 'ap-northeast-2'),
+            # 사용자 디렉터리 / 일괄 작업 / 접속 이력 화면을 사용할 수 있는 Cognito 그룹
+            'admin_group': os.getenv('AWS_COGNITO_ADMIN_GROUP', 'admin'),
+        },
+        'redis': {
+            'url': os.getenv('REDIS_URL'),
+        },
+        'rate_limit': {
+            # 사용자명 / IP / 전역 단위 로그인 시도 허용량 (window_seconds 동안 attempts회)
+            'username_attempts': int(os.getenv('LOGIN_RATE_USERNAME_ATTEMPTS', '5')),
+            'username_window_seconds': int(os.getenv('LOGIN_RATE_USERNAME_WINDOW', '300')),
+            'ip_attempts': int(os.getenv('LOGIN_RATE_IP_ATTEMPTS', '20')),
+            'ip_window_seconds': int(os.getenv('LOGIN_RATE_IP_WINDOW', '300')),
+            'global_attempts': int(os.getenv('LOGIN_RATE_GLOBAL_ATTEMPTS', '50')),
+            'global_window_seconds': int(os.getenv('LOGIN_RATE_GLOBAL_WINDOW', '1')),
         }
     }
     
@@ -40,6 +54,10 @@ def load_app_config() -> Dict[str, Any]:
 AWS_COGNITO_CLIENT_ID=your_client_id_here
 AWS_COGNITO_USER_POOL_ID=your_user_pool_id_here
 AWS_REGION=ap-northeast-2
+# 선택: 관리자 화면(사용자 디렉터리 / 일괄 작업 / 접속 이력)을 사용할 Cognito 그룹
+AWS_COGNITO_ADMIN_GROUP=admin
+# 선택: 여러 인스턴스 간 로그인 속도 제한 공유
+REDIS_URL=redis://localhost:6379/0
         """, language="bash")
         st.stop()
     
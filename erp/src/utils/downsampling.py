@@ -0,0 +1,62 @@
+from typing import Sequence
+
+import numpy as np
+import pandas as pd
+
+
+def lttb_indices(x: Sequence[float], y: Sequence[float], threshold: int) -> np.ndarray:
+    """Largest-Triangle-Three-Buckets 다운샘플링으로 남길 점의 인덱스 반환
+
+    첫 점과 마지막 점은 항상 남기고, 나머지를 threshold - 2개 구간으로 나눠
+    직전에 고른 점과 다음 구간 평균점이 이루는 삼각형 넓이가 가장 큰 점을 구간마다 하나씩 고릅니다.
+    최댓값/최솟값 같은 시각적 특징을 유지하면서 점 개수를 threshold로 고정합니다.
+    """
+    n = len(y)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+
+    x = np.asarray(x, dtype=float)
+    # 빈 구간(NaN)은 넓이 계산에서만 0으로 취급
+    y = np.nan_to_num(np.asarray(y, dtype=float))
+
+    selected = np.empty(threshold, dtype=np.int64)
+    selected[0], selected[-1] = 0, n - 1
+
+    every = (n - 2) / (threshold - 2)
+    a = 0
+    for i in range(threshold - 2):
+        start = int(i * every) + 1
+        end = int((i + 1) * every) + 1
+
+        # 다음 구간의 평균점 (마지막 구간은 마지막 점)
+        next_end = min(int((i + 2) * every) + 1, n)
+        if i == threshold - 3:
+            avg_x, avg_y = x[-1], y[-1]
+        else:
+            avg_x, avg_y = x[end:next_end].mean(), y[end:next_end].mean()
+
+        area = np.abs(
+            (x[a] - avg_x) * (y[start:end] - y[a])
+            - (x[a] - x[start:end]) * (avg_y - y[a])
+        )
+        a = start + int(area.argmax())
+        selected[i + 1] = a
+
+    return selected
+
+
+def downsample_frame(frame: pd.DataFrame, max_points: int) -> pd.DataFrame:
+    """시간 인덱스 DataFrame을 열마다 LTTB로 줄여 max_points 이하의 행만 남김
+
+    열별로 고른 점의 합집합을 사용하므로 각 열의 봉우리가 모두 유지됩니다.
+    """
+    if len(frame) <= max_points or frame.empty or not len(frame.columns):
+        return frame
+
+    x = frame.index.asi8 if isinstance(frame.index, pd.DatetimeIndex) else np.arange(len(frame))
+    per_column = max(3, max_points // len(frame.columns))
+
+    indexes = np.unique(np.concatenate([
+        lttb_indices(x, frame[column].to_numpy(), per_column) for column in frame.columns
+    ]))
+    return frame.iloc[indexes]
@@ -0,0 +1,185 @@
+import csv
+import ipaddress
+import json
+import logging
+import mmap
+import os
+import struct
+import threading
+from functools import lru_cache
+from typing import Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 파일 구조: 헤더 | 레코드(시작 IP 16B, 끝 IP 16B, 위치 번호 4B) × N | 위치 목록(JSON)
+# IPv4는 IPv4-mapped IPv6(::ffff:a.b.c.d)로 저장하여 모든 주소를 16바이트 빅엔디언으로 비교
+_MAGIC = b'GEOIDX01'
+_HEADER = struct.Struct('>8sIQ')  # magic, 레코드 수, 위치 목록 오프셋
+_RECORD = struct.Struct('>16s16sI')
+_IPV4_MAPPED_PREFIX = b'\x00' * 10 + b'\xff\xff'
+
+Location = Tuple[Optional[str], Optional[str]]
+
+
+def _ip_key(ip: str) -> bytes:
+    """IP 문자열을 정렬/비교용 16바이트 키로 변환"""
+    address = ipaddress.ip_address(ip.strip())
+    if address.version == 4:
+        return _IPV4_MAPPED_PREFIX + address.packed
+    return address.packed
+
+
+def build_geoip_index(rows: Iterable[Tuple[str, str, Optional[str], Optional[str]]], output_path: str) -> int:
+    """(시작 IP, 끝 IP, 국가, 도시) 범위 목록을 정렬된 이진 인덱스 파일로 저장하고 레코드 수 반환"""
+    locations: List[Location] = []
+    location_ids = {}
+    records = []
+
+    for start_ip, end_ip, country, city in rows:
+        location = (country or None, city or None)
+        if location not in location_ids:
+            location_ids[location] = len(locations)
+            locations.append(location)
+        records.append((_ip_key(start_ip), _ip_key(end_ip), location_ids[location]))
+
+    records.sort()
+
+    # 임시 파일에 쓴 뒤 교체하여 실행 중인 프로세스가 반쯤 쓴 파일을 매핑하지 않도록 함
+    temp_path = f"{output_path}.tmp"
+    os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
+    with open(temp_path, 'wb') as f:
+        locations_offset = _HEADER.size + _RECORD.size * len(records)
+        f.write(_HEADER.pack(_MAGIC, len(records), locations_offset))
+        for record in records:
+            f.write(_RECORD.pack(*record))
+        f.write(json.dumps(locations, ensure_ascii=False).encode('utf-8'))
+    os.replace(temp_path, output_path)
+
+    return len(records)
+
+
+def _range_bound(value: str) -> str:
+    """범위 경계값을 IP 문자열로 변환 (IP2Location은 10진 정수로 저장)"""
+    value = value.strip()
+    if value.isdigit():
+        # IPv6 버전 파일의 IPv4 범위는 ::ffff:a.b.c.d 정수이며 인덱스의 IPv4 키와 같은 값이 됨
+        return str(ipaddress.ip_address(int(value)))
+    _ip_key(value)
+    return value
+
+
+def read_range_csv(path: str, country_column: int = 2, city_column: Optional[int] = None):
+    """IP 범위 CSV 읽기 (DB-IP / IP2Location LITE 형식: 시작 IP, 끝 IP, 국가[, …, 도시])
+
+    DB-IP는 IP 문자열, IP2Location은 10진 정수 경계값을 사용하며 둘 다 지원합니다.
+    읽은 범위가 하나도 없으면 컬럼 설정이나 형식이 잘못된 것으로 보고 ValueError를 발생시킵니다.
+    """
+    count = 0
+    with open(path, newline='', encoding='utf-8') as f:
+        for row in csv.reader(f):
+            if len(row) <= country_column:
+                continue
+            try:
+                start_ip, end_ip = _range_bound(row[0]), _range_bound(row[1])
+            except ValueError:
+                # 헤더 행 등 IP가 아닌 행은 건너뜀
+                continue
+            city = row[city_column] if city_column is not None and len(row) > city_column else None
+            count += 1
+            yield start_ip, end_ip, row[country_column], city
+
+    if count == 0:
+        raise ValueError(f"IP 범위를 하나도 읽지 못했습니다 (형식 / 컬럼 번호 확인): {path}")
+
+
+class GeoIPIndex:
+    """메모리 매핑된 IP 범위 인덱스 (이진 탐색 + LRU 캐시)"""
+
+    def __init__(self, path: str, cache_size: int = 4096):
+        self.path = path
+        self._file = open(path, 'rb')
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, self.record_count, locations_offset = _HEADER.unpack_from(self._mmap, 0)
+        if magic != _MAGIC:
+            self.close()
+            raise ValueError(f"GeoIP 인덱스 파일 형식이 아닙니다: {path}")
+
+        self._locations: List[Location] = [
+            tuple(location) for location in json.loads(self._mmap[locations_offset:].decode('utf-8'))
+        ]
+        # 같은 IP의 반복 조회(재로그인, 같은 사무실)는 탐색 없이 반환
+        self.lookup = lru_cache(maxsize=cache_size)(self._lookup)
+
+    def _lookup(self, ip: str) -> Optional[Location]:
+        """IP가 속한 범위의 (국가, 도시) 반환 (없으면 None)"""
+        try:
+            key = _ip_key(ip)
+        except ValueError:
+            return None
+
+        # 시작 IP <= key 인 마지막 레코드 탐색
+        low, high = 0, self.record_count
+        while low < high:
+            mid = (low + high) // 2
+            offset = _HEADER.size + mid * _RECORD.size
+            if self._mmap[offset:offset + 16] <= key:
+                low = mid + 1
+            else:
+                high = mid
+
+        if low == 0:
+            return None
+
+        start, end, location_id = _RECORD.unpack_from(self._mmap, _HEADER.size + (low - 1) * _RECORD.size)
+        if key > end:
+            return None
+        return self._locations[location_id]
+
+    def close(self):
+        self._mmap.close()
+        self._file.close()
+
+
+def enrich_login_locations(geoip: GeoIPIndex):
+    """이벤트 로거용: login_history 행의 IP로 국가/도시 채우기"""
+    from src.database.models import LoginHistory
+
+    def _enrich(model, rows):
+        if model is not LoginHistory:
+            return
+
+        for row in rows:
+            if not row.get('ip_address') or row.get('location_country'):
+                continue
+            location = geoip.lookup(row['ip_address'])
+            if location:
+                row['location_country'], row['location_city'] = location
+
+    return _enrich
+
+
+_geoip_index: Optional[GeoIPIndex] = None
+_geoip_loaded = False
+_geoip_lock = threading.Lock()
+
+
+def get_geoip_index() -> Optional[GeoIPIndex]:
+    """프로세스 단위 GeoIP 인덱스 반환 (GEOIP_DB_PATH 미설정 또는 파일이 없으면 None)"""
+    global _geoip_index, _geoip_loaded
+
+    with _geoip_lock:
+        if not _geoip_loaded:
+            _geoip_loaded = True
+            path = os.getenv("GEOIP_DB_PATH")
+
+            if path and os.path.exists(path):
+                try:
+                    _geoip_index = GeoIPIndex(path, cache_size=int(os.getenv("GEOIP_CACHE_SIZE", "4096")))
+                    logger.info("GeoIP 인덱스 로드: %s (%d개 범위)", path, _geoip_index.record_count)
+                except Exception:
+                    logger.exception("GeoIP 인덱스 로드 실패: %s", path)
+            elif path:
+                logger.warning("GeoIP 인덱스 파일이 없습니다: %s", path)
+
+        return _geoip_index
@@ -0,0 +1,79 @@
+import os
+import socket
+import time
+from typing import Any, Callable, Dict
+
+from dotenv import load_dotenv
+
+from src.utils.metrics_registry import get_registry
+
+# 응답에 표시할 인스턴스 식별자 (로드 밸런서 뒤에서 어느 인스턴스가 응답했는지 확인용)
+REPLICA_ID = os.getenv("REPLICA_ID") or socket.gethostname()
+
+_started_at = time.time()
+
+
+def _run_check(check: Callable[[], None]) -> Dict[str, Any]:
+    started = time.perf_counter()
+    try:
+        check()
+        result: Dict[str, Any] = {'ok': True}
+    except Exception as e:
+        result = {'ok': False, 'error': f"{type(e).__name__}: {e}"}
+    result['ms'] = round((time.perf_counter() - started) * 1000, 1)
+    return result
+
+
+def _check_database():
+    from sqlalchemy import text
+
+    from src.database.supabase_client import engine
+
+    with engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+
+
+def _check_redis(redis_url: str, timeout: float):
+    import redis
+
+    client = redis.Redis.from_url(redis_url, socket_timeout=timeout, socket_connect_timeout=timeout)
+    try:
+        client.ping()
+    finally:
+        client.close()
+
+
+def liveness() -> Dict[str, Any]:
+    """프로세스 생존 여부 (외부 의존성은 확인하지 않음)"""
+    return {
+        'status': 'ok',
+        'replica': REPLICA_ID,
+        'uptime_seconds': round(time.time() - _started_at, 1),
+    }
+
+
+def readiness(timeout: float = 1.0) -> Dict[str, Any]:
+    """요청을 받을 준비 여부 (설정된 DB / Redis 연결 확인)
+
+    하나라도 실패하면 status가 'fail'이 되어 로드 밸런서가 이 인스턴스로 보내지 않도록 합니다.
+    """
+    load_dotenv()
+    from src.database.supabase_client import engine
+
+    checks: Dict[str, Dict[str, Any]] = {}
+    if engine is not None:
+        checks['database'] = _run_check(_check_database)
+
+    redis_url = os.getenv("REDIS_URL")
+    if redis_url:
+        checks['redis'] = _run_check(lambda: _check_redis(redis_url, timeout))
+
+    ready = all(check['ok'] for check in checks.values())
+    if not ready:
+        get_registry().counter('health.readiness_failures', '준비 상태 확인 실패 수').inc()
+
+    return {
+        'status': 'ok' if ready else 'fail',
+        'replica': REPLICA_ID,
+        'checks': checks,
+    }
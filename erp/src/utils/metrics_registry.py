@@ -0,0 +1,152 @@
+import json
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Dict, Optional
+
+
+class Counter:
+    """누적 카운터"""
+
+    def __init__(self, name: str, description: str = ""):
+        self.name = name
+        self.description = description
+        self._value = 0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: int = 1):
+        with self._lock:
+            self._value += amount
+
+    @property
+    def value(self) -> int:
+        return self._value
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {'type': 'counter', 'value': self._value}
+
+
+class Gauge:
+    """현재 값 게이지 (콜백을 주면 조회 시점에 값을 계산)"""
+
+    def __init__(self, name: str, description: str = "", fn: Optional[Callable[[], float]] = None):
+        self.name = name
+        self.description = description
+        self._fn = fn
+        self._value = 0.0
+        self._max = 0.0
+        self._lock = threading.Lock()
+
+    def set(self, value: float):
+        with self._lock:
+            self._value = value
+            self._max = max(self._max, value)
+
+    @property
+    def value(self) -> float:
+        if self._fn is not None:
+            try:
+                return self._fn()
+            except Exception:
+                return 0.0
+        return self._value
+
+    def snapshot(self) -> Dict[str, Any]:
+        if self._fn is not None:
+            return {'type': 'gauge', 'value': self.value}
+        return {'type': 'gauge', 'value': self._value, 'max': self._max}
+
+
+class Histogram:
+    """최근 관측값 기반 히스토그램 (최대 window개만 보관하여 메모리 고정)"""
+
+    def __init__(self, name: str, description: str = "", window: int = 1024):
+        self.name = name
+        self.description = description
+        self._samples: deque = deque(maxlen=window)
+        self._count = 0
+        self._sum = 0.0
+        self._max = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float):
+        with self._lock:
+            self._samples.append(value)
+            self._count += 1
+            self._sum += value
+            self._max = max(self._max, value)
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            samples = sorted(self._samples)
+            count, total, max_value = self._count, self._sum, self._max
+
+        if not samples:
+            return {'type': 'histogram', 'count': 0}
+
+        return {
+            'type': 'histogram',
+            'count': count,
+            'mean': round(total / count, 3),
+            'p50': round(_percentile(samples, 0.50), 3),
+            'p95': round(_percentile(samples, 0.95), 3),
+            'p99': round(_percentile(samples, 0.99), 3),
+            'max': round(max_value, 3),
+        }
+
+
+def _percentile(ordered, q: float) -> float:
+    return ordered[min(len(ordered) - 1, int(len(ordered) * q))]
+
+
+class MetricsRegistry:
+    """프로세스 내 경량 메트릭 저장소"""
+
+    def __init__(self):
+        self._metrics: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+        self.started_at = time.time()
+
+    def counter(self, name: str, description: str = "") -> Counter:
+        return self._get_or_create(name, lambda: Counter(name, description))
+
+    def gauge(self, name: str, description: str = "", fn: Optional[Callable[[], float]] = None) -> Gauge:
+        return self._get_or_create(name, lambda: Gauge(name, description, fn))
+
+    def histogram(self, name: str, description: str = "", window: int = 1024) -> Histogram:
+        return self._get_or_create(name, lambda: Histogram(name, description, window))
+
+    def _get_or_create(self, name: str, factory):
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = factory()
+                self._metrics[name] = metric
+            return metric
+
+    def snapshot(self, prefix: str = "") -> Dict[str, Any]:
+        """메트릭 스냅샷 (prefix로 시작하는 항목만)"""
+        with self._lock:
+            metrics = [(name, metric) for name, metric in self._metrics.items() if name.startswith(prefix)]
+
+        return {name: metric.snapshot() for name, metric in sorted(metrics)}
+
+    def export_json(self, prefix: str = "") -> str:
+        """내보내기용 JSON 문자열"""
+        return json.dumps({
+            'captured_at': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+            'uptime_seconds': round(time.time() - self.started_at, 1),
+            'metrics': self.snapshot(prefix),
+        }, ensure_ascii=False, indent=2)
+
+
+_registry = MetricsRegistry()
+
+
+def get_registry() -> MetricsRegistry:
+    """프로세스 전역 메트릭 저장소 반환"""
+    return _registry
@@ -0,0 +1,64 @@
+import time
+from contextlib import contextmanager
+from typing import Dict, Optional
+
+import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+from src.utils.metrics_registry import get_registry
+from src.utils.tracing import get_tracer
+
+# 구간별 실행 시간 히스토그램 이름 접두사 (timing.<구간>)
+TIMING_PREFIX = 'timing.'
+
+# 현재 rerun의 구간별 실행 시간을 보관하는 session_state 키
+_RERUN_TIMINGS_KEY = '_render_timings'
+
+
+def _current_rerun_timings() -> Optional[Dict[str, float]]:
+    # 백그라운드 스레드나 스크립트 밖에서 호출되면 rerun 기록 없이 히스토그램에만 기록
+    if get_script_run_ctx(suppress_warning=True) is None:
+        return None
+    return st.session_state.setdefault(_RERUN_TIMINGS_KEY, {})
+
+
+def _trace_scope(section: str):
+    # 백그라운드 스레드(워밍업 등)는 trace를 만들지 않고 진행 중인 trace에만 구간을 기록
+    ctx = get_script_run_ctx(suppress_warning=True)
+    tracer = get_tracer()
+    if ctx is None or tracer.is_tracing():
+        return tracer.span(section)
+    return tracer.trace(section, session_id=ctx.session_id, fragment=bool(ctx.fragment_ids_this_run))
+
+
+@contextmanager
+def timed(section: str):
+    """구간 실행 시간(ms) 측정 (컨텍스트 매니저 / 데코레이터 겸용)
+
+    전체 기간 분포는 메트릭 저장소의 timing.<구간> 히스토그램에,
+    현재 rerun의 값은 session_state에 기록되어 디버그 사이드바에서 확인할 수 있습니다.
+    rerun trace 안에서 호출되면 같은 이름의 하위 구간도 기록되고,
+    trace 밖의 스크립트 실행(st.fragment 단독 rerun)에서는 이 구간을 루트로 새 trace를 엽니다.
+    """
+    started = time.perf_counter()
+    try:
+        with _trace_scope(section):
+            yield
+    finally:
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        get_registry().histogram(f'{TIMING_PREFIX}{section}', f'{section} 실행 시간(ms)').observe(elapsed_ms)
+
+        timings = _current_rerun_timings()
+        if timings is not None:
+            # 한 rerun에서 같은 구간이 여러 번 실행되면 합산
+            timings[section] = timings.get(section, 0.0) + elapsed_ms
+
+
+def begin_rerun():
+    """rerun 시작 시 이전 rerun의 구간 기록 초기화"""
+    st.session_state[_RERUN_TIMINGS_KEY] = {}
+
+
+def get_rerun_timings() -> Dict[str, float]:
+    """현재 rerun에서 지금까지 측정된 구간별 실행 시간(ms)"""
+    return dict(st.session_state.get(_RERUN_TIMINGS_KEY, {}))
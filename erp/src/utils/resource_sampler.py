@@ -0,0 +1,179 @@
+import atexit
+import logging
+import math
+import os
+import threading
+import time
+from array import array
+from typing import Dict, List, Optional, Sequence
+
+from src.utils.metrics_registry import get_registry
+
+logger = logging.getLogger(__name__)
+
+SAMPLE_FIELDS = (
+    'timestamp',
+    'cpu_percent',
+    'memory_percent',
+    'process_rss_mb',
+    'process_connections',
+)
+
+_FIELD_DESCRIPTIONS = {
+    'cpu_percent': '호스트 CPU 사용률(%)',
+    'memory_percent': '호스트 메모리 사용률(%)',
+    'process_rss_mb': '앱 프로세스 RSS(MB)',
+    'process_connections': '앱 프로세스 TCP/UDP 소켓 수',
+}
+
+
+class RingBuffer:
+    """필드별 고정 크기 array('d')에 최근 샘플만 보관하는 링 버퍼
+
+    샘플마다 객체를 만들지 않으므로 용량과 무관하게 메모리 사용량이 고정됩니다.
+    """
+
+    def __init__(self, fields: Sequence[str], capacity: int):
+        self.fields = tuple(fields)
+        self.capacity = max(1, capacity)
+        self._columns: Dict[str, array] = {field: array('d', [math.nan]) * self.capacity for field in self.fields}
+        self._next = 0
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return self._size
+
+    def append(self, sample: Dict[str, float]):
+        with self._lock:
+            for field, column in self._columns.items():
+                column[self._next] = sample.get(field, math.nan)
+            self._next = (self._next + 1) % self.capacity
+            self._size = min(self._size + 1, self.capacity)
+
+    def latest(self) -> Optional[Dict[str, float]]:
+        """가장 최근 샘플 (없으면 None)"""
+        with self._lock:
+            if not self._size:
+                return None
+            index = (self._next - 1) % self.capacity
+            return {field: column[index] for field, column in self._columns.items()}
+
+    def history(self, limit: Optional[int] = None) -> Dict[str, List[float]]:
+        """최근 limit개 샘플을 오래된 순서의 필드별 리스트로 반환"""
+        with self._lock:
+            count = self._size if limit is None else min(limit, self._size)
+            start = (self._next - count) % self.capacity
+            indexes = [(start + offset) % self.capacity for offset in range(count)]
+            return {field: [column[i] for i in indexes] for field, column in self._columns.items()}
+
+
+class ResourceSampler:
+    """호스트 / 프로세스 자원 사용량을 주기적으로 수집하는 백그라운드 작업
+
+    화면에서는 수집된 값을 메모리에서 읽기만 하므로 렌더링 중 psutil 호출로 지연되지 않습니다.
+    """
+
+    def __init__(self, interval: float = 5.0, capacity: int = 720):
+        import psutil
+
+        self._psutil = psutil
+        self._process = psutil.Process()
+        self.interval = interval
+        self.buffer = RingBuffer(SAMPLE_FIELDS, capacity)
+
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        # cpu_percent(None)는 직전 호출 이후 사용률을 반환하므로 기준점을 먼저 잡아 둠
+        psutil.cpu_percent(None)
+
+        registry = get_registry()
+        self._sample_ms = registry.histogram('system.sampler.sample_ms', '자원 샘플 수집 시간(ms)')
+        for field, description in _FIELD_DESCRIPTIONS.items():
+            registry.gauge(f'system.{field}', description, fn=lambda field=field: self._latest_value(field))
+
+    def start(self):
+        """백그라운드 수집 스레드 시작"""
+        if self._thread is not None:
+            return
+
+        self._thread = threading.Thread(target=self._run, name="resource-sampler", daemon=True)
+        self._thread.start()
+        atexit.register(self.shutdown)
+
+    def shutdown(self, timeout: float = 5.0):
+        """수집 스레드 종료"""
+        if self._thread is None:
+            return
+
+        self._stop_event.set()
+        self._thread.join(timeout)
+        self._thread = None
+
+    def _run(self):
+        while not self._stop_event.is_set():
+            try:
+                self.sample_once()
+            except Exception:
+                logger.exception("자원 사용량 수집 실패")
+
+            self._stop_event.wait(self.interval)
+
+    def sample_once(self) -> Dict[str, float]:
+        """현재 자원 사용량을 한 번 수집하여 버퍼에 추가"""
+        psutil = self._psutil
+        started = time.perf_counter()
+
+        sample = {
+            'timestamp': time.time(),
+            'cpu_percent': psutil.cpu_percent(None),
+            'memory_percent': psutil.virtual_memory().percent,
+            'process_rss_mb': self._process.memory_info().rss / (1024 * 1024),
+        }
+        try:
+            # psutil 6.0 미만에는 net_connections가 없고 connections만 있음
+            net_connections = getattr(self._process, 'net_connections', None) or self._process.connections
+            sample['process_connections'] = float(len(net_connections(kind='inet')))
+        except psutil.Error:
+            # 일부 플랫폼(macOS 등)에서는 권한 없이 소켓 목록을 읽을 수 없음
+            sample['process_connections'] = math.nan
+
+        self.buffer.append(sample)
+        self._sample_ms.observe((time.perf_counter() - started) * 1000)
+        return sample
+
+    def latest(self) -> Optional[Dict[str, float]]:
+        return self.buffer.latest()
+
+    def history(self, limit: Optional[int] = None) -> Dict[str, List[float]]:
+        return self.buffer.history(limit)
+
+    def _latest_value(self, field: str) -> float:
+        latest = self.buffer.latest()
+        return latest[field] if latest else 0.0
+
+
+_resource_sampler: Optional[ResourceSampler] = None
+_resource_sampler_loaded = False
+_resource_sampler_lock = threading.Lock()
+
+
+def get_resource_sampler(start: bool = True) -> Optional[ResourceSampler]:
+    """프로세스 단위 자원 수집 작업 반환 (psutil 미설치 시 None)"""
+    global _resource_sampler, _resource_sampler_loaded
+
+    with _resource_sampler_lock:
+        if not _resource_sampler_loaded:
+            _resource_sampler_loaded = True
+            try:
+                _resource_sampler = ResourceSampler(
+                    interval=float(os.getenv("RESOURCE_SAMPLE_INTERVAL", "5")),
+                    capacity=int(os.getenv("RESOURCE_SAMPLE_CAPACITY", "720")),
+                )
+            except ImportError:
+                logger.warning("psutil이 설치되지 않아 시스템 자원 수집을 건너뜁니다")
+
+        if start and _resource_sampler is not None:
+            _resource_sampler.start()
+        return _resource_sampler
@@ -1,8 +1,21 @@
 import streamlit as st
-import json
 import time
+import uuid
 from typing import Optional, Dict, Any
 from datetime import datetime, timedelta
+from src.components.browser_bridge import mark_restored, queue_session, render_browser_bridge
+from src.utils.client_info import get_client_ip, get_user_agent
+
+
+def _event_logger():
+    # DB 계층(SQLAlchemy)은 로그인 화면 렌더링에 필요 없으므로 처음 사용할 때 import
+    from src.database.event_logger import get_event_logger
+    return get_event_logger()
+
+
+def _session_store():
+    from src.database.session_store import get_session_store
+    return get_session_store()
 
 
 class SessionManager:
@@ -22,93 +35,63 @@ class SessionManager:
             'user_info': None,
             'login_attempts': 0,
             'last_login_time': None,
-            'session_restored': False
+            'login_history_key': None,
+            'auth_session_key': None,
+            'last_viewed_page': None
         }
         
         for key, value in defaults.items():
             if key not in st.session_state:
                 st.session_state[key] = value
+        
+        # 활동 기록용 세션 식별자
+        if 'session_id' not in st.session_state:
+            st.session_state.session_id = str(uuid.uuid4())
 
     def _restore_session_from_browser(self):
-        """브라우저에서 세션 복원"""
-        if st.session_state.get('session_restored', False):
+        """브라우저 세션 브리지 렌더링 및 sessionStorage에 저장된 세션 복원"""
+        restored = render_browser_bridge(self.get_session_id(), st.session_state.get('authenticated', False))
+        if not restored or st.session_state.get('authenticated', False):
             return
-            
-        # JavaScript를 통해 sessionStorage에서 데이터 가져오기
-        session_data_js = """
-        <script>
-        function getSessionData() {
-            const sessionData = sessionStorage.getItem('streamlit_auth_session');
-            if (sessionData) {
-                try {
-                    const data = JSON.parse(sessionData);
-                    // 만료 시간 체크
-                    const now = new Date().getTime();
-                    if (data.expires_at && now < data.expires_at) {
-                        // 세션이 유효한 경우 Streamlit으로 전달
-                        window.parent.postMessage({
-                            type: 'restore_session',
-                            data: data
-                        }, '*');
-                    } else {
-                        // 만료된 세션 삭제
-                        sessionStorage.removeItem('streamlit_auth_session');
-                    }
-                } catch (e) {
-                    console.error('Session data parsing error:', e);
-                    sessionStorage.removeItem('streamlit_auth_session');
-                }
-            }
-        }
         
-        // 페이지 로드 시 실행
-        if (document.readyState === 'loading') {
-            document.addEventListener('DOMContentLoaded', getSessionData);
-        } else {
-            getSessionData();
-        }
-        
-        // 메시지 리스너 추가 (Streamlit에서 세션 저장 요청 시)
-        window.addEventListener('message', function(event) {
-            if (event.data.type === 'save_session') {
-                sessionStorage.setItem('streamlit_auth_session', JSON.stringify(event.data.data));
-            } else if (event.data.type === 'clear_session') {
-                sessionStorage.removeItem('streamlit_auth_session');
-            }
-        });
-        </script>
-        """
+        # 만료 시간 체크 (expires_at은 JavaScript timestamp(ms))
+        try:
+            expires_at = float(restored['expires_at']) / 1000
+            login_time = datetime.fromtimestamp(float(restored['login_time']))
+        except (KeyError, TypeError, ValueError):
+            queue_session(None)
+            return
         
-        # JavaScript 실행
-        st.components.v1.html(session_data_js, height=0)
+        if time.time() >= expires_at:
+            queue_session(None)
+            return
         
-        # 세션 복원 시도
-        self._check_for_restored_session()
+        store = _session_store()
+        if restored.get('session_key') and store is not None:
+            # 서버 저장소의 세션 (다른 인스턴스에서 로그인했거나 로그아웃된 세션도 반영)
+            record = store.load(restored['session_key'])
+            if record is None:
+                queue_session(None)
+                return
+            
+            access_token = record['access_token']
+            user_info = record['user_info']
+            login_time = record['expires_at'].astimezone().replace(tzinfo=None) - timedelta(hours=self.SESSION_TIMEOUT_HOURS)
+            st.session_state.auth_session_key = restored['session_key']
+        else:
+            # 브라우저 저장값은 위조될 수 있으므로 토큰만 사용 (사용자 정보는 토큰 검증 시 Cognito에서 다시 조회)
+            access_token = restored.get('access_token')
+            user_info = None
+            if not access_token:
+                queue_session(None)
+                return
         
-        st.session_state.session_restored = True
-
-    def _check_for_restored_session(self):
-        """복원된 세션 데이터 확인"""
-        # URL 파라미터를 통해 세션 복원 데이터 확인
-        query_params = st.query_params
-        
-        if 'session_token' in query_params and 'session_user' in query_params:
-            try:
-                # URL에서 세션 데이터 복원 (보안을 위해 간단한 토큰만)
-                token = query_params['session_token'][0]
-                user_data = json.loads(query_params['session_user'][0])
-                
-                # 간단한 토큰 검증 (실제로는 더 복잡한 검증 필요)
-                if token and user_data:
-                    st.session_state.authenticated = True
-                    st.session_state.access_token = token
-                    st.session_state.user_info = user_data
-                    st.session_state.last_login_time = datetime.now()
-                    
-                    # URL 파라미터 제거
-                    st.experimental_set_query_params()
-            except Exception as e:
-                st.error(f"세션 복원 중 오류 발생: {str(e)}")    
+        # 토큰 유효성 검증 / 사용자 정보 갱신은 CognitoAuth 초기화 시 기존 세션 확인에서 수행
+        st.session_state.authenticated = True
+        st.session_state.access_token = access_token
+        st.session_state.user_info = user_info
+        st.session_state.last_login_time = login_time
+        mark_restored(restored)
     
     def is_authenticated(self) -> bool:
         """인증 상태 확인"""
@@ -137,25 +120,25 @@ class SessionManager:
         st.session_state.last_login_time = current_time
         st.session_state.login_attempts = 0
         
-        # 브라우저 sessionStorage에 저장할 데이터 준비
-        session_data = {
-            'access_token': access_token,
-            'user_info': user_info,
+        browser_session = {
             'login_time': current_time.timestamp(),
             'expires_at': expires_at.timestamp() * 1000  # JavaScript timestamp (ms)
         }
         
-        # JavaScript를 통해 sessionStorage에 저장
-        save_session_js = f"""
-        <script>
-        window.parent.postMessage({{
-            type: 'save_session',
-            data: {json.dumps(session_data)}
-        }}, '*');
-        </script>
-        """
+        # 서버 저장소가 있으면 토큰은 DB에 두고 브라우저에는 세션 키만 저장 (여러 인스턴스 간 복원)
+        store = _session_store()
+        session_key = st.session_state.get('auth_session_key') or (store.new_key() if store else None)
+        if store is not None and store.save(
+            session_key, access_token, user_info, expires_at,
+            ip_address=get_client_ip(), user_agent=get_user_agent()
+        ):
+            st.session_state.auth_session_key = session_key
+            browser_session['session_key'] = session_key
+        else:
+            browser_session['access_token'] = access_token
         
-        st.components.v1.html(save_session_js, height=0)
+        # 브라우저 sessionStorage에 저장 (변경된 필드만 브리지로 전송)
+        queue_session(browser_session)
         
         # 성공 메시지
         st.success("🎉 로그인이 완료되었습니다! 새로고침해도 로그인 상태가 유지됩니다.")
@@ -167,17 +150,22 @@ class SessionManager:
         st.session_state.access_token = None
         st.session_state.user_info = None
         st.session_state.last_login_time = None
+        st.session_state.last_viewed_page = None
         
-        # JavaScript를 통해 sessionStorage에서 삭제
-        clear_session_js = """
-            <script>
-            window.parent.postMessage({
-                type: 'clear_session'
-            }, '*');
-            </script>
-        """
+        # 서버 저장소의 세션 비활성화 (다른 인스턴스에서도 복원되지 않도록)
+        session_key = st.session_state.get('auth_session_key')
+        if session_key:
+            store = _session_store()
+            if store is not None:
+                store.revoke(session_key)
+            st.session_state.auth_session_key = None
         
-        st.components.v1.html(clear_session_js, height=0)
+        # 브라우저 sessionStorage에서 삭제
+        queue_session(None)
+    
+    def set_user_info(self, user_info: Dict[str, Any]):
+        """검증된 토큰으로 조회한 사용자 정보로 교체"""
+        st.session_state.user_info = user_info
     
     def get_user_info(self) -> Optional[Dict[str, Any]]:
         """사용자 정보 반환"""
@@ -195,6 +183,53 @@ class SessionManager:
         """로그인 시도 횟수 반환"""
         return st.session_state.get('login_attempts', 0)
     
+    def get_session_id(self) -> str:
+        """현재 세션 식별자 반환"""
+        return st.session_state.session_id
+    
+    def record_login(self, user_id: str, username: str, success: bool = True, failure_reason: Optional[str] = None):
+        """로그인 이력 기록 (비동기 일괄 저장)"""
+        login_key = _event_logger().log_login(
+            user_id=user_id,
+            username=username,
+            success=success,
+            failure_reason=failure_reason,
+            ip_address=get_client_ip(),
+            user_agent=get_user_agent()
+        )
+        
+        if success:
+            st.session_state.login_history_key = login_key
+    
+    def record_logout(self):
+        """로그인 이력에 로그아웃 시간 기록"""
+        login_key = st.session_state.get('login_history_key')
+        if login_key:
+            _event_logger().log_logout(login_key)
+            st.session_state.login_history_key = None
+    
+    def log_activity(self, activity_type: str, activity_detail: Optional[Dict[str, Any]] = None, page_path: Optional[str] = None):
+        """사용자 활동 기록 (비동기 일괄 저장)"""
+        user_info = self.get_user_info() or {}
+        
+        _event_logger().log_activity(
+            session_id=self.get_session_id(),
+            user_id=user_info.get('sub', 'anonymous'),
+            activity_type=activity_type,
+            activity_detail=activity_detail,
+            page_path=page_path,
+            ip_address=get_client_ip(),
+            user_agent=get_user_agent()
+        )
+    
+    def log_page_view(self, page_path: str):
+        """페이지 조회 기록 (위젯 조작으로 인한 rerun은 제외하고 페이지 이동 시에만 기록)"""
+        if st.session_state.get('last_viewed_page') == page_path:
+            return
+        
+        st.session_state.last_viewed_page = page_path
+        self.log_activity('page_view', page_path=page_path)
+    
     def get_last_login_time(self):
         """마지막 로그인 시간 반환"""
         return st.session_state.get('last_login_time')
@@ -0,0 +1,344 @@
+import io
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from typing import Any, Callable, Dict, Optional
+
+from dotenv import load_dotenv
+
+from src.utils.metrics_registry import get_registry
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CacheEntry:
+    """캐시된 결과 (시각은 여러 인스턴스가 공유하도록 time.time() 기준)"""
+    value: Any
+    fresh_until: float
+    stale_until: float
+
+
+def _encode_value(value: Any) -> Any:
+    """캐시 값을 JSON으로 표현 가능한 형태로 변환 (지원하지 않는 타입은 TypeError)
+
+    공유 Redis에 저장되는 값이므로 pickle 대신 데이터만 담는 JSON을 사용합니다.
+    """
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, datetime):
+        return {'__type__': 'datetime', 'value': value.isoformat()}
+    if isinstance(value, date):
+        return {'__type__': 'date', 'value': value.isoformat()}
+    if isinstance(value, timedelta):
+        return {'__type__': 'timedelta', 'value': value.total_seconds()}
+    if isinstance(value, tuple):
+        return {'__type__': 'tuple', 'value': [_encode_value(item) for item in value]}
+    if isinstance(value, list):
+        return [_encode_value(item) for item in value]
+    if isinstance(value, dict):
+        if not all(isinstance(key, str) for key in value):
+            raise TypeError("문자열이 아닌 키는 공유 캐시에 저장할 수 없습니다")
+        return {'__type__': 'dict', 'value': {key: _encode_value(item) for key, item in value.items()}}
+    if type(value).__module__.startswith('pandas') and type(value).__name__ == 'DataFrame':
+        return {'__type__': 'dataframe', 'value': value.to_json(orient='table', date_format='iso', double_precision=15)}
+    if type(value).__module__ == 'numpy' and hasattr(value, 'item'):
+        return value.item()
+    raise TypeError(f"공유 캐시에 저장할 수 없는 타입입니다: {type(value).__name__}")
+
+
+def _decode_value(value: Any) -> Any:
+    if isinstance(value, list):
+        return [_decode_value(item) for item in value]
+    if not isinstance(value, dict):
+        return value
+
+    kind, data = value.get('__type__'), value.get('value')
+    if kind == 'datetime':
+        return datetime.fromisoformat(data)
+    if kind == 'date':
+        return date.fromisoformat(data)
+    if kind == 'timedelta':
+        return timedelta(seconds=data)
+    if kind == 'tuple':
+        return tuple(_decode_value(item) for item in data)
+    if kind == 'dict':
+        return {key: _decode_value(item) for key, item in data.items()}
+    if kind == 'dataframe':
+        import pandas as pd
+
+        return pd.read_json(io.StringIO(data), orient='table')
+    raise ValueError(f"알 수 없는 캐시 값 타입: {kind}")
+
+
+class SharedCache:
+    """세션 간 공유 결과 캐시 (프로세스 LRU + 선택적 Redis 2단)
+
+    - ttl 동안은 캐시 값을 그대로 반환
+    - ttl 이후 stale_ttl 동안은 이전 값을 즉시 반환하고 백그라운드에서 한 번만 다시 계산
+    - 캐시가 비어 있을 때 같은 키를 동시에 요청하면 한 요청만 계산하고 나머지는 그 결과를 기다림
+      (Redis가 있으면 인스턴스 간에도 잠금 키로 한 곳에서만 계산)
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 256,
+        redis_client=None,
+        key_prefix: str = "shared_cache:",
+        refresh_workers: int = 2,
+        lock_timeout: float = 30.0,
+        lock_wait: float = 2.5,
+        redis_retry_seconds: float = 10.0,
+    ):
+        self.max_entries = max_entries
+        self.key_prefix = key_prefix
+        self.lock_timeout = lock_timeout
+        # 다른 인스턴스가 계산 중일 때 그 결과를 기다리는 최대 시간 (넘으면 직접 계산)
+        self.lock_wait = lock_wait
+        self.redis_retry_seconds = redis_retry_seconds
+        self._redis = redis_client
+        # Redis 오류 후 이 시각(monotonic)까지는 Redis를 건너뛰고 프로세스 캐시만 사용
+        self._redis_down_until = 0.0
+
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._inflight: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self._refresh_pool = ThreadPoolExecutor(max_workers=refresh_workers, thread_name_prefix="cache-refresh")
+
+        registry = get_registry()
+        self._hits = registry.counter('cache.shared.hits', '신선한 캐시 적중 수')
+        self._stale_hits = registry.counter('cache.shared.stale_hits', '만료 직후 이전 값 반환 수 (백그라운드 갱신)')
+        self._misses = registry.counter('cache.shared.misses', '캐시 미적중 수')
+        self._loads = registry.counter('cache.shared.loads', '실제 계산 횟수')
+        self._redis_errors = registry.counter('cache.shared.redis_errors', 'Redis 오류 수')
+        self._redis_skipped = registry.counter('cache.shared.redis_skipped', 'Redis 장애로 건너뛴 호출 수')
+        self._encode_errors = registry.counter('cache.shared.encode_errors', '공유 저장할 수 없는 값 수')
+        self._load_ms = registry.histogram('cache.shared.load_ms', '캐시 값 계산 시간(ms)')
+
+    def get_or_compute(self, key: str, loader: Callable[[], Any], ttl: float, stale_ttl: float = 0.0) -> Any:
+        """key의 캐시 값을 반환하고, 없으면 loader로 계산하여 저장"""
+        entry = self._get_entry(key)
+        now = time.time()
+
+        if entry is not None and now < entry.fresh_until:
+            self._hits.inc()
+            return entry.value
+
+        if entry is not None and now < entry.stale_until:
+            self._stale_hits.inc()
+            self._refresh_in_background(key, loader, ttl, stale_ttl)
+            return entry.value
+
+        self._misses.inc()
+        return self._load_once(key, loader, ttl, stale_ttl).result()
+
+    def invalidate(self, key: str):
+        """key의 캐시 값 삭제 (모든 인스턴스)"""
+        with self._lock:
+            self._entries.pop(key, None)
+        self._redis_call(lambda client: client.delete(self.key_prefix + key))
+
+    def _get_entry(self, key: str) -> Optional[CacheEntry]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+
+        if entry is not None and time.time() < entry.fresh_until:
+            return entry
+
+        # 로컬 값이 없거나 신선하지 않으면 다른 인스턴스가 갱신한 값이 있는지 확인
+        shared = self._get_shared(key)
+        if shared is not None and (entry is None or shared.fresh_until > entry.fresh_until):
+            self._store_local(key, shared)
+            return shared
+        return entry
+
+    def _load_once(self, key: str, loader: Callable[[], Any], ttl: float, stale_ttl: float) -> Future:
+        """같은 키의 계산이 진행 중이면 그 Future를, 아니면 새로 계산하는 Future를 반환"""
+        with self._lock:
+            future = self._inflight.get(key)
+            if future is not None:
+                return future
+            future = Future()
+            self._inflight[key] = future
+
+        try:
+            future.set_result(self._compute(key, loader, ttl, stale_ttl))
+        except BaseException as e:
+            future.set_exception(e)
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+        return future
+
+    def _refresh_in_background(self, key: str, loader: Callable[[], Any], ttl: float, stale_ttl: float):
+        with self._lock:
+            if key in self._inflight:
+                return
+
+        def _refresh():
+            try:
+                self._load_once(key, loader, ttl, stale_ttl).result()
+            except Exception:
+                logger.exception("캐시 백그라운드 갱신 실패: %s", key)
+
+        self._refresh_pool.submit(_refresh)
+
+    def _compute(self, key: str, loader: Callable[[], Any], ttl: float, stale_ttl: float) -> Any:
+        lock_key = f"{self.key_prefix}{key}:lock"
+        # True: 잠금 획득, False: 다른 인스턴스가 계산 중, None: Redis 미설정 또는 오류
+        locked = self._redis_call(
+            lambda client: bool(client.set(lock_key, b"1", nx=True, px=int(self.lock_timeout * 1000)))
+        )
+
+        try:
+            if locked is False:
+                # 다른 인스턴스가 갱신 중이고 이전 값이 아직 유효하면 기다리지 않고 그대로 사용
+                stale = self._get_stale_local(key)
+                if stale is not None:
+                    return stale.value
+
+                # 이전 값이 없으면 그 결과가 저장될 때까지 잠시 대기
+                shared = self._wait_for_shared(key)
+                if shared is not None:
+                    self._store_local(key, shared)
+                    return shared.value
+
+            started = time.perf_counter()
+            value = loader()
+            self._loads.inc()
+            self._load_ms.observe((time.perf_counter() - started) * 1000)
+
+            now = time.time()
+            entry = CacheEntry(value, now + ttl, now + ttl + stale_ttl)
+            self._store_local(key, entry)
+            self._store_shared(key, entry, ttl + stale_ttl)
+            return value
+        finally:
+            if locked:
+                self._redis_call(lambda client: client.delete(lock_key))
+
+    def _get_stale_local(self, key: str) -> Optional[CacheEntry]:
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is not None and time.time() < entry.stale_until:
+            return entry
+        return None
+
+    def _wait_for_shared(self, key: str) -> Optional[CacheEntry]:
+        deadline = time.monotonic() + self.lock_wait
+        while time.monotonic() < deadline:
+            shared = self._get_shared(key)
+            if shared is not None and time.time() < shared.fresh_until:
+                return shared
+            time.sleep(0.05)
+        return None
+
+    def _store_local(self, key: str, entry: CacheEntry):
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            # 메모리 상한 초과 시 가장 오래 사용되지 않은 항목 제거
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def _get_shared(self, key: str) -> Optional[CacheEntry]:
+        payload = self._redis_call(lambda client: client.get(self.key_prefix + key))
+        if not payload:
+            return None
+        try:
+            data = json.loads(payload)
+            return CacheEntry(_decode_value(data['value']), float(data['fresh_until']), float(data['stale_until']))
+        except Exception as e:
+            logger.warning("공유 캐시 값을 읽을 수 없어 무시합니다 (%s): %s", key, e)
+            return None
+
+    def _store_shared(self, key: str, entry: CacheEntry, expires_in: float):
+        if self._redis is None:
+            return
+        try:
+            payload = json.dumps({
+                'value': _encode_value(entry.value),
+                'fresh_until': entry.fresh_until,
+                'stale_until': entry.stale_until,
+            }, ensure_ascii=False)
+        except (TypeError, ValueError) as e:
+            # 공유할 수 없는 값은 프로세스 캐시에만 보관
+            self._encode_errors.inc()
+            logger.warning("공유 캐시에 저장할 수 없는 값 (%s): %s", key, e)
+            return
+        self._redis_call(lambda client: client.set(self.key_prefix + key, payload, px=max(1, int(expires_in * 1000))))
+
+    def _redis_call(self, operation: Callable[[Any], Any]) -> Any:
+        """Redis 작업 실행 (Redis 미설정 / 장애 중이면 None → 프로세스 캐시만 사용)
+
+        오류가 나면 redis_retry_seconds 동안 Redis 호출을 건너뛰어,
+        장애 중에 매 요청이 소켓 타임아웃만큼 기다리거나 경고를 반복하지 않도록 합니다.
+        """
+        if self._redis is None:
+            return None
+        if time.monotonic() < self._redis_down_until:
+            self._redis_skipped.inc()
+            return None
+
+        try:
+            result = operation(self._redis)
+        except Exception as e:
+            self._redis_errors.inc()
+            was_down = self._redis_down_until > 0
+            self._redis_down_until = time.monotonic() + self.redis_retry_seconds
+            if not was_down:
+                logger.warning(
+                    "공유 캐시 Redis 오류, %.0f초 동안 프로세스 캐시만 사용: %s", self.redis_retry_seconds, e
+                )
+            return None
+
+        if self._redis_down_until:
+            self._redis_down_until = 0.0
+            logger.info("공유 캐시 Redis 연결 복구")
+        return result
+
+
+_shared_cache: Optional[SharedCache] = None
+_shared_cache_lock = threading.Lock()
+
+
+def get_shared_cache() -> SharedCache:
+    """프로세스 단위 공유 결과 캐시 반환 (REDIS_URL이 있으면 Redis 2단 캐시 사용)"""
+    global _shared_cache
+
+    with _shared_cache_lock:
+        if _shared_cache is None:
+            load_dotenv()
+
+            redis_client = None
+            redis_url = os.getenv("REDIS_URL")
+            if redis_url:
+                try:
+                    import redis
+                    from redis.backoff import NoBackoff
+                    from redis.retry import Retry
+
+                    # 장애 시 클라이언트 재시도로 요청이 늘어지지 않도록 재시도 없이 짧은 타임아웃만 사용
+                    redis_client = redis.Redis.from_url(
+                        redis_url, socket_timeout=0.5, socket_connect_timeout=0.5, retry=Retry(NoBackoff(), 0)
+                    )
+                except Exception as e:
+                    logger.warning("공유 캐시 Redis 초기화 실패, 프로세스 캐시만 사용: %s", e)
+
+            _shared_cache = SharedCache(
+                max_entries=int(os.getenv("SHARED_CACHE_MAX_ENTRIES", "256")),
+                redis_client=redis_client,
+                key_prefix=os.getenv("SHARED_CACHE_PREFIX", "shared_cache:"),
+                lock_wait=float(os.getenv("SHARED_CACHE_LOCK_WAIT_SECONDS", "2.5")),
+                redis_retry_seconds=float(os.getenv("SHARED_CACHE_REDIS_RETRY_SECONDS", "10")),
+            )
+
+        return _shared_cache
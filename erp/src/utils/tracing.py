@@ -0,0 +1,243 @@
+import json
+import logging
+import os
+import random
+import threading
+import time
+import uuid
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, Iterator, List, Optional
+
+from dotenv import load_dotenv
+
+from src.utils.metrics_registry import get_registry
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class Span:
+    """추적 구간 하나 (시각은 epoch 초, 길이는 ms)"""
+    trace_id: str
+    span_id: str
+    parent_id: Optional[str]
+    name: str
+    start_time: float
+    duration_ms: float = 0.0
+    status: str = 'ok'
+    attributes: Dict[str, Any] = field(default_factory=dict)
+
+
+class _Trace:
+    """진행 중인 trace (루트가 끝날 때까지 구간을 모아 둠)"""
+
+    def __init__(self, trace_id: str, sampled: bool, max_spans: int):
+        self.trace_id = trace_id
+        self.sampled = sampled
+        self.max_spans = max_spans
+        self.spans: List[Span] = []
+        self.dropped = 0
+
+
+# 현재 스레드(스크립트 실행)의 trace / 구간
+_current_trace: ContextVar[Optional[_Trace]] = ContextVar('current_trace', default=None)
+_current_span: ContextVar[Optional[Span]] = ContextVar('current_span', default=None)
+
+
+class InMemoryExporter:
+    """최근 trace를 메모리에 보관 (디버그 화면 / 테스트용)"""
+
+    def __init__(self, capacity: int = 200):
+        self._traces: "deque[List[Dict[str, Any]]]" = deque(maxlen=capacity)
+        self._lock = threading.Lock()
+
+    def export(self, spans: List[Span]):
+        with self._lock:
+            self._traces.append([asdict(span) for span in spans])
+
+    def traces(self) -> List[List[Dict[str, Any]]]:
+        """보관 중인 trace 목록 (오래된 순, 각 trace는 구간 딕셔너리 목록)"""
+        with self._lock:
+            return list(self._traces)
+
+    def export_jsonl(self) -> str:
+        """보관 중인 trace를 파일 내보내기와 같은 JSON Lines 문자열로 반환"""
+        return "".join(json.dumps(trace, ensure_ascii=False, default=str) + "\n" for trace in self.traces())
+
+
+class JsonlFileExporter(InMemoryExporter):
+    """trace 하나를 한 줄(JSON 배열)로 파일에 추가 (오프라인 분석용), 최근 trace는 메모리에도 보관"""
+
+    def __init__(self, path: str, capacity: int = 200):
+        super().__init__(capacity)
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self._file = open(path, 'a', encoding='utf-8')
+        self._file_lock = threading.Lock()
+
+    def export(self, spans: List[Span]):
+        super().export(spans)
+        line = json.dumps([asdict(span) for span in spans], ensure_ascii=False, default=str)
+        with self._file_lock:
+            self._file.write(line + "\n")
+            self._file.flush()
+
+
+class Tracer:
+    """rerun 단위 구간 추적기
+
+    루트 구간(trace) 안에서 열린 구간만 기록하며, 루트가 끝날 때 내보낼지 결정합니다.
+    - sample_rate 비율만큼 무작위로 내보냄 (head 샘플링)
+    - 루트 길이가 slow_ms 이상이면 샘플링과 관계없이 항상 내보냄 (꼬리 지연 분석용)
+    """
+
+    def __init__(self, exporter, sample_rate: float = 0.05, slow_ms: Optional[float] = 1000.0, max_spans: int = 500):
+        self.exporter = exporter
+        self.sample_rate = sample_rate
+        self.slow_ms = slow_ms
+        self.max_spans = max_spans
+
+        registry = get_registry()
+        self._exported = registry.counter('tracing.traces_exported', '내보낸 trace 수')
+        self._slow_exported = registry.counter('tracing.slow_traces_exported', '느려서 샘플링과 무관하게 내보낸 trace 수')
+        self._export_errors = registry.counter('tracing.export_errors', 'trace 내보내기 오류 수')
+
+    @staticmethod
+    def is_tracing() -> bool:
+        """현재 실행 흐름에 진행 중인 trace가 있는지"""
+        return _current_trace.get() is not None
+
+    @contextmanager
+    def trace(self, name: str, **attributes) -> Iterator[Optional[Span]]:
+        """루트 구간 (이미 trace 안이면 일반 구간으로 동작)"""
+        if _current_trace.get() is not None:
+            with self.span(name, **attributes) as span:
+                yield span
+            return
+
+        current = _Trace(uuid.uuid4().hex, random.random() < self.sample_rate, self.max_spans)
+        trace_token = _current_trace.set(current)
+        try:
+            with self.span(name, **attributes) as root:
+                yield root
+        finally:
+            _current_trace.reset(trace_token)
+            self._finish(current)
+
+    @contextmanager
+    def span(self, name: str, **attributes) -> Iterator[Optional[Span]]:
+        """하위 구간 (trace 밖에서는 아무것도 기록하지 않음)"""
+        current = _current_trace.get()
+        if current is None:
+            yield None
+            return
+
+        parent = _current_span.get()
+        span = Span(
+            trace_id=current.trace_id,
+            span_id=uuid.uuid4().hex[:16],
+            parent_id=parent.span_id if parent else None,
+            name=name,
+            start_time=time.time(),
+            attributes=attributes,
+        )
+        span_token = _current_span.set(span)
+        started = time.perf_counter()
+        try:
+            yield span
+        except Exception as e:
+            # st.rerun / st.stop 흐름 제어 예외는 BaseException이므로 오류로 기록되지 않음
+            span.status = 'error'
+            span.attributes['error'] = f"{type(e).__name__}: {e}"[:500]
+            raise
+        finally:
+            span.duration_ms = round((time.perf_counter() - started) * 1000, 3)
+            _current_span.reset(span_token)
+            self._record(current, span)
+
+    def record_span(self, name: str, start_time: float, duration_ms: float, **attributes):
+        """이미 측정된 구간을 현재 구간의 하위로 기록 (이벤트 훅 등 컨텍스트 매니저를 쓸 수 없는 곳)"""
+        current = _current_trace.get()
+        if current is None:
+            return
+
+        parent = _current_span.get()
+        self._record(current, Span(
+            trace_id=current.trace_id,
+            span_id=uuid.uuid4().hex[:16],
+            parent_id=parent.span_id if parent else None,
+            name=name,
+            start_time=start_time,
+            duration_ms=round(duration_ms, 3),
+            status='error' if attributes.get('error') else 'ok',
+            attributes=attributes,
+        ))
+
+    @staticmethod
+    def _record(current: _Trace, span: Span):
+        # 구간이 너무 많은 trace는 앞부분만 보관 (루트는 마지막에 끝나므로 항상 보관)
+        if len(current.spans) < current.max_spans or span.parent_id is None:
+            current.spans.append(span)
+        else:
+            current.dropped += 1
+
+    def _finish(self, current: _Trace):
+        root = next((span for span in current.spans if span.parent_id is None), None)
+        if root is None:
+            return
+
+        slow = self.slow_ms is not None and root.duration_ms >= self.slow_ms
+        if not (current.sampled or slow):
+            return
+
+        root.attributes['sampled'] = current.sampled
+        if current.dropped:
+            root.attributes['dropped_spans'] = current.dropped
+
+        try:
+            self.exporter.export(current.spans)
+        except Exception as e:
+            self._export_errors.inc()
+            logger.warning("trace 내보내기 실패: %s", e)
+            return
+
+        self._exported.inc()
+        if slow and not current.sampled:
+            self._slow_exported.inc()
+
+
+_tracer: Optional[Tracer] = None
+_tracer_lock = threading.Lock()
+
+
+def get_tracer() -> Tracer:
+    """프로세스 단위 추적기 반환 (TRACE_EXPORTER=file이면 TRACE_FILE에 JSON Lines로 기록)"""
+    global _tracer
+
+    with _tracer_lock:
+        if _tracer is None:
+            load_dotenv()
+
+            capacity = int(os.getenv("TRACE_MEMORY_CAPACITY", "200"))
+            exporter = InMemoryExporter(capacity)
+            if os.getenv("TRACE_EXPORTER", "memory").strip().lower() == "file":
+                path = os.getenv("TRACE_FILE", "logs/traces.jsonl")
+                try:
+                    exporter = JsonlFileExporter(path, capacity)
+                except OSError as e:
+                    logger.warning("trace 파일을 열 수 없어 메모리에만 보관합니다 (%s): %s", path, e)
+
+            slow_ms = os.getenv("TRACE_SLOW_MS", "1000")
+            _tracer = Tracer(
+                exporter,
+                sample_rate=float(os.getenv("TRACE_SAMPLE_RATE", "0.05")),
+                slow_ms=float(slow_ms) if slow_ms else None,
+                max_spans=int(os.getenv("TRACE_MAX_SPANS", "500")),
+            )
+
+        return _tracer
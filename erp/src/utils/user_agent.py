@@ -0,0 +1,76 @@
+import re
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Pattern, Tuple
+
+# 앞에서부터 먼저 일치하는 규칙 사용 (Chromium 계열은 Chrome 토큰도 포함하므로 순서가 중요)
+_BROWSER_RULES: List[Tuple[str, Pattern]] = [
+    ('KakaoTalk', re.compile(r'KAKAOTALK', re.I)),
+    ('Naver App', re.compile(r'NAVER\(inapp', re.I)),
+    ('Whale', re.compile(r'Whale/')),
+    ('Samsung Internet', re.compile(r'SamsungBrowser/')),
+    ('Edge', re.compile(r'Edg(e|A|iOS)?/')),
+    ('Opera', re.compile(r'OPR/|Opera')),
+    ('Firefox', re.compile(r'Firefox/|FxiOS/')),
+    ('Chrome', re.compile(r'Chrome/|CriOS/')),
+    ('Safari', re.compile(r'Version/[\d.]+.*Safari/')),
+    ('Internet Explorer', re.compile(r'MSIE |Trident/')),
+]
+
+_OS_RULES: List[Tuple[str, Pattern]] = [
+    ('iOS', re.compile(r'iPhone|iPad|iPod')),
+    ('Android', re.compile(r'Android')),
+    ('Windows', re.compile(r'Windows')),
+    ('ChromeOS', re.compile(r'CrOS')),
+    ('macOS', re.compile(r'Macintosh|Mac OS X')),
+    ('Linux', re.compile(r'Linux')),
+]
+
+_BOT_PATTERN = re.compile(r'bot|crawl|spider|slurp|curl/|wget/|python-requests|httpx|okhttp|headless', re.I)
+_TABLET_PATTERN = re.compile(r'iPad|Tablet|Tab(?!le)')
+_MOBILE_PATTERN = re.compile(r'Mobi|iPhone|iPod')
+
+UNKNOWN = 'Other'
+
+
+def _match(rules: List[Tuple[str, Pattern]], user_agent: str) -> str:
+    for name, pattern in rules:
+        if pattern.search(user_agent):
+            return name
+    return UNKNOWN
+
+
+@lru_cache(maxsize=2048)
+def classify_user_agent(user_agent: Optional[str]) -> Dict[str, Optional[str]]:
+    """User-Agent 문자열을 브라우저 / OS / 기기 유형으로 분류
+
+    같은 수백 개의 문자열이 대부분이므로 결과를 문자열 기준으로 캐시합니다.
+    반환된 딕셔너리는 캐시와 공유되므로 수정하지 말고 복사해서 사용해야 합니다.
+    """
+    if not user_agent or not user_agent.strip():
+        return {'browser': None, 'os': None, 'device_type': None}
+
+    if _BOT_PATTERN.search(user_agent):
+        device_type = 'bot'
+    elif _TABLET_PATTERN.search(user_agent) or ('Android' in user_agent and 'Mobile' not in user_agent):
+        device_type = 'tablet'
+    elif _MOBILE_PATTERN.search(user_agent):
+        device_type = 'mobile'
+    else:
+        device_type = 'desktop'
+
+    return {
+        'browser': _match(_BROWSER_RULES, user_agent),
+        'os': _match(_OS_RULES, user_agent),
+        'device_type': device_type,
+    }
+
+
+def enrich_user_agents(model, rows: List[Dict[str, Any]]):
+    """이벤트 로거용: user_agent가 있는 행에 browser / os / device_type 채우기"""
+    if not hasattr(model, 'device_type'):
+        return
+
+    for row in rows:
+        if 'device_type' in row:
+            continue
+        row.update(classify_user_agent(row.get('user_agent')))
@@ -0,0 +1,64 @@
+import importlib
+import logging
+import threading
+
+from src.utils.profiling import timed
+
+logger = logging.getLogger(__name__)
+
+# 로그인 이후 화면에서만 쓰는 모듈 (pandas / numpy / 차트 등, 로그인 화면에는 필요 없음)
+DEFERRED_MODULES = (
+    'src.pages.dashboard',
+    'src.pages.user_directory',
+    'src.pages.history_browser',
+)
+
+_started = False
+_started_lock = threading.Lock()
+
+
+def _start_background_jobs():
+    # 만료 세션 정리 / 시스템 설정 캐시 / 지표 롤업 / 자원 수집 작업 (프로세스당 한 번)
+    from src.database.rollups import get_rollup_job
+    from src.database.session_sweeper import get_session_sweeper
+    from src.database.settings_cache import get_settings_cache
+    from src.utils.resource_sampler import get_resource_sampler
+
+    get_session_sweeper()
+    get_settings_cache()
+    get_rollup_job()
+    get_resource_sampler()
+
+
+def _run(region: str):
+    from src.auth.cognito_client import get_cognito_client
+
+    steps = [
+        ('cognito_client', lambda: get_cognito_client(region)),
+        ('background_jobs', _start_background_jobs),
+    ]
+    steps += [(f'import.{name}', lambda name=name: importlib.import_module(name)) for name in DEFERRED_MODULES]
+
+    for name, step in steps:
+        try:
+            with timed(f'startup.{name}'):
+                step()
+        except Exception:
+            logger.exception("시작 준비 작업 실패: %s", name)
+
+
+def start_warm_up(region: str) -> bool:
+    """무거운 싱글턴과 로그인 이후 모듈을 백그라운드 스레드에서 미리 준비 (프로세스당 한 번)
+
+    첫 로그인 화면은 이 작업을 기다리지 않고, 로그인 후 첫 대시보드는 준비된 상태에서 시작합니다.
+    이미 시작했으면 False를 반환합니다.
+    """
+    global _started
+
+    with _started_lock:
+        if _started:
+            return False
+        _started = True
+
+    threading.Thread(target=_run, args=(region,), name="warm-up", daemon=True).start()
+    return True
@@ -0,0 +1,60 @@
+import pytest
+
+from src.auth.rate_limiter import BucketPolicy, InMemoryRateLimitBackend, TokenBucket
+
+
+def test_token_bucket_starts_full_and_blocks_when_empty():
+    bucket = TokenBucket(BucketPolicy(capacity=3, refill_rate=1.0), now=0.0)
+
+    assert [bucket.consume(now=0.0)[0] for _ in range(3)] == [True, True, True]
+
+    allowed, retry_after = bucket.consume(now=0.0)
+    assert not allowed
+    assert retry_after == pytest.approx(1.0)
+
+
+def test_token_bucket_refills_over_time_up_to_capacity():
+    bucket = TokenBucket(BucketPolicy(capacity=2, refill_rate=0.5), now=0.0)
+    bucket.consume(2, now=0.0)
+
+    assert bucket.refill(now=1.0) == pytest.approx(0.5)
+    assert bucket.consume(now=1.0) == (False, pytest.approx(1.0))
+    assert bucket.consume(now=2.0) == (True, 0.0)
+
+    # 오래 쉬어도 capacity 이상 쌓이지 않음
+    assert bucket.refill(now=100.0) == pytest.approx(2.0)
+
+
+def test_token_bucket_ignores_clock_going_backwards():
+    bucket = TokenBucket(BucketPolicy(capacity=1, refill_rate=1.0), now=10.0)
+    bucket.consume(now=10.0)
+
+    assert bucket.refill(now=5.0) == pytest.approx(0.0)
+
+
+def test_consume_all_does_not_consume_when_any_bucket_is_empty():
+    backend = InMemoryRateLimitBackend()
+    loose = BucketPolicy(capacity=10, refill_rate=0.001)
+    strict = BucketPolicy(capacity=1, refill_rate=0.001)
+
+    assert backend.consume_all([('ip', loose), ('user', strict)]) == (True, 0.0, None)
+
+    allowed, retry_after, index = backend.consume_all([('ip', loose), ('user', strict)])
+    assert not allowed
+    assert index == 1
+    assert retry_after > 0
+
+    # 차단된 요청은 앞 버킷의 토큰도 쓰지 않음
+    assert backend._buckets['ip'].tokens == pytest.approx(9.0, abs=0.01)
+
+
+def test_in_memory_backend_evicts_least_recently_used_keys():
+    backend = InMemoryRateLimitBackend(max_keys=2)
+    policy = BucketPolicy(capacity=1, refill_rate=0.001)
+
+    backend.consume('a', policy)
+    backend.consume('b', policy)
+    backend.consume('a', policy)
+    backend.consume('c', policy)
+
+    assert list(backend._buckets) == ['a', 'c']
@@ -0,0 +1,135 @@
+import time
+from datetime import datetime, timedelta
+
+from src.database.event_logger import EventLogger
+from src.database.timeseries import BUCKET_SIZES, choose_bucket
+
+
+def test_choose_bucket_picks_smallest_size_within_budget():
+    start = datetime(2026, 1, 1)
+
+    assert choose_bucket(start, start + timedelta(hours=1)) == (timedelta(minutes=1), 'minute')
+    assert choose_bucket(start, start + timedelta(days=30)) == (timedelta(minutes=15), None)
+    assert choose_bucket(start, start + timedelta(days=30), max_buckets=200) == (timedelta(hours=6), None)
+
+
+def test_choose_bucket_date_trunc_only_skips_sizes_without_unit():
+    start = datetime(2026, 1, 1)
+
+    assert choose_bucket(start, start + timedelta(days=30), date_trunc_only=True) == (timedelta(hours=1), 'hour')
+
+
+def test_choose_bucket_falls_back_to_largest_size():
+    start = datetime(2000, 1, 1)
+
+    assert choose_bucket(start, start + timedelta(days=365 * 100), max_buckets=10) == BUCKET_SIZES[-1]
+
+
+# ---------------------------
+# 이벤트 로거 (write-behind)
+# ---------------------------
+class _RecordingSession:
+    """실행된 (INSERT/UPDATE, 테이블, 행 수)를 기록하는 가짜 세션"""
+
+    def __init__(self, executed):
+        self.executed = executed
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def execute(self, statement, rows):
+        self.executed.append(('insert' if statement.is_insert else 'update', statement.table.name, len(rows)))
+
+    def commit(self):
+        pass
+
+
+def _recording_logger(**kwargs):
+    batches = []
+
+    def session_factory():
+        batch = []
+        batches.append(batch)
+        return _RecordingSession(batch)
+
+    return EventLogger(session_factory, **kwargs), batches
+
+
+def _wait_until(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "시간 내에 조건을 만족하지 않음"
+        time.sleep(0.01)
+
+
+def test_event_logger_flushes_full_batch_before_interval():
+    event_logger, batches = _recording_logger(batch_size=3, flush_interval=60.0)
+    event_logger.start()
+    try:
+        for index in range(3):
+            event_logger.log_activity('s', 'u', 'page_view', page_path=f'p{index}')
+
+        _wait_until(lambda: event_logger.get_stats()['batches'] == 1)
+        assert batches == [[('insert', 'user_activities', 3)]]
+    finally:
+        event_logger.shutdown()
+
+
+def test_event_logger_flushes_partial_batch_after_interval():
+    event_logger, batches = _recording_logger(batch_size=100, flush_interval=0.05)
+    event_logger.start()
+    try:
+        event_logger.log_activity('s', 'u', 'page_view')
+
+        _wait_until(lambda: event_logger.get_stats()['written'] == 1)
+        assert batches == [[('insert', 'user_activities', 1)]]
+    finally:
+        event_logger.shutdown()
+
+
+def test_event_logger_drops_and_counts_events_when_queue_is_full():
+    # 스레드를 시작하지 않아 큐가 비워지지 않음
+    event_logger, _ = _recording_logger(max_queue_size=2)
+
+    assert event_logger.log_login('u', 'user') is not None
+    event_logger.log_activity('s', 'u', 'page_view')
+    assert event_logger.log_login('u', 'user') is None
+    event_logger.log_activity('s', 'u', 'page_view')
+
+    assert event_logger.get_stats()['dropped'] == 2
+    assert event_logger.get_stats()['queued'] == 2
+
+
+def test_event_logger_drains_queue_on_shutdown():
+    event_logger, batches = _recording_logger(batch_size=1000, flush_interval=60.0)
+    event_logger.start()
+    for _ in range(5):
+        event_logger.log_activity('s', 'u', 'page_view')
+
+    event_logger.shutdown()
+
+    stats = event_logger.get_stats()
+    assert stats['written'] == 5 and stats['queued'] == 0
+    assert sum(count for batch in batches for _, _, count in batch) == 5
+
+
+def test_event_logger_inserts_login_before_its_logout_update():
+    event_logger, batches = _recording_logger(batch_size=1000, flush_interval=60.0)
+    event_logger.start()
+    login_key = event_logger.log_login('u', 'user', ip_address='203.0.113.7')
+    event_logger.log_logout(login_key)
+
+    event_logger.shutdown()
+
+    assert batches == [[('insert', 'login_history', 1), ('update', 'login_history', 1)]]
+
+
+def test_event_logger_is_disabled_without_session_factory():
+    event_logger = EventLogger(None)
+    event_logger.start()
+
+    assert event_logger.log_login('u', 'user') is None
+    assert event_logger.get_stats()['queued'] == 0
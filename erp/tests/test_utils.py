@@ -0,0 +1,263 @@
+import time
+
+import numpy as np
+import pytest
+
+from src.utils.downsampling import lttb_indices
+from src.utils.geoip import GeoIPIndex, build_geoip_index, read_range_csv
+from src.utils.shared_cache import SharedCache
+from src.utils.tracing import InMemoryExporter, Span, Tracer, _Trace
+from src.utils.user_agent import classify_user_agent
+
+
+# ---------------------------
+# LTTB 다운샘플링
+# ---------------------------
+def test_lttb_keeps_endpoints_and_threshold_points():
+    x = np.arange(1000)
+    y = np.sin(x / 50.0)
+
+    indices = lttb_indices(x, y, 100)
+
+    assert len(indices) == 100
+    assert indices[0] == 0 and indices[-1] == 999
+    assert np.all(np.diff(indices) > 0)
+
+
+def test_lttb_keeps_spike():
+    y = np.zeros(1000)
+    y[537] = 100.0
+
+    assert 537 in lttb_indices(np.arange(1000), y, 50)
+
+
+def test_lttb_returns_all_points_when_threshold_not_smaller():
+    assert list(lttb_indices([0, 1, 2], [1, 2, 3], 10)) == [0, 1, 2]
+    assert list(lttb_indices([0, 1, 2, 3], [1, 2, 3, 4], 2)) == [0, 1, 2, 3]
+
+
+# ---------------------------
+# User-Agent 분류
+# ---------------------------
+@pytest.mark.parametrize('user_agent, expected', [
+    ('Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) '
+     'Chrome/124.0.0.0 Safari/537.36',
+     {'browser': 'Chrome', 'os': 'Windows', 'device_type': 'desktop'}),
+    ('Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) '
+     'Chrome/124.0.0.0 Safari/537.36 Edg/124.0.2478.80',
+     {'browser': 'Edge', 'os': 'Windows', 'device_type': 'desktop'}),
+    ('Mozilla/5.0 (iPhone; CPU iPhone OS 17_4 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) '
+     'Version/17.4 Mobile/15E148 Safari/604.1',
+     {'browser': 'Safari', 'os': 'iOS', 'device_type': 'mobile'}),
+    ('Mozilla/5.0 (Linux; Android 14; SM-X710) AppleWebKit/537.36 (KHTML, like Gecko) '
+     'SamsungBrowser/24.0 Chrome/117.0.0.0 Safari/537.36',
+     {'browser': 'Samsung Internet', 'os': 'Android', 'device_type': 'tablet'}),
+    ('Mozilla/5.0 (Linux; Android 14; SM-S918N) AppleWebKit/537.36 (KHTML, like Gecko) '
+     'Chrome/124.0.0.0 Mobile Safari/537.36 KAKAOTALK 10.6.5',
+     {'browser': 'KakaoTalk', 'os': 'Android', 'device_type': 'mobile'}),
+    ('Mozilla/5.0 (compatible; Googlebot/2.1; +http://www.google.com/bot.html)',
+     {'browser': 'Other', 'os': 'Other', 'device_type': 'bot'}),
+    ('', {'browser': None, 'os': None, 'device_type': None}),
+    (None, {'browser': None, 'os': None, 'device_type': None}),
+])
+def test_classify_user_agent(user_agent, expected):
+    assert classify_user_agent(user_agent) == expected
+
+
+# ---------------------------
+# GeoIP 인덱스
+# ---------------------------
+@pytest.fixture
+def geoip_index(tmp_path):
+    source = tmp_path / 'ranges.csv'
+    source.write_text(
+        'ip_start,ip_end,country,city\n'
+        '1.0.0.0,1.0.0.255,AU,Sydney\n'
+        '211.234.0.0,211.234.255.255,KR,Seoul\n'
+        '2001:db8::,2001:db8::ffff,KR,Busan\n',
+        encoding='utf-8',
+    )
+    output = str(tmp_path / 'geoip.idx')
+    assert build_geoip_index(read_range_csv(str(source), country_column=2, city_column=3), output) == 3
+
+    index = GeoIPIndex(output)
+    yield index
+    index.close()
+
+
+def test_geoip_lookup(geoip_index):
+    assert geoip_index.lookup('211.234.10.20') == ('KR', 'Seoul')
+    assert geoip_index.lookup('1.0.0.255') == ('AU', 'Sydney')
+    assert geoip_index.lookup('2001:db8::1') == ('KR', 'Busan')
+
+
+def test_geoip_lookup_misses(geoip_index):
+    assert geoip_index.lookup('1.0.1.0') is None
+    assert geoip_index.lookup('0.0.0.1') is None
+    assert geoip_index.lookup('not-an-ip') is None
+
+
+def test_read_range_csv_accepts_ip2location_integers(tmp_path):
+    source = tmp_path / 'ip2location.csv'
+    source.write_text('"16777216","16777471","AU","Australia"\n', encoding='utf-8')
+
+    assert list(read_range_csv(str(source))) == [('1.0.0.0', '1.0.0.255', 'AU', None)]
+
+
+def test_read_range_csv_fails_without_rows(tmp_path):
+    source = tmp_path / 'empty.csv'
+    source.write_text('ip_start,ip_end,country\n', encoding='utf-8')
+
+    with pytest.raises(ValueError):
+        list(read_range_csv(str(source)))
+
+
+# ---------------------------
+# 공유 결과 캐시
+# ---------------------------
+def test_shared_cache_returns_cached_value_until_ttl():
+    cache = SharedCache()
+    calls = []
+
+    def loader():
+        calls.append(1)
+        return len(calls)
+
+    assert cache.get_or_compute('key', loader, ttl=60) == 1
+    assert cache.get_or_compute('key', loader, ttl=60) == 1
+    assert len(calls) == 1
+
+    cache.invalidate('key')
+    assert cache.get_or_compute('key', loader, ttl=60) == 2
+
+
+def test_shared_cache_serves_stale_value_while_refreshing():
+    cache = SharedCache()
+    values = iter(['old', 'new'])
+
+    assert cache.get_or_compute('key', lambda: next(values), ttl=0.01, stale_ttl=60) == 'old'
+    time.sleep(0.02)
+
+    # 만료 직후에는 이전 값을 돌려주고 백그라운드에서 다시 계산
+    assert cache.get_or_compute('key', lambda: next(values), ttl=60, stale_ttl=60) == 'old'
+    cache._refresh_pool.shutdown(wait=True)
+    assert cache.get_or_compute('key', lambda: 'unused', ttl=60) == 'new'
+
+
+def test_shared_cache_does_not_cache_errors():
+    cache = SharedCache()
+
+    def failing_loader():
+        raise RuntimeError('db down')
+
+    with pytest.raises(RuntimeError):
+        cache.get_or_compute('key', failing_loader, ttl=60)
+    assert cache.get_or_compute('key', lambda: 'ok', ttl=60) == 'ok'
+
+
+def test_shared_cache_shares_values_through_redis():
+    fakeredis = pytest.importorskip('fakeredis')
+    client = fakeredis.FakeRedis()
+    first, second = SharedCache(redis_client=client), SharedCache(redis_client=client)
+    value = {'total': 3, 'updated_at': None, 'range': (1, 2)}
+
+    assert first.get_or_compute('summary', lambda: value, ttl=60) == value
+    assert second.get_or_compute('summary', lambda: pytest.fail('다른 인스턴스 값을 써야 함'), ttl=60) == value
+
+
+def test_shared_cache_does_not_wait_long_for_another_instance():
+    fakeredis = pytest.importorskip('fakeredis')
+    client = fakeredis.FakeRedis()
+    cache = SharedCache(redis_client=client, lock_wait=0.2)
+    # 다른 인스턴스가 계산 중인 상태
+    client.set('shared_cache:key:lock', b'1')
+
+    started = time.monotonic()
+    assert cache.get_or_compute('key', lambda: 'local', ttl=60) == 'local'
+    assert time.monotonic() - started < 1.0
+
+
+def test_shared_cache_keeps_stale_value_while_another_instance_refreshes():
+    fakeredis = pytest.importorskip('fakeredis')
+    client = fakeredis.FakeRedis()
+    cache = SharedCache(redis_client=client, lock_wait=5.0)
+    calls = []
+
+    def loader():
+        calls.append(1)
+        return 'new'
+
+    assert cache.get_or_compute('key', lambda: 'old', ttl=0.01, stale_ttl=60) == 'old'
+    client.delete('shared_cache:key')
+    client.set('shared_cache:key:lock', b'1')
+    time.sleep(0.02)
+
+    assert cache.get_or_compute('key', loader, ttl=60, stale_ttl=60) == 'old'
+    started = time.monotonic()
+    cache._refresh_pool.shutdown(wait=True)
+
+    # 백그라운드 갱신도 다른 인스턴스를 기다리거나 다시 계산하지 않음
+    assert time.monotonic() - started < 1.0
+    assert calls == []
+
+
+# ---------------------------
+# 추적기
+# ---------------------------
+def _span(name, parent_id=None, duration_ms=0.0):
+    return Span(trace_id='t', span_id=name, parent_id=parent_id, name=name, start_time=0.0, duration_ms=duration_ms)
+
+
+def _finish(tracer, sampled, root_ms, dropped=0):
+    current = _Trace('t', sampled, max_spans=10)
+    current.spans = [_span('child', parent_id='root'), _span('root', duration_ms=root_ms)]
+    current.dropped = dropped
+    tracer._finish(current)
+    return tracer.exporter.traces()
+
+
+def test_tracer_finish_exports_sampled_trace():
+    tracer = Tracer(InMemoryExporter(), sample_rate=1.0, slow_ms=None)
+
+    traces = _finish(tracer, sampled=True, root_ms=5.0, dropped=2)
+
+    assert len(traces) == 1
+    root = next(span for span in traces[0] if span['parent_id'] is None)
+    assert root['attributes'] == {'sampled': True, 'dropped_spans': 2}
+
+
+def test_tracer_finish_exports_slow_unsampled_trace():
+    tracer = Tracer(InMemoryExporter(), sample_rate=0.0, slow_ms=100.0)
+
+    assert _finish(tracer, sampled=False, root_ms=50.0) == []
+    traces = _finish(tracer, sampled=False, root_ms=150.0)
+    assert len(traces) == 1
+    assert traces[0][-1]['attributes']['sampled'] is False
+
+
+def test_tracer_finish_survives_exporter_errors():
+    class FailingExporter(InMemoryExporter):
+        def export(self, spans):
+            raise OSError('disk full')
+
+    tracer = Tracer(FailingExporter(), sample_rate=1.0)
+
+    assert _finish(tracer, sampled=True, root_ms=1.0) == []
+
+
+def test_tracer_records_nested_spans():
+    tracer = Tracer(InMemoryExporter(), sample_rate=1.0)
+
+    with tracer.span('outside') as span:
+        assert span is None
+
+    with tracer.trace('rerun'):
+        with tracer.span('page'):
+            with tracer.span('query'):
+                pass
+
+    spans = {span['name']: span for span in tracer.exporter.traces()[-1]}
+    assert spans['rerun']['parent_id'] is None
+    assert spans['page']['parent_id'] == spans['rerun']['span_id']
+    assert spans['query']['parent_id'] == spans['page']['span_id']
+    assert not tracer.is_tracing()